@@ -6,12 +6,18 @@ and safe method calling with audit logging.
 
 import logging
 import os
+import time
 import yaml
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from pydantic import BaseModel, Field
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 # Whitelisted method prefixes for safety
@@ -113,8 +119,8 @@ class ActionsRegistry:
         """Load actions registry from YAML file."""
         try:
             if self.registry_file and os.path.exists(self.registry_file):
-                with open(self.registry_file, 'r') as f:
-                    registry_data = yaml.safe_load(f)
+                with open(self.registry_file, 'rb') as f:
+                    registry_data = yaml.load(f, Loader=_YamlLoader)
                     self._parse_registry(registry_data)
                     logger.info(f"Actions registry loaded from {self.registry_file}")
             else:
@@ -153,16 +159,25 @@ class ActionsRegistry:
 class ActionDiscoverer:
     """Discovers available actions on Odoo records using heuristics."""
 
-    def __init__(self, connection_pool, actions_registry: ActionsRegistry):
+    def __init__(self, connection_pool, actions_registry: ActionsRegistry, models_cache_ttl: float = 300):
         """
         Initialize the action discoverer.
         
         Args:
             connection_pool: Odoo connection pool
             actions_registry: ActionsRegistry instance
+            models_cache_ttl: Seconds a model confirmed in ir.model is trusted without a new lookup
         """
         self.pool = connection_pool
         self.registry = actions_registry
+        # Models confirmed to exist in ir.model, with the monotonic time of the lookup;
+        # the registry only changes on module (un)install
+        self._known_models: Dict[str, float] = {}
+        self._models_cache_ttl = models_cache_ttl
+
+    def invalidate_models(self) -> None:
+        """Forget the known models, e.g. after installing or uninstalling modules."""
+        self._known_models.clear()
 
     async def discover_actions(self, model: str, record_id: int, user_id: int) -> List[ActionInfo]:
         """
@@ -227,15 +242,19 @@ class ActionDiscoverer:
         try:
             # Get model methods (this is a simplified approach)
             # In a real implementation, you'd need to inspect the model class
-            model_info = await self.pool.execute_kw(
-                model="ir.model",
-                method="search_read",
-                args=[[("model", "=", model)]],
-                kwargs={"fields": ["name"]}
-            )
-            
-            if not model_info:
-                return actions
+            checked_at = self._known_models.get(model)
+            if checked_at is None or time.monotonic() - checked_at >= self._models_cache_ttl:
+                model_info = await self.pool.execute_kw(
+                    model="ir.model",
+                    method="search_read",
+                    args=[[("model", "=", model)]],
+                    kwargs={"fields": ["name"]}
+                )
+
+                if not model_info:
+                    self._known_models.pop(model, None)
+                    return actions
+                self._known_models[model] = time.monotonic()
             
             # For heuristic discovery, we'll use common patterns
             # In a real implementation, you'd inspect the actual model methods
@@ -5,6 +5,7 @@ This module provides authentication functionality for Odoo API connections.
 
 import logging
 import asyncio
+import uuid
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
@@ -150,7 +151,8 @@ class Authenticator:
                 raise AuthError("Invalid credentials")
 
             # Create session
-            session_id = f"{db}_{username}_{datetime.now().timestamp()}"
+            # Random IDs: timestamp-based ones collide for bursts of logins by the same user
+            session_id = uuid.uuid4().hex
             session = {
                 "id": session_id,
                 "uid": uid,
@@ -158,6 +160,8 @@ class Authenticator:
                 "database": db,
                 "created_at": datetime.now(),
                 "last_activity": datetime.now(),
+                # Set on the first validation; only sessions in use are refreshed
+                "used": False,
             }
             self._sessions[session_id] = session
 
@@ -181,6 +185,10 @@ class Authenticator:
 
                 # Check if refresh is needed
                 if datetime.now() - session["created_at"] > self.session_timeout - self.refresh_threshold:
+                    if not session.get("used"):
+                        # Unused since login: let it expire instead of logging in again forever
+                        logger.debug("Session %s unused since login, not refreshing it", session_id)
+                        break
                     # Re-authenticate
                     new_session_id, new_session = await self.authenticate(
                         username=session["username"],
@@ -222,6 +230,7 @@ class Authenticator:
 
         # Update last activity
         session["last_activity"] = datetime.now()
+        session["used"] = True
         return session
 
     async def logout(self, session_id: str):
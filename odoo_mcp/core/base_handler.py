@@ -7,7 +7,6 @@ import asyncio
 import logging
 import ssl
 from abc import ABC, abstractmethod
-from functools import wraps
 from typing import Any, Dict, List, Optional, Union
 
 from odoo_mcp.error_handling.exceptions import (
@@ -16,28 +15,11 @@ from odoo_mcp.error_handling.exceptions import (
     NetworkError,
     OdooMCPError,
 )
-from odoo_mcp.performance.caching import CACHE_TYPE, get_cache_manager, initialize_cache_manager
+from odoo_mcp.performance.caching import get_cache_manager, initialize_cache_manager
 
 logger = logging.getLogger(__name__)
 
 
-def safe_cache_decorator(func):
-    """Safe wrapper for cache decorator that handles None cache_manager."""
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        try:
-            cache_manager = get_cache_manager()
-            if cache_manager and CACHE_TYPE == "cachetools":
-                cache_decorator = cache_manager.get_ttl_cache_decorator(
-                    cache_instance=cache_manager.odoo_read_cache
-                )
-                return await cache_decorator(func)(*args, **kwargs)
-        except ConfigurationError:
-            logger.warning("Cache manager not initialized, executing without cache")
-        return await func(*args, **kwargs)
-    return wrapper
-
-
 class BaseOdooHandler(ABC):
     """
     Base class for Odoo communication handlers.
@@ -67,6 +67,8 @@ class CapabilitiesManager:
             config: Configuration dictionary
         """
         self.config = config
+        # Bumped on every registration or feature change so callers can cache derived payloads
+        self.revision = 0
         self.resources: Dict[str, ResourceTemplate] = {}
         self.tools: Dict[str, Tool] = {}
         self.prompts: Dict[str, Prompt] = {}
@@ -577,6 +579,7 @@ class CapabilitiesManager:
             resource: Resource template to register
         """
         self.resources[resource.name] = resource
+        self.revision += 1
         logger.info(f"Registered resource: {resource.name}")
 
     def register_tool(self, tool: Tool) -> None:
@@ -587,6 +590,7 @@ class CapabilitiesManager:
             tool: Tool to register
         """
         self.tools[tool.name] = tool
+        self.revision += 1
         logger.info(f"Registered tool: {tool.name}")
 
     def register_prompt(self, prompt: Prompt) -> None:
@@ -597,6 +601,7 @@ class CapabilitiesManager:
             prompt: Prompt to register
         """
         self.prompts[prompt.name] = prompt
+        self.revision += 1
         logger.info(f"Registered prompt: {prompt.name}")
 
     def get_resource(self, name: str) -> Optional[ResourceTemplate]:
@@ -757,6 +762,7 @@ class CapabilitiesManager:
             feature: Feature name
         """
         self.feature_flags[feature] = True
+        self.revision += 1
         logger.info(f"Enabled feature: {feature}")
 
     def disable_feature(self, feature: str) -> None:
@@ -767,6 +773,7 @@ class CapabilitiesManager:
             feature: Feature name
         """
         self.feature_flags[feature] = False
+        self.revision += 1
         logger.info(f"Disabled feature: {feature}")
 
     def get_capabilities(self) -> Dict[str, Any]:
@@ -0,0 +1,318 @@
+"""
+Configuration loading for the Odoo MCP Server.
+This module reads YAML/JSON configuration files and caches the parsed result per path.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import yaml
+
+from odoo_mcp.error_handling.exceptions import ConfigurationError
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Name of the active YAML loader; "SafeLoader" means libyaml is unavailable
+YAML_LOADER_NAME = _YamlLoader.__name__
+
+logger = logging.getLogger(__name__)
+
+# Parsed configurations keyed by path: (st_mtime_ns, st_size, content_digest or None, frozen_config)
+_CONFIG_CACHE: "OrderedDict[str, Tuple[int, int, Optional[str], Mapping[str, Any]]]" = OrderedDict()
+_CONFIG_CACHE_MAX_SIZE = 100
+
+# JSON copy of a parsed YAML file, written next to it to skip YAML parsing on warm starts
+_SIDECAR_SUFFIX = ".cache.json"
+# Bump when the sidecar layout changes so stale sidecars are ignored
+_SIDECAR_VERSION = 2
+
+
+def _freeze(obj: Any) -> Any:
+    """
+    Convert a parsed configuration tree into a read-only one.
+
+    Mappings become ``MappingProxyType`` and lists become tuples, so the
+    cached tree cannot be mutated through a reference that leaks out.
+    Already frozen values are returned unchanged.
+
+    Args:
+        obj: The parsed value
+
+    Returns:
+        Any: The read-only value
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _thaw(obj: Any) -> Any:
+    """
+    Build a mutable copy of a frozen configuration tree.
+
+    Only the containers are rebuilt and scalars are shared, which is several
+    times cheaper than a deep copy that memoizes and dispatches on every node.
+
+    Args:
+        obj: The frozen value
+
+    Returns:
+        Any: A plain dict/list copy of the value
+    """
+    if isinstance(obj, MappingProxyType):
+        return {k: _thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(v) for v in obj]
+    return obj
+
+
+def _parse_config_bytes(config_path: str, data: bytes) -> Dict[str, Any]:
+    """
+    Parse the contents of a configuration file.
+
+    Args:
+        config_path: Path the contents were read from (selects the parser)
+        data: The raw file contents
+
+    Returns:
+        Dict[str, Any]: The parsed configuration
+
+    Raises:
+        ConfigurationError: If the file does not contain a mapping
+    """
+    # Raw bytes: both parsers detect the encoding themselves, and LibYAML reads them without a decode pass
+    if config_path.endswith(".json"):
+        # JSON is a YAML subset, but the C json decoder is far cheaper than a YAML parser
+        config = json.loads(data)
+    else:
+        config = yaml.load(data, Loader=_YamlLoader)
+    if config is None:
+        return {}
+    if not isinstance(config, dict):
+        raise ConfigurationError(f"Configuration file {config_path} must contain a mapping")
+    return config
+
+
+def _parse_config_file(config_path: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Read and parse a configuration file from disk.
+
+    The file is read once; the digest is taken from the same bytes that are
+    parsed, so it always describes the cached configuration.
+
+    Args:
+        config_path: Path to the YAML (or JSON) configuration file
+
+    Returns:
+        Tuple[Dict[str, Any], str]: The parsed configuration and the SHA-256 digest of its contents
+
+    Raises:
+        OSError: If the file cannot be read
+        ConfigurationError: If the file does not contain a mapping
+    """
+    with open(config_path, "rb") as f:
+        data = f.read()
+    return _parse_config_bytes(config_path, data), hashlib.sha256(data).hexdigest()
+
+
+def _sidecar_paths(config_path: str) -> Tuple[str, str]:
+    """
+    Return the candidate sidecar locations of a configuration file.
+
+    The sidecar lives next to the configuration file when possible; a per-user
+    cache file (under ``$XDG_CACHE_HOME`` or ``~/.cache``) is the fallback for
+    read-only configuration directories.
+
+    Args:
+        config_path: Absolute path to the YAML configuration file
+
+    Returns:
+        Tuple[str, str]: The local and the per-user sidecar paths
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    name = hashlib.sha256(config_path.encode("utf-8")).hexdigest()[:32]
+    return config_path + _SIDECAR_SUFFIX, os.path.join(cache_home, "odoo_mcp", name + _SIDECAR_SUFFIX)
+
+
+def _read_sidecar(config_path: str, config_stat: os.stat_result) -> Optional[Dict[str, Any]]:
+    """
+    Read the JSON sidecar of a configuration file if it is still fresh.
+
+    A sidecar is fresh when it was written from a file with the same size and
+    modification time (in nanoseconds) as the current one; comparing against
+    the sidecar's own mtime would serve a stale copy after a restore that
+    moves the file's mtime backwards.
+
+    Args:
+        config_path: Path to the YAML configuration file
+        config_stat: Stat result of the YAML configuration file
+
+    Returns:
+        Optional[Dict[str, Any]]: The cached configuration, or None if missing or stale
+    """
+    source = {"size": config_stat.st_size, "mtime_ns": config_stat.st_mtime_ns}
+    for sidecar_path in _sidecar_paths(config_path):
+        try:
+            with open(sidecar_path, "rb") as f:
+                sidecar = json.load(f)
+        except FileNotFoundError:
+            continue
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable config sidecar %s: %s", sidecar_path, e)
+            continue
+        if not isinstance(sidecar, dict) or sidecar.get("version") != _SIDECAR_VERSION:
+            logger.debug("Ignoring config sidecar %s with an unknown layout", sidecar_path)
+            continue
+        if sidecar.get("source") != source:
+            logger.debug("Ignoring config sidecar %s written from another version of the file", sidecar_path)
+            continue
+        config = sidecar.get("config")
+        if isinstance(config, dict) and config.get("yaml_cache", True):
+            return config
+    return None
+
+
+def _write_sidecar(config_path: str, config_stat: os.stat_result, config: Dict[str, Any]) -> None:
+    """
+    Atomically write the JSON sidecar of a configuration file.
+
+    Configurations that do not survive a JSON round trip unchanged (dates,
+    non-string keys) are skipped. If the sidecar cannot be written next to
+    the file, the per-user cache location is tried; remaining failures are
+    logged and ignored.
+
+    Args:
+        config_path: Path to the YAML configuration file
+        config_stat: Stat result of the YAML configuration file the configuration was parsed from
+        config: The parsed configuration
+    """
+    source = {"size": config_stat.st_size, "mtime_ns": config_stat.st_mtime_ns}
+    try:
+        payload = json.dumps({"version": _SIDECAR_VERSION, "source": source, "config": config})
+        if json.loads(payload)["config"] != config:
+            logger.debug("Configuration %s is not JSON round-trippable, skipping sidecar", config_path)
+            return
+    except (TypeError, ValueError):
+        logger.debug("Configuration %s is not JSON serializable, skipping sidecar", config_path)
+        return
+
+    for sidecar_path in _sidecar_paths(config_path):
+        tmp_path = None
+        try:
+            sidecar_dir = os.path.dirname(sidecar_path)
+            os.makedirs(sidecar_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=sidecar_dir, prefix=".config-", suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_path = tmp.name
+                tmp.write(payload)
+            os.replace(tmp_path, sidecar_path)
+            return
+        except OSError as e:
+            logger.debug("Could not write config sidecar %s: %s", sidecar_path, e)
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+def _remove_sidecars(config_path: str) -> None:
+    """
+    Delete the sidecars of a configuration file that disabled them.
+
+    Args:
+        config_path: Path to the YAML configuration file
+    """
+    for sidecar_path in _sidecar_paths(config_path):
+        try:
+            os.unlink(sidecar_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug("Could not remove config sidecar %s: %s", sidecar_path, e)
+
+
+def load_odoo_config(config_path: str) -> Dict[str, Any]:
+    """
+    Load the server configuration from a file.
+
+    The parsed file is cached per path and revalidated against the file's
+    modification time and size, so repeated loads skip disk parsing. When the
+    stat changes but the contents hash the same (e.g. after a ``touch`` or a
+    checkout), the cached result is kept as well. The cached tree is stored
+    read-only; callers always receive a private copy and may mutate it freely.
+
+    YAML files additionally get a ``<path>.cache.json`` sidecar (or a per-user
+    cache file when the directory is read-only) that is read instead of the
+    YAML file while the file keeps the size and modification time it was
+    written from. Set ``yaml_cache: false`` in the configuration to disable
+    it; existing sidecars are then removed and never read.
+
+    Args:
+        config_path: Path to the YAML (or JSON) configuration file
+
+    Returns:
+        Dict[str, Any]: The parsed configuration
+
+    Raises:
+        OSError: If the file cannot be read
+        ConfigurationError: If the file does not contain a mapping
+    """
+    key = os.path.abspath(config_path)
+    stat = os.stat(key)
+
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _CONFIG_CACHE.move_to_end(key)
+        logger.debug("Configuration cache hit for %s", key)
+        return _thaw(cached[3])
+
+    digest: Optional[str] = None
+    config = None
+    data = None
+    if cached is not None and cached[1] == stat.st_size and cached[2] is not None:
+        # Same size, new mtime: hashing is much cheaper than parsing again
+        with open(key, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if digest == cached[2]:
+            logger.debug("Configuration %s touched but unchanged", key)
+            config = cached[3]
+
+    use_sidecar = not key.endswith(".json")
+    if config is None and data is None and use_sidecar:
+        # Sidecar hits never read the YAML file, so there is no digest to remember
+        config = _read_sidecar(key, stat)
+    if config is None:
+        logger.debug("Parsing configuration %s with %s", key, YAML_LOADER_NAME)
+        if data is None:
+            config, digest = _parse_config_file(key)
+        else:
+            config = _parse_config_bytes(key, data)
+        if use_sidecar:
+            if config.get("yaml_cache", True):
+                _write_sidecar(key, stat, config)
+            else:
+                _remove_sidecars(key)
+
+    frozen = _freeze(config)
+    _CONFIG_CACHE[key] = (stat.st_mtime_ns, stat.st_size, digest, frozen)
+    _CONFIG_CACHE.move_to_end(key)
+    while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+
+    return _thaw(frozen)
+
+
+def clear_config_cache() -> None:
+    """Clear the parsed configuration cache (for tests and config reloads)."""
+    _CONFIG_CACHE.clear()
@@ -4,6 +4,8 @@ This module provides connection pooling functionality for Odoo API connections.
 """
 
 import asyncio
+import copy
+import hashlib
 import logging
 from collections import deque
 from contextlib import asynccontextmanager
@@ -26,6 +28,24 @@ from odoo_mcp.error_handling.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert call arguments into a hashable key.
+
+    Raises:
+        TypeError: If the value contains unhashable or unorderable parts
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    hash(value)
+    return value
+
+
 # Global connection pool instance
 _connection_pool = None
 
@@ -71,19 +91,22 @@ class ConnectionWrapper:
     Wrapper for a connection that manages its lifecycle and usage state.
     """
 
+    # One wrapper per pooled connection; slots keep the per-checkout state lookups cheap
+    __slots__ = ("connection", "in_use", "last_used")
+
     def __init__(self, connection: BaseOdooHandler):
         self.connection = connection
         self.in_use = False
-        self.last_used = asyncio.get_event_loop().time()
+        self.last_used = asyncio.get_running_loop().time()
 
     async def __aenter__(self):
         self.in_use = True
-        self.last_used = asyncio.get_event_loop().time()
+        self.last_used = asyncio.get_running_loop().time()
         return self.connection
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         self.in_use = False
-        self.last_used = asyncio.get_event_loop().time()
+        self.last_used = asyncio.get_running_loop().time()
 
 
 class ConnectionPool:
@@ -107,7 +130,13 @@ class ConnectionPool:
         self.connections: List[ConnectionWrapper] = []
         self.health_check_interval = config.get("health_check_interval", 300)  # 5 minutes
         self._lock = asyncio.Lock()
+        # Signalled whenever a connection is released or a pool slot frees up
+        self._released = asyncio.Condition(self._lock)
         self._cleanup_task = None
+        # In-flight read calls shared by identical concurrent requests
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        # Bumped when a write starts and ends, so reads issued after a write never join one issued before it
+        self._write_generation = 0
         logger.info(f"Connection pool initialized with max_size={self.max_size}, timeout={self.timeout}")
 
     async def start(self):
@@ -131,6 +160,8 @@ class ConnectionPool:
         """
         Get a connection from the pool as an async context manager.
         Yields the underlying handler (BaseOdooHandler). Connection is released on exit.
+        When the pool is at max size, waits up to ``connection_timeout`` seconds
+        for another caller to release a connection.
 
         Usage:
             async with pool.get_connection() as connection:
@@ -141,30 +172,40 @@ class ConnectionPool:
             NetworkError: If creating a new connection fails
         """
         wrapper = None
+        deadline = None
         async with self._lock:
-            # Try to find an available connection
-            for conn in self.connections:
-                if not conn.in_use:
-                    conn.in_use = True
-                    logger.debug("Reusing existing connection from pool")
-                    wrapper = conn
+            while True:
+                # Try to find an available connection
+                for conn in self.connections:
+                    if not conn.in_use:
+                        conn.in_use = True
+                        logger.debug("Reusing existing connection from pool")
+                        wrapper = conn
+                        break
+
+                if wrapper is None and len(self.connections) < self.max_size:
+                    try:
+                        logger.info("Creating new connection with config: %s", self.config)
+                        handler = self.handler_factory(self.config.get("protocol", "xmlrpc"), self.config)
+                        wrapper = ConnectionWrapper(handler)
+                        self.connections.append(wrapper)
+                        wrapper.in_use = True
+                        logger.info("Created new connection, pool size now %s", len(self.connections))
+                    except Exception as e:
+                        logger.error("Error creating new connection: %s", e)
+                        raise NetworkError(f"Failed to create new connection: {e}") from e
+
+                if wrapper is not None:
                     break
 
-            if wrapper is None and len(self.connections) < self.max_size:
+                now = asyncio.get_running_loop().time()
+                if deadline is None:
+                    logger.debug("Connection pool at max size, waiting for available connection")
+                    deadline = now + self.timeout
                 try:
-                    logger.info("Creating new connection with config: %s", self.config)
-                    handler = self.handler_factory(self.config.get("protocol", "xmlrpc"), self.config)
-                    wrapper = ConnectionWrapper(handler)
-                    self.connections.append(wrapper)
-                    wrapper.in_use = True
-                    logger.info("Created new connection, pool size now %s", len(self.connections))
-                except Exception as e:
-                    logger.error("Error creating new connection: %s", e)
-                    raise NetworkError(f"Failed to create new connection: {e}") from e
-
-            if wrapper is None:
-                logger.warning("Connection pool at max size, waiting for available connection")
-                raise PoolTimeoutError("No connections available in pool")
+                    await asyncio.wait_for(self._released.wait(), max(deadline - now, 0))
+                except asyncio.TimeoutError:
+                    raise PoolTimeoutError(f"No connections available in pool after {self.timeout}s") from None
 
         try:
             yield wrapper.connection
@@ -182,7 +223,8 @@ class ConnectionPool:
             for wrapper in self.connections:
                 if wrapper.connection == connection:
                     wrapper.in_use = False
-                    wrapper.last_used = asyncio.get_event_loop().time()
+                    wrapper.last_used = asyncio.get_running_loop().time()
+                    self._released.notify()
                     break
 
     async def close_all(self):
@@ -194,6 +236,7 @@ class ConnectionPool:
                 except Exception as e:
                     logger.error(f"Error closing connection: {e}")
             self.connections.clear()
+            self._released.notify_all()
 
     async def _health_check_loop(self):
         """Periodically check connection health and cleanup stale connections."""
@@ -201,13 +244,14 @@ class ConnectionPool:
             try:
                 await asyncio.sleep(self.health_check_interval)
                 async with self._lock:
-                    current_time = asyncio.get_event_loop().time()
+                    current_time = asyncio.get_running_loop().time()
                     for wrapper in self.connections[:]:  # Copy list to allow modification during iteration
                         if not wrapper.in_use and (current_time - wrapper.last_used) > self.health_check_interval:
                             try:
                                 if hasattr(wrapper.connection, "close"):
                                     await wrapper.connection.close()
                                 self.connections.remove(wrapper)
+                                self._released.notify()
                                 logger.debug("Removed stale connection from pool")
                             except Exception as e:
                                 logger.error(f"Error during connection cleanup: {e}")
@@ -242,7 +286,47 @@ class ConnectionPool:
 
         Raises:
             NetworkError: If the execution fails
+
+        Identical read calls (see BaseOdooHandler.READ_METHODS) issued while one
+        is already in flight wait for that call instead of making another round
+        trip; each caller, the first one included, receives its own copy of the
+        result. Writes (on any model, since they can have side effects on others)
+        end the sharing of reads already in flight.
         """
+        if method not in BaseOdooHandler.READ_METHODS:
+            self._write_generation += 1
+            try:
+                return await self._execute_kw(model, method, args, kwargs, uid, password)
+            finally:
+                self._write_generation += 1
+
+        # Keyed on a digest of the password: the map is long-lived and shows up in debug dumps
+        secret = hashlib.sha256(password.encode("utf-8")).hexdigest() if password else None
+        try:
+            key = (self._write_generation, model, method, _freeze(args), _freeze(kwargs), uid, secret)
+        except TypeError:
+            return await self._execute_kw(model, method, args, kwargs, uid, password)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.debug("Joining in-flight %s on %s", method, model)
+            return copy.deepcopy(await asyncio.shield(inflight))
+
+        task = asyncio.ensure_future(self._execute_kw(model, method, args, kwargs, uid, password))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _execute_kw(
+        self,
+        model: str,
+        method: str,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        uid: Optional[int] = None,
+        password: Optional[str] = None,
+    ) -> Any:
+        """Execute a method on an Odoo model on a pooled connection, without coalescing."""
         try:
             async with self.get_connection() as connection:
                 return await connection.execute_kw(
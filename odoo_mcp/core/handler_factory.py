@@ -3,12 +3,11 @@ Handler Factory for Odoo Communication Protocols.
 This module provides a factory pattern for creating appropriate handlers.
 """
 
+import importlib
 import logging
 from typing import Dict, Any, Type, Union
 
 from odoo_mcp.core.base_handler import BaseOdooHandler
-from odoo_mcp.core.xmlrpc_handler import XMLRPCHandler
-from odoo_mcp.core.jsonrpc_handler import JSONRPCHandler
 from odoo_mcp.error_handling.exceptions import ConfigurationError
 
 logger = logging.getLogger(__name__)
@@ -22,10 +21,34 @@ class HandlerFactory:
     configuration parameters.
     """
     
-    _handler_registry: Dict[str, Type[BaseOdooHandler]] = {
-        "xmlrpc": XMLRPCHandler,
-        "jsonrpc": JSONRPCHandler,
+    # Built-in handlers are registered as "module:Class" and imported on first use,
+    # so e.g. httpx is only loaded when the JSON-RPC protocol is actually selected
+    _handler_registry: Dict[str, Union[Type[BaseOdooHandler], str]] = {
+        "xmlrpc": "odoo_mcp.core.xmlrpc_handler:XMLRPCHandler",
+        "jsonrpc": "odoo_mcp.core.jsonrpc_handler:JSONRPCHandler",
     }
+
+    @classmethod
+    def get_handler_class(cls, protocol: str) -> Type[BaseOdooHandler]:
+        """
+        Get the handler class for a protocol, importing it if needed.
+
+        Args:
+            protocol: Protocol type ('xmlrpc' or 'jsonrpc')
+
+        Returns:
+            Type[BaseOdooHandler]: The handler class
+
+        Raises:
+            KeyError: If the protocol is not registered
+        """
+        protocol_lower = protocol.lower()
+        handler_class = cls._handler_registry[protocol_lower]
+        if isinstance(handler_class, str):
+            module_name, _, class_name = handler_class.partition(":")
+            handler_class = getattr(importlib.import_module(module_name), class_name)
+            cls._handler_registry[protocol_lower] = handler_class
+        return handler_class
     
     @classmethod
     def create_handler(cls, protocol: str, config: Dict[str, Any]) -> BaseOdooHandler:
@@ -50,7 +73,7 @@ class HandlerFactory:
                 f"Unsupported protocol: {protocol}. Supported protocols: {supported}"
             )
         
-        handler_class = cls._handler_registry[protocol_lower]
+        handler_class = cls.get_handler_class(protocol_lower)
         
         try:
             handler = handler_class(config)
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -7,7 +8,7 @@ from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
-from odoo_mcp.core.base_handler import BaseOdooHandler, safe_cache_decorator
+from odoo_mcp.core.base_handler import BaseOdooHandler
 from odoo_mcp.error_handling.exceptions import (
     AuthError,
     ConfigurationError,
@@ -18,10 +19,32 @@ from odoo_mcp.error_handling.exceptions import (
     OdooValidationError,
     ProtocolError,
 )
-from odoo_mcp.performance.caching import get_cache_manager, CACHE_TYPE
 
 logger = logging.getLogger(__name__)
 
+# Config keys that can be overridden from the environment; later entries win when both are set
+_ENV_CONFIG_KEYS = (
+    ("odoo_url", "ODOO_URL"),
+    ("database", "ODOO_DB"),
+    ("username", "ODOO_USER"),
+    ("username", "ODOO_USERNAME"),
+    ("api_key", "ODOO_PASSWORD"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _env_config_overrides() -> Dict[str, str]:
+    """
+    Read the connection settings set in the environment.
+
+    Resolved once per process, since every pooled connection builds its own
+    handler; call ``_env_config_overrides.cache_clear()`` after changing them.
+
+    Returns:
+        Dict[str, str]: Config keys mapped to their non-empty environment values
+    """
+    return {key: os.environ[var] for key, var in _ENV_CONFIG_KEYS if os.environ.get(var)}
+
 
 class JSONRPCHandler(BaseOdooHandler):
     """
@@ -47,11 +70,7 @@ class JSONRPCHandler(BaseOdooHandler):
             ConfigurationError: If TLS configuration fails.
         """
         # Handle environment variables for URL and database
-        config = config.copy()
-        config["odoo_url"] = os.getenv("ODOO_URL") or config.get("odoo_url")
-        config["database"] = os.getenv("ODOO_DB") or config.get("database")
-        config["username"] = os.getenv("ODOO_USERNAME") or config.get("username")
-        config["api_key"] = os.getenv("ODOO_PASSWORD") or config.get("api_key")
+        config = {**config, **_env_config_overrides()}
         
         super().__init__(config)
         
@@ -66,6 +85,8 @@ class JSONRPCHandler(BaseOdooHandler):
         
         # Initialize authentication
         self.uid = None
+        # Serializes logins so concurrent first calls share a single round trip
+        self._auth_lock = asyncio.Lock()
 
     def _create_http_client(self) -> None:
         """Create and configure the HTTPX client."""
@@ -91,8 +112,12 @@ class JSONRPCHandler(BaseOdooHandler):
 
         # Create the AsyncClient
         request_timeout = int(os.getenv("TIMEOUT", self.config.get("timeout", 30)))
-        self.async_client = httpx.AsyncClient(verify=verify, cert=cert, timeout=request_timeout)
-        logger.info(f"httpx.AsyncClient initialized with timeout={request_timeout}s")
+        # Keep every pooled connection alive (httpx keeps only 20 by default) so bursts of
+        # concurrent calls do not close and reopen TCP/TLS connections to Odoo
+        pool_size = int(self.config.get("http_pool_size", 100))
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self.async_client = httpx.AsyncClient(verify=verify, cert=cert, timeout=request_timeout, limits=limits)
+        logger.info("httpx.AsyncClient initialized with timeout=%ss, pool_size=%s", request_timeout, pool_size)
 
     async def _perform_authentication(self, username: str, password: str, database: str) -> Union[int, bool, None]:
         """Perform authentication using JSON-RPC."""
@@ -166,7 +191,12 @@ class JSONRPCHandler(BaseOdooHandler):
 
     async def ensure_authenticated(self):
         """Ensure we have a valid uid by authenticating if needed."""
-        if self.uid is None:
+        if self.uid is not None:
+            return self.uid
+        async with self._auth_lock:
+            if self.uid is not None:
+                # Another caller logged in while we were waiting
+                return self.uid
             try:
                 logger.info(f"Attempting authentication with database={self.database}, username={self.username}")
                 auth_result = await self.call(
@@ -225,8 +255,6 @@ class JSONRPCHandler(BaseOdooHandler):
         """
         Make a JSON-RPC call to the Odoo instance using httpx.
 
-        Handles caching for potentially cacheable read methods.
-
         Args:
             service: The target service name (e.g., 'object').
             method: The method to call on the service.
@@ -238,32 +266,8 @@ class JSONRPCHandler(BaseOdooHandler):
         Raises:
             AuthError, NetworkError, ProtocolError, OdooMCPError, TypeError.
         """
-        is_cacheable = service == "object" and method in {
-            "read",
-            "search",
-            "search_read",
-            "search_count",
-            "fields_get",
-            "default_get",
-        }
-
-        if is_cacheable:
-            logger.debug(f"Cacheable JSON-RPC method detected: {service}.{method}. Attempting cache lookup.")
-            try:
-                cache_manager = get_cache_manager()
-                hashable_args = self._make_hashable(args)
-            except (ConfigurationError, TypeError) as e:
-                logger.warning(f"Could not use cache for {service}.{method}: {e}. Executing directly.")
-                return await self._call_direct(service, method, args)
-
-            if CACHE_TYPE == "cachetools":
-                return await self._call_cached(service, method, hashable_args)
-            else:
-                logger.debug("Executing non-TTL cached or uncached JSON-RPC read method.")
-                return await self._call_direct(service, method, args)
-        else:
-            logger.debug(f"Executing non-cacheable JSON-RPC method: {service}.{method}")
-            return await self._call_direct(service, method, args)
+        logger.debug("Executing JSON-RPC method: %s.%s", service, method)
+        return await self._call_direct(service, method, args)
 
     def _serialize_resource(self, resource: Any) -> Dict[str, Any]:
         """
@@ -318,21 +322,25 @@ class JSONRPCHandler(BaseOdooHandler):
             # Get headers
             headers = self._get_headers()
 
-            logger.debug(f"Executing JSON-RPC (httpx): service={service}, method={method}")
-            logger.debug(f"JSON-RPC Request URL: {self.jsonrpc_url}")
-            logger.debug(f"JSON-RPC Request Headers: {headers}")
-            logger.debug(f"JSON-RPC Request Payload: {json.dumps(payload, indent=2)}")
+            # Payload dumps are large; only build them when debug logging is on
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Executing JSON-RPC (httpx): service=%s, method=%s", service, method)
+                logger.debug("JSON-RPC Request URL: %s", self.jsonrpc_url)
+                logger.debug("JSON-RPC Request Headers: %s", headers)
+                logger.debug("JSON-RPC Request Payload: %s", json.dumps(payload, indent=2))
 
             response = await self.async_client.post(self.jsonrpc_url, headers=headers, json=payload)
             response.raise_for_status()
             result = response.json()
 
-            logger.debug(f"JSON-RPC Response Status: {response.status_code}")
-            logger.debug(f"JSON-RPC Response Headers: {dict(response.headers)}")
-            try:
-                logger.debug(f"JSON-RPC Response Body: {json.dumps(result, indent=2)}")
-            except (TypeError, ValueError):
-                logger.debug(f"JSON-RPC Response Body: {str(result)}")
+            if debug:
+                logger.debug("JSON-RPC Response Status: %s", response.status_code)
+                logger.debug("JSON-RPC Response Headers: %s", dict(response.headers))
+                try:
+                    logger.debug("JSON-RPC Response Body: %s", json.dumps(result, indent=2))
+                except (TypeError, ValueError):
+                    logger.debug("JSON-RPC Response Body: %s", result)
 
             if result.get("error"):
                 error_data = result["error"]
@@ -423,16 +431,6 @@ class JSONRPCHandler(BaseOdooHandler):
             logger.exception(f"An unexpected error occurred during JSON-RPC call: {e}")
             raise OdooMCPError(f"An unexpected error occurred during JSON-RPC call: {e}", original_exception=e)
 
-    @safe_cache_decorator
-    async def _call_cached(self, service: str, method: str, args: tuple) -> Any:
-        """
-        Wrapper method for cached execution using cachetools.
-        Calls the direct execution method `_call_direct`.
-        """
-        logger.debug(f"Executing CACHED JSON-RPC call wrapper for {service}.{method}")
-        # Pass args as a list as expected by _call_direct
-        return await self._call_direct(service, method, list(args))
-
     async def execute_kw(
         self,
         model: str,
@@ -463,8 +461,9 @@ class JSONRPCHandler(BaseOdooHandler):
         Raises:
             AuthError, NetworkError, ProtocolError, OdooMCPError, TypeError.
         """
-        # Ensure we have a valid uid
-        await self.ensure_authenticated()
+        # Ensure we have a valid uid; checked inline so the logged-in path creates no coroutine
+        if self.uid is None:
+            await self.ensure_authenticated()
 
         # Use stored credentials if not provided
         call_uid = uid if uid is not None else self.uid
@@ -477,7 +476,7 @@ class JSONRPCHandler(BaseOdooHandler):
         context = kwargs.pop("context", {})  # Get context from kwargs or default to empty dict
         if session_id:
             context["session_id"] = session_id
-            logger.debug(f"Added session_id to context for JSON-RPC call {model}.{method}")
+            logger.debug("Added session_id to context for JSON-RPC call %s.%s", model, method)
 
         # Arguments for Odoo's object.execute_kw: db, uid, password, model, method, args[, kwargs]
         odoo_args = [self.database, call_uid, call_password, model, method, args]
@@ -3,22 +3,32 @@ Odoo MCP Server implementation.
 This module implements the MCP server for Odoo integration.
 """
 
+from __future__ import annotations
+
 import argparse
 import ast
+import atexit
 import asyncio
 import base64
+import inspect
 import json
 import logging
+import os
+import re
 import sys
+import threading
+import time
+import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Type, Union
-
-import aiohttp.web as web
-import yaml
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Type, Union
 
 from odoo_mcp.core.authenticator import Authenticator
+from odoo_mcp.core.base_handler import BaseOdooHandler
 from odoo_mcp.core.bus_handler import OdooBusHandler
 from odoo_mcp.core.capabilities_manager import (
     CapabilitiesManager,
@@ -27,7 +37,8 @@ from odoo_mcp.core.capabilities_manager import (
     ResourceType,
     Tool,
 )
-from odoo_mcp.core.connection_pool import ConnectionPool
+from odoo_mcp.core.config_loader import YAML_LOADER_NAME, load_odoo_config
+from odoo_mcp.core.connection_pool import ConnectionPool, _freeze
 from odoo_mcp.core.handler_factory import HandlerFactory
 from odoo_mcp.core.logging_config import setup_logging, setup_logging_from_config
 from odoo_mcp.core.protocol_handler import ProtocolHandler
@@ -39,18 +50,85 @@ from odoo_mcp.error_handling.exceptions import (
     ProtocolError,
 )
 from odoo_mcp.performance.caching import initialize_cache_manager
+from odoo_mcp.performance.event_loop import EVENT_LOOP_NAME
+from odoo_mcp.performance.event_loop import new_event_loop as _new_event_loop
+from odoo_mcp.performance.event_loop import run as _run_event_loop
+from odoo_mcp.performance.serialization import dumps as json_dumps
+from odoo_mcp.performance.serialization import dumps_bytes as json_dumps_bytes
+from odoo_mcp.performance.serialization import loads as json_loads
+from odoo_mcp.performance.serialization import dumps_response_bytes, register_static_payload, static_payload_etag
 from odoo_mcp.security.utils import RateLimiter
 from odoo_mcp.tools.orm_tools import ORMTools
 
+if TYPE_CHECKING:
+    # aiohttp.web is imported where the HTTP transport uses it: it is a large share of
+    # this module's import time and stdio mode never needs it
+    import aiohttp.web as web
+
 # Constants
 SERVER_NAME = "odoo-mcp-server"
 SERVER_VERSION = "2024.2.5"  # Using CalVer: YYYY.MM.DD
 PROTOCOL_VERSION = "2025-03-26"  # Current protocol version
 LEGACY_PROTOCOL_VERSIONS = ["2024-11-05"]  # Supported legacy versions
 
+# Responses up to this size are written with a single header + body buffer
+_HTTP_SINGLE_WRITE_MAX = 64 * 1024
+
+# Shared read-only default for optional mappings that are only looked up, never sent to Odoo
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Resource URIs served by the Odoo record handlers, parsed in a single pass
+_RECORD_URI_RE = re.compile(r"odoo://(?P<model>[^/]+)/(?P<id>[^/]+)")
+_BINARY_URI_RE = re.compile(r"odoo://(?P<model>[^/]+)/binary/(?P<field>[^/]+)/(?P<id>[^/]+)")
+
+# Keyword arguments passed through to Odoo for methods that accept only a known set
+_FIELDS_GET_KWARGS = frozenset({"attributes", "allfields"})
+_SEARCH_KWARGS = frozenset({"offset", "limit", "order", "count"})
+_DEFAULT_GET_KWARGS = frozenset({"context"})
+_READ_GROUP_KWARGS = frozenset({"limit", "offset", "orderby", "lazy"})
+
+# Tools that never modify Odoo data; other calls invalidate the cached resources of their model
+_READ_ONLY_TOOLS = frozenset(
+    {
+        "odoo_search_read",
+        "odoo_read",
+        "odoo.schema.version",
+        "odoo.schema.models",
+        "odoo.schema.fields",
+        "odoo.domain.validate",
+        "odoo.search_read",
+        "odoo.name_search",
+        "odoo.read",
+        "odoo.actions.next_steps",
+        "odoo.picklists",
+    }
+)
+
+# Read-only tools whose results the server may cache. The odoo.* tools go through ORMTools, whose
+# rate limiter and audit log must see every call, so they are always dispatched
+_CACHEABLE_TOOLS = frozenset({"odoo_search_read", "odoo_read", "odoo_call_method", "odoo_execute_kw"})
+
+# Advertised tools without a handler yet; calls get a "not implemented" error instead of "unknown tool"
+_UNIMPLEMENTED_TOOLS = frozenset({"data_export", "data_import", "report_generator"})
+
 logger = logging.getLogger(__name__)
 
 
+def _ok(request_id: Any, result: Any) -> Dict[str, Any]:
+    """Build a JSON-RPC success response."""
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _err(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    """Build a JSON-RPC error response."""
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def _is_notification(request: Any) -> bool:
+    """Return True for a JSON-RPC notification (a request without an id), which is never answered."""
+    return isinstance(request, dict) and "id" not in request
+
+
 def parse_domain(domain_input):
     """
     Parse domain from various input formats.
@@ -161,7 +239,7 @@ class JsonRpcRequest:
 
     @classmethod
     def from_dict(cls, data: dict):
-        return cls(id=data.get("id"), method=data.get("method", ""), params=data.get("params", {}))
+        return cls(id=data.get("id"), method=data.get("method", ""), params=data.get("params") or _EMPTY)
 
 
 class Server(ABC):
@@ -217,6 +295,8 @@ class StdioProtocol:
 
     def __init__(self, request_handler: Callable):
         self.request_handler = request_handler
+        # Decided once instead of inspecting every response
+        self._handler_is_async = inspect.iscoroutinefunction(request_handler)
         self.running = False
 
     async def run(self):
@@ -224,15 +304,20 @@ class StdioProtocol:
         self.running = True
         while self.running:
             try:
-                # Use asyncio.get_event_loop().run_in_executor to read from stdin
-                line = await asyncio.get_event_loop().run_in_executor(None, input)
+                # Use the running loop's run_in_executor to read from stdin
+                line = await asyncio.get_running_loop().run_in_executor(None, input)
                 if not line:
                     continue
 
-                request = json.loads(line)
-                response = self.request_handler(request)
-                print(json.dumps(response))
-                sys.stdout.flush()
+                request = json_loads(line)
+                if self._handler_is_async:
+                    response = await self.request_handler(request)
+                else:
+                    response = self.request_handler(request)
+                # A batch of notifications gets no reply
+                if response is not None:
+                    print(json_dumps(response))
+                    sys.stdout.flush()
             except EOFError:
                 logger.info("Received EOF, shutting down")
                 self.running = False
@@ -254,10 +339,22 @@ class StreamableHTTPProtocol:
 
     def __init__(self, request_handler: Callable, config: Dict[str, Any]):
         self.request_handler = request_handler
+        # Decided once instead of inspecting every response
+        self._handler_is_async = inspect.iscoroutinefunction(request_handler)
+        from aiohttp import web
+
         self.config = config
         self.running = False
         self.app = web.Application()
 
+        # Per-connection SSE message queues (of encoded messages) keyed by session id
+        self._sse_queues: Dict[str, asyncio.Queue] = {}
+        # Last time each session's stream was served; sessions nobody reads expire after sse_session_ttl
+        self._sse_last_seen: Dict[str, float] = {}
+        self._sse_queue_maxsize = config.get("sse_queue_maxsize", 1000)
+        self._sse_heartbeat_seconds = config.get("sse_heartbeat_seconds", 30)
+        self._sse_session_ttl = config.get("sse_session_ttl", 300)
+
         # Configura CORS
         self.app.router.add_post("/mcp", self._handle_request)
         self.app.router.add_get("/sse", self._handle_sse)
@@ -281,58 +378,157 @@ class StreamableHTTPProtocol:
 
     async def _handle_request(self, request: web.Request) -> web.Response:
         """Handle HTTP request."""
+        from aiohttp import web
+
         try:
             # Leggi il corpo della richiesta come bytes
             body = await request.read()
 
             # Prova a decodificare con UTF-8, se fallisce prova con latin-1
             try:
-                data = json.loads(body.decode("utf-8"))
-            except UnicodeDecodeError:
-                data = json.loads(body.decode("latin-1"))
+                data = json_loads(body)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                data = json_loads(body.decode("latin-1"))
 
-            response = self.request_handler(data)
+            if self._handler_is_async:
+                response = await self.request_handler(data)
+            else:
+                response = self.request_handler(data)
+            if response is None:
+                # Notifications only: MCP streamable HTTP acknowledges them with 202 and no body
+                return web.Response(status=202)
 
             # Assicurati che la risposta sia codificata correttamente
-            return web.json_response(response, content_type="application/json; charset=utf-8")
+            return web.Response(body=dumps_response_bytes(response), content_type="application/json", charset="utf-8")
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in request: {e}")
             return web.json_response(
-                {
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32700, "message": "Parse error: Invalid JSON"},
-                    "id": None,
-                },
+                _err(None, -32700, "Parse error: Invalid JSON"),
                 status=400,
+                dumps=json_dumps,
             )
         except Exception as e:
             logger.error(f"Error handling request: {e}")
             return web.json_response(
-                {"jsonrpc": "2.0", "error": {"code": -32603, "message": str(e)}, "id": None},
+                _err(None, -32603, str(e)),
                 status=500,
+                dumps=json_dumps,
             )
 
     async def _handle_sse(self, request: web.Request) -> web.StreamResponse:
         """Handle Server-Sent Events request."""
+        from aiohttp import web
+
+        # Reconnecting clients resume their session, by query parameter or Mcp-Session-Id header
+        session_id = request.query.get("session_id") or request.headers.get("Mcp-Session-Id")
+        if session_id is None:
+            session_id = self.register_sse_session()
+        elif session_id not in self._sse_queues:
+            return web.json_response(
+                _err(None, -32001, "Unknown SSE session"),
+                status=404,
+                dumps=json_dumps,
+            )
+        queue = self._sse_queues[session_id]
+
         response = web.StreamResponse()
         response.headers["Content-Type"] = "text/event-stream"
         response.headers["Cache-Control"] = "no-cache"
         response.headers["Connection"] = "keep-alive"
+        response.headers["Mcp-Session-Id"] = session_id
         await response.prepare(request)
 
         try:
             while self.running:
-                # Send a heartbeat every 30 seconds
-                await response.write(b"event: heartbeat\ndata: {}\n\n")
-                await asyncio.sleep(30)
+                self._sse_last_seen[session_id] = time.monotonic()
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=self._sse_heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    await response.write(b"event: heartbeat\ndata: {}\n\n")
+                    continue
+                # Flush everything already queued in one write instead of one per message
+                frames = [b"event: message\ndata: " + message + b"\n\n"]
+                while not queue.empty():
+                    frames.append(b"event: message\ndata: " + queue.get_nowait() + b"\n\n")
+                await response.write(b"".join(frames))
+        except ConnectionResetError:
+            logger.debug("SSE client disconnected: %s", session_id)
         except Exception as e:
             logger.error(f"Error in SSE handler: {e}")
         finally:
-            await response.write_eof()
+            # Keep the session and its undelivered messages for a reconnect; sse_session_ttl expires it
+            if session_id in self._sse_last_seen:
+                self._sse_last_seen[session_id] = time.monotonic()
+            try:
+                await response.write_eof()
+            except Exception:
+                pass
         return response
 
+    def register_sse_session(self, session_id: Optional[str] = None) -> str:
+        """
+        Register an SSE session and create its message queue.
+
+        Args:
+            session_id: The session id to register, or None to generate one
+
+        Returns:
+            str: The registered session id
+        """
+        self._prune_sse_sessions()
+        if session_id is None:
+            session_id = uuid.uuid4().hex
+        if session_id not in self._sse_queues:
+            self._sse_queues[session_id] = asyncio.Queue(maxsize=self._sse_queue_maxsize)
+            self._sse_last_seen[session_id] = time.monotonic()
+        return session_id
+
+    def _prune_sse_sessions(self) -> None:
+        """Drop sessions whose stream has not been served for ``sse_session_ttl`` seconds."""
+        deadline = time.monotonic() - self._sse_session_ttl
+        for session_id in [sid for sid, last_seen in self._sse_last_seen.items() if last_seen < deadline]:
+            logger.debug("Expiring idle SSE session %s", session_id)
+            self.unregister_sse_session(session_id)
+
+    def unregister_sse_session(self, session_id: str) -> None:
+        """
+        Remove an SSE session and drop any undelivered messages.
+
+        Args:
+            session_id: The session id to remove
+        """
+        self._sse_queues.pop(session_id, None)
+        self._sse_last_seen.pop(session_id, None)
+
+    def publish(self, session_id: str, message: Dict[str, Any]) -> bool:
+        """
+        Queue a message for delivery to a connected SSE client.
+
+        This is the entry point for server-initiated messages; the server does not produce
+        any yet (there is no resources/subscribe support), so only embedders call it for now.
+
+        Args:
+            session_id: The SSE session id
+            message: The JSON-serializable message to send
+
+        Returns:
+            bool: True if the message was queued, False if the session is unknown or its queue is full
+        """
+        queue = self._sse_queues.get(session_id)
+        if queue is None:
+            return False
+        try:
+            # Queued pre-encoded: one bytes object per message instead of a dict tree
+            queue.put_nowait(json_dumps_bytes(message))
+        except asyncio.QueueFull:
+            logger.warning("SSE queue full for session %s, dropping message", session_id)
+            return False
+        return True
+
     async def _handle_options(self, request: web.Request) -> web.Response:
         """Handle OPTIONS request for CORS preflight."""
+        from aiohttp import web
+
         response = web.Response()
         response.headers["Access-Control-Allow-Origin"] = "*"
         response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
@@ -341,9 +537,13 @@ class StreamableHTTPProtocol:
 
     async def run(self):
         """Run the protocol."""
+        from aiohttp import web
+
         self.running = True
         try:
-            self.runner = web.AppRunner(self.app)
+            # Per-request access log lines cost more than the JSON-RPC dispatch itself; opt in via http.access_log
+            access_log = logging.getLogger("aiohttp.access") if self.config.get("http", {}).get("access_log") else None
+            self.runner = web.AppRunner(self.app, access_log=access_log)
             await self.runner.setup()
             host = self.config.get("http", {}).get("host", "0.0.0.0")
             port = self.config.get("http", {}).get("port", 8080)
@@ -387,7 +587,9 @@ class OdooMCPServer(Server):
         # Initialize core components
         self.protocol_handler = ProtocolHandler(PROTOCOL_VERSION)
         self.capabilities_manager = CapabilitiesManager(config)
-        self.resource_manager = ResourceManager(cache_ttl=config.get("cache_ttl", 300))
+        self.resource_manager = ResourceManager(
+            cache_ttl=config.get("cache_ttl", 300), cache_max_size=config.get("resource_cache_max_size", 4096)
+        )
 
         # Initialize Odoo components
         logger.info(f"Initializing connection pool with protocol type: {self.protocol_type}")
@@ -405,6 +607,77 @@ class OdooMCPServer(Server):
         self.orm_tools = ORMTools(self.pool, self.config)
         logger.info("ORM tools initialized successfully")
 
+        # Listing payloads derived from registered capabilities: key -> (revision, result)
+        self._listing_cache: Dict[str, Any] = {}
+
+        # Single-record reads waiting to be merged into one read per model: model -> {id: future}
+        self._pending_record_reads: Dict[str, Dict[int, asyncio.Future]] = {}
+        # Flush tasks of those reads, referenced until done so they cannot be garbage collected mid-flight
+        self._record_read_tasks: Set[asyncio.Task] = set()
+
+        # ir.model listing used by resource enumeration: (monotonic timestamp, models)
+        self._models_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._models_cache_ttl = config.get("models_cache_ttl", 300)
+
+        # Results of read-only tool calls: (login, model, tool, frozen args) -> (monotonic timestamp, content)
+        self._tool_cache: OrderedDict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]]]] = OrderedDict()
+        self._tool_cache_ttl = config.get("tool_cache_ttl", 30)
+        self._tool_cache_max_size = config.get("tool_cache_max_size", 1024)
+        # Every tool call runs as the configured Odoo user, so the login identifies the uid
+        self._tool_cache_login = (config.get("odoo_url"), config.get("database"), config.get("username"))
+
+        # Prompt name -> implementation
+        self._prompt_handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "analyze-record": self._handle_analyze_record_prompt,
+            "create-record": self._handle_create_record_prompt,
+            "update-record": self._handle_update_record_prompt,
+            "advanced-search": self._handle_advanced_search_prompt,
+            "call-method": self._handle_call_method_prompt,
+        }
+
+        # JSON-RPC method dispatch table, including the MCP/n8n method aliases
+        self._method_handlers: Dict[str, Callable[[JsonRpcRequest], Any]] = {
+            "initialize": self._handle_initialize,
+            "list_resources": self._handle_list_resources,
+            "list_tools": self._handle_list_tools,
+            "list_prompts": self._handle_list_prompts,
+            "get_prompt": self._handle_get_prompt,
+            "list_resource_templates": self._handle_list_resource_templates,
+            "get_resource": self._handle_get_resource,
+            "handle_notification_initialized": self._handle_notification_initialized,
+            "call_tool": self._handle_call_tool,
+            "tools/list": self._handle_list_tools,
+            "prompts/list": self._handle_list_prompts,
+            "resources/templates/list": self._handle_list_resource_templates,
+            "resources/list": self._handle_list_resources,
+            "resources/read": self._handle_get_resource,
+            "notifications/initialized": self._handle_notification_initialized,
+            "tools/call": self._handle_call_tool,
+            "ping": self._handle_ping,
+        }
+        # Tool name -> coroutine taking the tool arguments and returning the MCP content list
+        self._tool_handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "odoo_search_read": self._tool_odoo_search_read,
+            "odoo_read": self._tool_odoo_read,
+            "odoo_write": self._tool_odoo_write,
+            "odoo_unlink": self._tool_odoo_unlink,
+            "odoo_create": self._tool_odoo_create,
+            "odoo_call_method": self._tool_odoo_call_method,
+            "odoo_execute_kw": self._tool_odoo_call_method,
+            "odoo.schema.version": self._tool_schema_version,
+            "odoo.schema.models": self._tool_schema_models,
+            "odoo.schema.fields": self._tool_schema_fields,
+            "odoo.domain.validate": self._tool_domain_validate,
+            "odoo.search_read": self._tool_search_read,
+            "odoo.name_search": self._tool_name_search,
+            "odoo.read": self._tool_read,
+            "odoo.create": self._tool_create,
+            "odoo.write": self._tool_write,
+            "odoo.actions.next_steps": self._tool_actions_next_steps,
+            "odoo.actions.call": self._tool_actions_call,
+            "odoo.picklists": self._tool_picklists,
+        }
+
         # Initialize protocol
         if self.connection_type == "stdio":
             self.protocol = StdioProtocol(self._handle_request)
@@ -729,19 +1002,19 @@ class OdooMCPServer(Server):
 
     async def _handle_odoo_record(self, uri: str, model: Optional[str] = None) -> Resource:
         """Handle Odoo record resource requests."""
-        logger.info(f"Handling Odoo record request for URI: {uri}")
+        logger.info("Handling Odoo record request for URI: %s", uri)
         try:
             # Parse URI
-            parts = uri.replace("odoo://", "").split("/")
-            if len(parts) != 2:
+            match = _RECORD_URI_RE.fullmatch(uri)
+            if match is None:
                 logger.error(f"Invalid record URI format: {uri}")
                 raise ProtocolError(f"Invalid record URI format: {uri}")
 
-            model = model or parts[0]
+            model = model or match["model"]
 
             # Check if this is a list request
-            if parts[1] == "list":
-                logger.info(f"Handling list request for model {model}")
+            if match["id"] == "list":
+                logger.info("Handling list request for model %s", model)
                 # Get records from Odoo
                 records = await self.pool.execute_kw(
                     model=model,
@@ -750,7 +1023,7 @@ class OdooMCPServer(Server):
                     kwargs={"limit": 100, "offset": 0},
                 )
 
-                logger.info(f"Successfully retrieved {len(records)} records from model {model}")
+                logger.info("Successfully retrieved %s records from model %s", len(records), model)
                 return Resource(
                     uri=uri,
                     type="list",
@@ -765,20 +1038,20 @@ class OdooMCPServer(Server):
 
             # Handle single record request
             try:
-                record_id = int(parts[1])
+                record_id = int(match["id"])
             except ValueError:
                 logger.error(f"Invalid record ID in URI: {uri}")
                 raise ProtocolError(f"Invalid record ID in URI: {uri}")
 
-            logger.info(f"Fetching record {record_id} from model {model}")
+            logger.info("Fetching record %s from model %s", record_id, model)
             # Get record from Odoo
-            record = await self.pool.execute_kw(model=model, method="read", args=[[record_id]], kwargs={})
+            record = await self._read_record(model, record_id)
 
             if not record:
                 logger.error(f"Record {record_id} not found in model {model}")
                 raise OdooRecordNotFoundError(f"Record {record_id} not found in model {model}")
 
-            logger.info(f"Successfully retrieved record {record_id} from model {model}")
+            logger.info("Successfully retrieved record %s from model %s", record_id, model)
             return Resource(
                 uri=uri,
                 type="record",
@@ -797,6 +1070,74 @@ class OdooMCPServer(Server):
             logger.error(f"Error handling Odoo record request: {str(e)}")
             raise ProtocolError(f"Error handling Odoo record request: {str(e)}")
 
+    async def _read_record(self, model: str, record_id: int) -> List[Dict[str, Any]]:
+        """
+        Read one record, sharing a single multi-id read with the other reads of the model issued in the same loop pass.
+
+        Args:
+            model: Model name
+            record_id: Record ID
+
+        Returns:
+            List[Dict[str, Any]]: The record, or an empty list if it does not exist
+        """
+        pending = self._pending_record_reads.get(model)
+        if pending is None:
+            pending = self._pending_record_reads[model] = {}
+            # The flush task first runs after every task already scheduled in this loop pass
+            task = asyncio.get_running_loop().create_task(self._flush_record_reads(model))
+            self._record_read_tasks.add(task)
+            task.add_done_callback(lambda done: self._record_reads_flushed(done, pending))
+        future = pending.get(record_id)
+        if future is None:
+            future = pending[record_id] = asyncio.get_running_loop().create_future()
+        # Shielded: a cancelled caller must not cancel the result other callers share
+        return await asyncio.shield(future)
+
+    async def _flush_record_reads(self, model: str) -> None:
+        """Resolve the pending single-record reads of a model with one read call."""
+        pending = self._pending_record_reads.pop(model)
+        try:
+            records = await self.pool.execute_kw(model=model, method="read", args=[list(pending)], kwargs={})
+        except Exception as e:
+            if len(pending) == 1:
+                for future in pending.values():
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            # One missing id fails the whole read; read each record on its own so only that one errors
+            logger.debug("Merged read of %s failed, reading records individually: %s", model, e)
+            await asyncio.gather(
+                *(self._settle_record_read(model, record_id, future) for record_id, future in pending.items())
+            )
+            return
+        by_id = {record.get("id"): record for record in records if isinstance(record, dict)}
+        for record_id, future in pending.items():
+            if not future.done():
+                future.set_result([by_id[record_id]] if record_id in by_id else [])
+
+    def _record_reads_flushed(self, task: asyncio.Task, pending: Dict[int, asyncio.Future]) -> None:
+        """Release a finished flush task and fail the reads it left unresolved."""
+        self._record_read_tasks.discard(task)
+        for future in pending.values():
+            if future.done():
+                continue
+            if task.cancelled():
+                future.cancel()
+            else:
+                future.set_exception(task.exception() or ProtocolError("Record read was not resolved"))
+
+    async def _settle_record_read(self, model: str, record_id: int, future: asyncio.Future) -> None:
+        """Read a single record and hand the outcome to its waiting future."""
+        try:
+            result = await self.pool.execute_kw(model=model, method="read", args=[[record_id]], kwargs={})
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(result)
+
     async def _handle_odoo_record_list(
         self,
         uri: str,
@@ -807,16 +1148,16 @@ class OdooMCPServer(Server):
         offset: Optional[int] = None,
     ) -> Resource:
         """Handle Odoo record list resource requests."""
-        logger.info(f"Handling Odoo record list request for URI: {uri}")
+        logger.info("Handling Odoo record list request for URI: %s", uri)
         try:
             # Parse URI
-            parts = uri.replace("odoo://", "").split("/")
-            if len(parts) != 2 or parts[1] != "list":
+            match = _RECORD_URI_RE.fullmatch(uri)
+            if match is None or match["id"] != "list":
                 logger.error(f"Invalid record list URI format: {uri}")
                 raise ProtocolError(f"Invalid record list URI format: {uri}")
 
-            model = model or parts[0]
-            logger.info(f"Fetching records from model {model}")
+            model = model or match["model"]
+            logger.info("Fetching records from model %s", model)
 
             # Set default values
             domain = domain or []
@@ -832,7 +1173,7 @@ class OdooMCPServer(Server):
                 kwargs={"limit": limit, "offset": offset},
             )
 
-            logger.info(f"Successfully retrieved {len(records)} records from model {model}")
+            logger.info("Successfully retrieved %s records from model %s", len(records), model)
             return Resource(
                 uri=uri,
                 type="list",
@@ -859,14 +1200,14 @@ class OdooMCPServer(Server):
         """Handle Odoo binary field resource requests."""
         try:
             # Parse URI
-            parts = uri.replace("odoo://", "").split("/")
-            if len(parts) != 4 or parts[1] != "binary":
+            match = _BINARY_URI_RE.fullmatch(uri)
+            if match is None:
                 raise ProtocolError(f"Invalid binary field URI format: {uri}")
 
-            model = model or parts[0]
-            field = parts[2]
+            model = model or match["model"]
+            field = match["field"]
             try:
-                record_id = int(parts[3])
+                record_id = int(match["id"])
             except ValueError:
                 raise ProtocolError(f"Invalid record ID in URI: {uri}")
 
@@ -905,12 +1246,12 @@ class OdooMCPServer(Server):
             await self.bus_handler.notify_resource_update(uri, resource)
 
             # Update cache
-            self.resource_manager._resource_cache[uri] = resource
+            self.resource_manager._cache_resource(uri, resource)
 
             # Notify subscribers
             await self.resource_manager._notify_subscribers(uri, resource)
 
-            logger.info(f"Resource update notification sent for {uri}")
+            logger.info("Resource update notification sent for %s", uri)
         except Exception as e:
             logger.error(f"Error notifying resource update for {uri}: {e}")
             raise ProtocolError(f"Error notifying resource update: {str(e)}")
@@ -918,7 +1259,35 @@ class OdooMCPServer(Server):
     @property
     def capabilities(self) -> Dict[str, Any]:
         """Get server capabilities."""
-        return self.capabilities_manager.get_capabilities()
+        return self._cached_listing("capabilities", self.capabilities_manager.get_capabilities)
+
+    def refresh_capabilities(self) -> None:
+        """Drop all cached capability and listing payloads so they are rebuilt on next use."""
+        self._listing_cache.clear()
+        self._models_cache = None
+        self.orm_tools.action_discoverer.invalidate_models()
+
+    async def _list_ir_models(self) -> List[Dict[str, Any]]:
+        """
+        List installed Odoo models, cached for ``models_cache_ttl`` seconds.
+
+        The model registry only changes when modules are installed, so resource
+        enumeration does not need a fresh ir.model query on every call.
+
+        Returns:
+            List[Dict[str, Any]]: ir.model records with ``model`` and ``name``
+        """
+        cached = self._models_cache
+        if cached is not None and time.monotonic() - cached[0] < self._models_cache_ttl:
+            return cached[1]
+        models = await self.pool.execute_kw(
+            model="ir.model",
+            method="search_read",
+            args=[[], ["model", "name"]],
+            kwargs={},
+        )
+        self._models_cache = (time.monotonic(), models)
+        return models
 
     async def initialize(self, client_info: ClientInfo) -> ServerInfo:
         """Initialize the server with client information."""
@@ -937,27 +1306,25 @@ class OdooMCPServer(Server):
 
     async def get_resource(self, uri: str) -> Resource:
         """Get a resource by URI."""
-        logger.info(f"Getting resource for URI: {uri}")
-        logger.info(f"Available handlers: {list(self.resource_manager._resource_handlers.keys())}")
+        logger.info("Getting resource for URI: %s", uri)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available handlers: %s", list(self.resource_manager._resource_handlers.keys()))
         return await self.resource_manager.get_resource(uri)
 
     async def list_resources(self, template: Optional[ResourceTemplate] = None) -> List[Resource]:
         """List available resources."""
+        # Bound once: the template branches call it once per model
+        execute_kw = self.pool.execute_kw
         try:
             if template:
                 # List resources for a specific template
                 if template.uri_template == "odoo://{model}/{id}":
                     # Get all models
-                    models = await self.pool.execute_kw(
-                        model="ir.model",
-                        method="search_read",
-                        args=[[], ["model", "name"]],
-                        kwargs={},
-                    )
+                    models = await self._list_ir_models()
                     resources = []
                     for model in models:
                         # Get first record of each model
-                        records = await self.pool.execute_kw(
+                        records = await execute_kw(
                             model=model["model"],
                             method="search_read",
                             args=[[], ["id"]],
@@ -982,12 +1349,7 @@ class OdooMCPServer(Server):
 
                 elif template.uri_template == "odoo://{model}/list":
                     # Get all models
-                    models = await self.pool.execute_kw(
-                        model="ir.model",
-                        method="search_read",
-                        args=[[], ["model", "name"]],
-                        kwargs={},
-                    )
+                    models = await self._list_ir_models()
                     resources = []
                     for model in models:
                         uri = f"odoo://{model['model']}/list"
@@ -1004,22 +1366,17 @@ class OdooMCPServer(Server):
 
                 elif template.uri_template == "odoo://{model}/binary/{field}/{id}":
                     # Get all models with binary fields
-                    models = await self.pool.execute_kw(
-                        model="ir.model",
-                        method="search_read",
-                        args=[[], ["model", "name"]],
-                        kwargs={},
-                    )
+                    models = await self._list_ir_models()
                     resources = []
                     for model in models:
                         # Get binary fields
-                        fields = await self.pool.execute_kw(
+                        fields = await execute_kw(
                             model=model["model"], method="fields_get", args=[], kwargs={}
                         )
                         binary_fields = {name: info for name, info in fields.items() if info.get("type") == "binary"}
                         if binary_fields:
                             # Get first record
-                            records = await self.pool.execute_kw(
+                            records = await execute_kw(
                                 model=model["model"],
                                 method="search_read",
                                 args=[[], ["id"]],
@@ -1059,29 +1416,60 @@ class OdooMCPServer(Server):
                     raise ProtocolError(f"Unsupported resource template: {template.uri_template}")
 
             else:
-                # List all resource templates
-                templates = self.capabilities_manager.list_resource_templates()
-                return [
-                    Resource(
-                        uri=template["uriTemplate"],
-                        type=template["type"],
-                        content=None,
-                        mime_type="application/json",
-                        metadata={
-                            "name": template["name"],
-                            "description": template["description"],
-                            "operations": template["operations"],
-                            "parameters": template["parameters"],
-                        },
-                    )
-                    for template in templates
-                ]
+                # Copy the list so callers can extend it without touching the cached one
+                return list(self._cached_listing("template_resources", self._list_template_resources, encode=False))
 
         except Exception as e:
             if isinstance(e, ProtocolError):
                 raise
             raise ProtocolError(f"Error listing resources: {str(e)}")
 
+    def _resource_templates(self) -> List[Dict[str, Any]]:
+        """Return the shared, read-only list of registered resource templates."""
+        return self._cached_listing("templates", self.capabilities_manager.list_resource_templates)
+
+    def _list_template_resources(self) -> List[Resource]:
+        """List one placeholder resource per registered resource template."""
+        templates = self._resource_templates()
+        return [
+            Resource(
+                uri=template["uriTemplate"],
+                type=template["type"],
+                content=None,
+                mime_type="application/json",
+                metadata={
+                    "name": template["name"],
+                    "description": template["description"],
+                    "operations": template["operations"],
+                    "parameters": template["parameters"],
+                },
+            )
+            for template in templates
+        ]
+
+    def _cached_listing(self, key: str, build: Callable[[], Any], encode: bool = True) -> Any:
+        """
+        Return a listing result built from the capabilities manager, rebuilding it only after registrations change.
+
+        Args:
+            key: Cache key of the listing
+            build: Callable producing the listing result
+            encode: Whether to pre-encode the result as a JSON-RPC response payload
+
+        Returns:
+            Any: The (shared, read-only) listing result
+        """
+        revision = self.capabilities_manager.revision
+        cached = self._listing_cache.get(key)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        result = build()
+        if encode:
+            # Listings are shared and never mutated, so their JSON can be encoded once too
+            register_static_payload(result)
+        self._listing_cache[key] = (revision, result)
+        return result
+
     async def list_tools(self) -> List[Tool]:
         """List available tools."""
         return list(self.capabilities_manager.tools.values())
@@ -1098,32 +1486,36 @@ class OdooMCPServer(Server):
                 raise ProtocolError(f"Prompt not found: {name}")
 
             # Validate arguments
-            for param_name, param_info in prompt.parameters.items():
-                if param_info.get("optional"):
-                    continue
+            required_params = self._cached_listing(
+                "prompt_required_params", self._build_prompt_required_params, encode=False
+            )
+            for param_name in required_params.get(name, ()):
                 if param_name not in args:
                     raise ProtocolError(f"Missing required parameter: {param_name}")
                 # TODO: Add type validation if needed
 
             # Execute prompt based on name
-            if name == "analyze-record":
-                return await self._handle_analyze_record_prompt(args)
-            elif name == "create-record":
-                return await self._handle_create_record_prompt(args)
-            elif name == "update-record":
-                return await self._handle_update_record_prompt(args)
-            elif name == "advanced-search":
-                return await self._handle_advanced_search_prompt(args)
-            elif name == "call-method":
-                return await self._handle_call_method_prompt(args)
-            else:
+            handler = self._prompt_handlers.get(name)
+            if handler is None:
                 raise ProtocolError(f"Unsupported prompt: {name}")
+            return await handler(args)
 
         except Exception as e:
             if isinstance(e, ProtocolError):
                 raise
             raise ProtocolError(f"Error executing prompt {name}: {str(e)}")
 
+    def _build_prompt_required_params(self) -> Dict[str, tuple]:
+        """Map each registered prompt to the names of its required parameters."""
+        return {
+            prompt_name: tuple(
+                param_name
+                for param_name, param_info in (prompt.parameters or {}).items()
+                if not (isinstance(param_info, dict) and param_info.get("optional"))
+            )
+            for prompt_name, prompt in self.capabilities_manager.prompts.items()
+        }
+
     async def _handle_analyze_record_prompt(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handle analyze-record prompt."""
         model = args["model"]
@@ -1225,71 +1617,48 @@ class OdooMCPServer(Server):
             }
         }
 
+    def _build_prompts_result(self) -> Dict[str, Any]:
+        """Build the list_prompts result payload."""
+        return {
+            "prompts": [
+                {
+                    "name": prompt.name,
+                    "description": prompt.description,
+                    "template": prompt.template,
+                    "parameters": prompt.parameters,
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": prompt.parameters,
+                        "required": list(prompt.parameters.keys()),
+                    },
+                }
+                for prompt in self.capabilities_manager.prompts.values()
+            ]
+        }
+
     async def _handle_list_prompts(self, request: JsonRpcRequest) -> Dict[str, Any]:
         """Handle list_prompts request."""
         try:
-            prompts = await self.list_prompts()
-            return {
-                "jsonrpc": "2.0",
-                "result": {
-                    "prompts": [
-                        {
-                            "name": prompt.name,
-                            "description": prompt.description,
-                            "template": prompt.template,
-                            "parameters": prompt.parameters,
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": prompt.parameters,
-                                "required": list(prompt.parameters.keys()),
-                            },
-                        }
-                        for prompt in prompts
-                    ]
-                },
-                "id": request.id,
-            }
+            return _ok(request.id, self._cached_listing("prompts", self._build_prompts_result))
         except Exception as e:
             logger.error(f"Error handling list_prompts request: {e}")
-            return {
-                "jsonrpc": "2.0",
-                "error": {"code": -32603, "message": f"Internal error: {str(e)}"},
-                "id": request.id,
-            }
+            return _err(request.id, -32603, f"Internal error: {str(e)}")
 
     async def _handle_list_resource_templates(self, request: JsonRpcRequest) -> Dict[str, Any]:
         """Handle list_resource_templates request."""
         try:
-            templates = self.capabilities_manager.list_resource_templates()
-            templates_list = []
-            for template in templates:
-                templates_list.append(
-                    {
-                        "name": template["name"],
-                        "type": template["type"],
-                        "description": template["description"],
-                        "operations": template["operations"],
-                        "parameters": template["parameters"],
-                        "uriTemplate": template["uriTemplate"],
-                    }
-                )
-
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {
-                    "id": "templates",
-                    "method": "listResourceTemplates",
-                    "resourceTemplates": templates_list,
-                },
-            }
+            return _ok(request.id, self._cached_listing("resource_templates", self._build_resource_templates_result))
         except Exception as e:
             logger.error(f"Error handling list_resource_templates request: {e}")
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "error": {"code": -32603, "message": str(e)},
-            }
+            return _err(request.id, -32603, str(e))
+
+    def _build_resource_templates_result(self) -> Dict[str, Any]:
+        """Build the list_resource_templates result payload."""
+        return {
+            "id": "templates",
+            "method": "listResourceTemplates",
+            "resourceTemplates": self._resource_templates(),
+        }
 
     async def _handle_get_resource(self, request: JsonRpcRequest) -> Dict[str, Any]:
         """Handle get_resource request."""
@@ -1304,20 +1673,19 @@ class OdooMCPServer(Server):
             if is_langchain:
                 # Format for Langchain
                 if isinstance(resource.content, (dict, list)):
-                    content = json.dumps(resource.content)
+                    content = json_dumps(resource.content)
                 elif isinstance(resource.content, bytes):
                     content = base64.b64encode(resource.content).decode()
                 else:
                     content = str(resource.content)
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request.id,
-                    "result": {"type": "text", "text": content},
-                }
+                return _ok(request.id, {"type": "text", "text": content})
             # Standard MCP format
+            # Clients consuming the structured "content" can opt out of its JSON text copy
+            meta = request.params.get("_meta")
+            include_text = meta.get("include_text", True) if isinstance(meta, Mapping) else True
             if isinstance(resource, Resource):
                 if isinstance(resource.content, (dict, list)):
-                    content = {"text": json.dumps(resource.content), "blob": None}
+                    content = {"text": json_dumps(resource.content) if include_text else None, "blob": None}
                 elif isinstance(resource.content, bytes):
                     content = {"text": None, "blob": base64.b64encode(resource.content).decode()}
                 else:
@@ -1337,7 +1705,7 @@ class OdooMCPServer(Server):
             elif isinstance(resource, dict):
                 if "content" in resource:
                     if isinstance(resource["content"], (dict, list)):
-                        content = {"text": json.dumps(resource["content"]), "blob": None}
+                        content = {"text": json_dumps(resource["content"]) if include_text else None, "blob": None}
                     elif isinstance(resource["content"], bytes):
                         content = {
                             "text": None,
@@ -1349,23 +1717,16 @@ class OdooMCPServer(Server):
                 contents = [resource]
             else:
                 contents = []
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {"id": uri, "method": "readResource", "contents": contents},
-            }
+            return _ok(request.id, {"id": uri, "method": "readResource", "contents": contents})
         except Exception as e:
             logger.error(f"Error handling get_resource request: {e}")
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "error": {"code": -32603, "message": str(e)},
-            }
+            return _err(request.id, -32603, str(e))
 
     async def run(self):
         """Run the server."""
         try:
             logger.info("Starting server...")
+            self._configure_executor()
             if self.config.get("protocol") == "stdio":
                 logger.info("Starting server in stdio mode")
                 await self._run_stdio()
@@ -1376,6 +1737,22 @@ class OdooMCPServer(Server):
             logger.error(f"Error running server: {e}")
             raise
 
+    def _configure_executor(self) -> None:
+        """
+        Size the event loop's default executor for blocking work.
+
+        XML-RPC calls and stdin reads run on the default executor, whose
+        stock size (cpu count + 4) can be smaller than the connection pool,
+        making pooled calls queue behind each other. ``executor_max_workers``
+        overrides the computed size.
+        """
+        max_workers = self.config.get("executor_max_workers") or max(
+            min(32, (os.cpu_count() or 1) * 4), self.pool.max_size + 1
+        )
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="odoo-mcp")
+        asyncio.get_running_loop().set_default_executor(executor)
+        logger.debug("Default executor sized to %s workers", max_workers)
+
     async def _run_http(self):
         """Run the server in HTTP mode."""
         try:
@@ -1395,6 +1772,51 @@ class OdooMCPServer(Server):
             logger.error(f"Error in HTTP server: {e}")
             raise
 
+    @staticmethod
+    async def _write_http_json(
+        writer: asyncio.StreamWriter, status: bytes, body: bytes, etag: Optional[str] = None
+    ) -> None:
+        """Write a complete HTTP/1.1 JSON response, in a single buffer unless the body is large."""
+        head = (
+            b"HTTP/1.1 "
+            + status
+            + b"\r\nContent-Type: application/json; charset=utf-8\r\nContent-Length: "
+            + str(len(body)).encode("ascii")
+            + (b"\r\nETag: " + etag.encode("ascii") if etag else b"")
+            + b"\r\n\r\n"
+        )
+        if len(body) <= _HTTP_SINGLE_WRITE_MAX:
+            writer.write(head + body)
+        else:
+            # Large bodies (binary fields, wide records) are handed over as is instead of copied into one buffer
+            writer.write(head)
+            writer.write(body)
+        await writer.drain()
+
+    @staticmethod
+    async def _write_http_status(writer: asyncio.StreamWriter, status: bytes, etag: Optional[str] = None) -> None:
+        """
+        Write an HTTP/1.1 response without content.
+
+        204 and 304 responses carry no Content-Length or Content-Type (RFC 9110 §8.6), a 304 only
+        repeats the ETag validator; any other status declares an empty body.
+        """
+        head = b"HTTP/1.1 " + status + b"\r\n"
+        if etag:
+            head += b"ETag: " + etag.encode("ascii") + b"\r\n"
+        if not status.startswith((b"204 ", b"304 ")):
+            head += b"Content-Length: 0\r\n"
+        writer.write(head + b"\r\n")
+        await writer.drain()
+
+    @staticmethod
+    def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """Check an If-None-Match header value against an entity tag."""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+
     async def _handle_http_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         """Handle an HTTP connection."""
         try:
@@ -1411,7 +1833,7 @@ class OdooMCPServer(Server):
                 for encoding in encodings:
                     try:
                         decoded_line = request_line.decode(encoding)
-                        logger.debug(f"Successfully decoded request line with {encoding}: {decoded_line}")
+                        logger.debug("Successfully decoded request line with %s: %s", encoding, decoded_line)
                         break
                     except UnicodeDecodeError:
                         continue
@@ -1453,40 +1875,54 @@ class OdooMCPServer(Server):
                         logger.error(f"Error reading header: {e}")
                         continue
 
-                logger.debug(f"Request headers: {headers}")
+                logger.debug("Request headers: %s", headers)
 
                 # Read content length if present
                 content_length = int(headers.get("content-length", 0))
-                logger.debug(f"Content length: {content_length}")
+                logger.debug("Content length: %s", content_length)
 
                 if content_length > 0:
                     # Read the request body
                     try:
                         request_data = await reader.read(content_length)
-                        logger.debug(f"Request body (raw): {request_data}")
-                        # Try different encodings for request body
-                        decoded_data = None
-                        for encoding in encodings:
-                            try:
-                                decoded_data = request_data.decode(encoding)
-                                logger.debug(f"Successfully decoded request body with {encoding}")
-                                break
-                            except UnicodeDecodeError:
-                                continue
-                        if decoded_data is None:
-                            raise UnicodeDecodeError("Could not decode request data with any supported encoding")
-                        # Parse the request
-                        request = json.loads(decoded_data)
-                        logger.debug(f"Parsed request: {request}")
+                        logger.debug("Request body (raw): %s", request_data)
+                        try:
+                            # UTF-8 bodies are parsed straight from bytes
+                            request = json_loads(request_data)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            # Try different encodings for request body
+                            decoded_data = None
+                            for encoding in encodings:
+                                try:
+                                    decoded_data = request_data.decode(encoding)
+                                    logger.debug("Successfully decoded request body with %s", encoding)
+                                    break
+                                except UnicodeDecodeError:
+                                    continue
+                            if decoded_data is None:
+                                raise UnicodeDecodeError("Could not decode request data with any supported encoding")
+                            # Parse the request
+                            request = json_loads(decoded_data)
+                        logger.debug("Parsed request: %s", request)
                         # Process the request
                         response = await self.process_request(request)
-                        logger.debug(f"Got response from process_request: {response}")
-                        logger.debug(f"Response type: {type(response)}")
-                        logger.debug(f"Response attributes: {dir(response)}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Got response from process_request: %s", response)
+                            logger.debug("Response type: %s", type(response))
+                            logger.debug("Response attributes: %s", dir(response))
                         try:
+                            if response is None:
+                                # Notifications only: MCP streamable HTTP acknowledges them with 202 and no body
+                                await self._write_http_status(writer, b"202 Accepted")
+                                return
+                            # Static listings (tools, prompts, templates) carry an ETag for conditional requests
+                            etag = static_payload_etag(response.get("result")) if isinstance(response, dict) else None
+                            if etag and self._etag_matches(headers.get("if-none-match"), etag):
+                                await self._write_http_status(writer, b"304 Not Modified", etag)
+                                return
                             # FIX: Se la risposta è già un dict, restituiscila così com'è
-                            if isinstance(response, dict):
-                                response_data = json.dumps(response).encode("utf-8")
+                            if isinstance(response, (dict, list)):
+                                response_data = dumps_response_bytes(response)
                             else:
                                 response_dict = {
                                     "jsonrpc": getattr(response, "jsonrpc", "2.0"),
@@ -1497,14 +1933,9 @@ class OdooMCPServer(Server):
                                     response_dict["error"] = error
                                 else:
                                     response_dict["result"] = getattr(response, "result", None)
-                                logger.debug(f"Converted response dict: {response_dict}")
-                                response_data = json.dumps(response_dict).encode("utf-8")
-                            writer.write(b"HTTP/1.1 200 OK\r\n")
-                            writer.write(b"Content-Type: application/json; charset=utf-8\r\n")
-                            writer.write(f"Content-Length: {len(response_data)}\r\n".encode("utf-8"))
-                            writer.write(b"\r\n")
-                            writer.write(response_data)
-                            await writer.drain()
+                                logger.debug("Converted response dict: %s", response_dict)
+                                response_data = json_dumps_bytes(response_dict)
+                            await self._write_http_json(writer, b"200 OK", response_data, etag)
                         except Exception as e:
                             logger.error(f"Error converting response to dict: {e}")
                             logger.exception("Full traceback for conversion error:")
@@ -1512,46 +1943,24 @@ class OdooMCPServer(Server):
                                 "error": f"Error converting response: {str(e)}",
                                 "status": "error",
                             }
-                            response_data = json.dumps(error_response).encode("utf-8")
-                            writer.write(b"HTTP/1.1 500 Internal Server Error\r\n")
-                            writer.write(b"Content-Type: application/json; charset=utf-8\r\n")
-                            writer.write(f"Content-Length: {len(response_data)}\r\n".encode("utf-8"))
-                            writer.write(b"\r\n")
-                            writer.write(response_data)
-                            await writer.drain()
+                            await self._write_http_json(
+                                writer, b"500 Internal Server Error", json_dumps_bytes(error_response)
+                            )
                     except json.JSONDecodeError as e:
                         logger.error(f"Invalid JSON in request: {e}")
                         error_response = {"error": "Invalid JSON in request", "status": "error"}
-                        response_data = json.dumps(error_response).encode("utf-8")
-                        writer.write(b"HTTP/1.1 400 Bad Request\r\n")
-                        writer.write(b"Content-Type: application/json; charset=utf-8\r\n")
-                        writer.write(f"Content-Length: {len(response_data)}\r\n".encode("utf-8"))
-                        writer.write(b"\r\n")
-                        writer.write(response_data)
-                        await writer.drain()
+                        await self._write_http_json(writer, b"400 Bad Request", json_dumps_bytes(error_response))
                     except UnicodeDecodeError as e:
                         logger.error(f"Error decoding request data: {e}")
                         error_response = {
                             "error": "Invalid character encoding in request",
                             "status": "error",
                         }
-                        response_data = json.dumps(error_response).encode("utf-8")
-                        writer.write(b"HTTP/1.1 400 Bad Request\r\n")
-                        writer.write(b"Content-Type: application/json; charset=utf-8\r\n")
-                        writer.write(f"Content-Length: {len(response_data)}\r\n".encode("utf-8"))
-                        writer.write(b"\r\n")
-                        writer.write(response_data)
-                        await writer.drain()
+                        await self._write_http_json(writer, b"400 Bad Request", json_dumps_bytes(error_response))
                 else:
                     logger.warning("No content length in request")
                     error_response = {"error": "No content length specified", "status": "error"}
-                    response_data = json.dumps(error_response).encode("utf-8")
-                    writer.write(b"HTTP/1.1 400 Bad Request\r\n")
-                    writer.write(b"Content-Type: application/json; charset=utf-8\r\n")
-                    writer.write(f"Content-Length: {len(response_data)}\r\n".encode("utf-8"))
-                    writer.write(b"\r\n")
-                    writer.write(response_data)
-                    await writer.drain()
+                    await self._write_http_json(writer, b"400 Bad Request", json_dumps_bytes(error_response))
 
             except ConnectionResetError as e:
                 logger.warning(f"Connection reset by peer: {e}")
@@ -1560,13 +1969,7 @@ class OdooMCPServer(Server):
                 logger.error(f"Error handling HTTP connection: {e}")
                 try:
                     error_response = {"error": str(e), "status": "error"}
-                    response_data = json.dumps(error_response).encode("utf-8")
-                    writer.write(b"HTTP/1.1 500 Internal Server Error\r\n")
-                    writer.write(b"Content-Type: application/json; charset=utf-8\r\n")
-                    writer.write(f"Content-Length: {len(response_data)}\r\n".encode("utf-8"))
-                    writer.write(b"\r\n")
-                    writer.write(response_data)
-                    await writer.drain()
+                    await self._write_http_json(writer, b"500 Internal Server Error", json_dumps_bytes(error_response))
                 except Exception as write_error:
                     logger.error(f"Error sending error response: {write_error}")
         finally:
@@ -1576,6 +1979,16 @@ class OdooMCPServer(Server):
             except Exception as e:
                 logger.error(f"Error closing connection: {e}")
 
+    @staticmethod
+    def _write_stdio_line(body: bytes) -> None:
+        """Write one JSON message line to stdout, bypassing the text layer when possible."""
+        stream = getattr(sys.stdout, "buffer", None)
+        if stream is None:
+            print(body.decode("utf-8"), flush=True)
+            return
+        stream.write(body + b"\n")
+        stream.flush()
+
     async def _run_stdio(self):
         """Run the server in stdio mode."""
         try:
@@ -1585,44 +1998,52 @@ class OdooMCPServer(Server):
             while True:
                 try:
                     # Read a line from stdin
-                    line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+                    line = await asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
                     if not line:
                         break
 
                     # Parse the request
-                    request = json.loads(line)
-                    logger.debug(f"Received request: {request}")
+                    request = json_loads(line)
+                    logger.debug("Received request: %s", request)
 
                     # Process the request
                     response = await self.process_request(request)
 
-                    # Send the response
-                    print(json.dumps(response), flush=True)
+                    # Send the response (a batch of notifications gets none)
+                    if response is not None:
+                        self._write_stdio_line(dumps_response_bytes(response))
 
                 except json.JSONDecodeError as e:
                     logger.error(f"Invalid JSON: {e}")
                     error_response = {"error": "Invalid JSON", "status": "error"}
-                    print(json.dumps(error_response), flush=True)
+                    self._write_stdio_line(json_dumps_bytes(error_response))
                 except Exception as e:
                     logger.error(f"Error processing request: {e}")
                     error_response = {"error": str(e), "status": "error"}
-                    print(json.dumps(error_response), flush=True)
+                    self._write_stdio_line(json_dumps_bytes(error_response))
 
         except Exception as e:
             logger.error(f"Error in stdio server: {e}")
             raise
 
-    async def process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Process a JSON-RPC request."""
+    async def process_request(
+        self, request: Union[Dict[str, Any], List[Any]]
+    ) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Process a JSON-RPC request or batch.
+
+        Returns None when nothing must be sent back, i.e. for a notification or
+        a batch made up only of notifications.
+        """
         try:
             # Check if this is a custom tool format (array with tool objects)
-            if isinstance(request, list) and len(request) > 0:
+            if isinstance(request, list):
                 # Handle custom tool format
-                tool_request = request[0]
+                tool_request = request[0] if request else None
                 if isinstance(tool_request, dict) and "tool" in tool_request:
                     # Convert to standard format
                     tool_name = tool_request["tool"]
-                    tool_params = tool_request.get("params", {})
+                    tool_params = tool_request.get("params") or _EMPTY
 
                     # Create a standard JSON-RPC request
                     standard_request = {
@@ -1635,739 +2056,528 @@ class OdooMCPServer(Server):
                     # Process as standard request
                     return await self._process_standard_request(standard_request)
 
-            # Process as standard JSON-RPC request
-            return await self._process_standard_request(request)
+                # Any other array is a JSON-RPC 2.0 batch
+                return await self._process_batch(request)
+
+            return await self._process_message(request)
 
         except Exception as e:
             logger.error(f"Error processing request: {str(e)}")
-            return {
-                "jsonrpc": "2.0",
-                "error": {"code": -32603, "message": str(e)},
-                "id": request.get("id") if isinstance(request, dict) else None,
-            }
+            return _err(request.get("id") if isinstance(request, dict) else None, -32603, str(e))
+
+    async def _process_batch(self, requests: List[Any]) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Process a JSON-RPC 2.0 batch, running its calls concurrently."""
+        if not requests:
+            return _err(None, -32600, "Invalid Request: empty batch")
+
+        read_groups = self._group_batch_reads(requests)
+        grouped = {index for members in read_groups.values() for index, _ in members}
+        singles = [index for index in range(len(requests)) if index not in grouped]
+        results = await asyncio.gather(
+            *(self._process_message(requests[index]) for index in singles),
+            *(self._run_batch_read(requests, key, members) for key, members in read_groups.items()),
+        )
+        responses: List[Any] = [None] * len(requests)
+        for index, response in zip(singles, results):
+            responses[index] = response
+        for group_responses in results[len(singles) :]:
+            for index, response in group_responses.items():
+                responses[index] = response
+        # Notifications get no entry in the response array
+        responses = [response for item, response in zip(requests, responses) if not _is_notification(item)]
+        return responses or None
+
+    async def _process_message(self, request: Any) -> Optional[Dict[str, Any]]:
+        """
+        Process a single JSON-RPC message, on its own or as a batch item.
+
+        Notifications are run for their side effects but never answered; MCP
+        ``notifications/*`` messages carry nothing to act on and are not dispatched.
+        """
+        if not isinstance(request, dict):
+            return _err(None, -32600, "Invalid Request")
+        if not _is_notification(request):
+            return await self._process_standard_request(request)
+        method = request.get("method")
+        if not (isinstance(method, str) and method.startswith("notifications/")):
+            await self._process_standard_request(request)
+        return None
+
+    def _group_batch_reads(
+        self, requests: List[Any]
+    ) -> Dict[Tuple[str, Tuple[str, ...]], List[Tuple[int, List[int]]]]:
+        """Group the odoo_read calls of a batch by (model, fields), keeping groups of two or more."""
+        groups: Dict[Tuple[str, Tuple[str, ...]], List[Tuple[int, List[int]]]] = {}
+        for index, item in enumerate(requests):
+            if not isinstance(item, dict) or item.get("method") != "tools/call":
+                continue
+            params = item.get("params")
+            if not isinstance(params, dict) or params.get("name") != "odoo_read":
+                continue
+            arguments = params.get("arguments")
+            if not isinstance(arguments, dict):
+                continue
+            model, ids, fields = self._odoo_read_args(arguments)
+            if isinstance(ids, int):
+                ids = [ids]
+            if (
+                not isinstance(model, str)
+                or not isinstance(ids, list)
+                or not all(isinstance(record_id, int) for record_id in ids)
+                or not isinstance(fields, (list, tuple))
+                or not all(isinstance(field_name, str) for field_name in fields)
+            ):
+                continue
+            groups.setdefault((model, tuple(fields)), []).append((index, ids))
+        return {key: members for key, members in groups.items() if len(members) > 1}
+
+    async def _run_batch_read(
+        self,
+        requests: List[Any],
+        key: Tuple[str, Tuple[str, ...]],
+        members: List[Tuple[int, List[int]]],
+    ) -> Dict[int, Dict[str, Any]]:
+        """Answer a group of odoo_read calls with a single multi-id read."""
+        model, fields = key
+        ids = list(dict.fromkeys(record_id for _, member_ids in members for record_id in member_ids))
+        try:
+            records = await self.pool.execute_kw(model=model, method="read", args=[ids, list(fields)], kwargs={})
+        except Exception as e:
+            # One bad id fails the whole read; run each call on its own so only that one errors
+            logger.debug("Batched read of %s failed, dispatching calls individually: %s", model, e)
+            responses = await asyncio.gather(*(self._process_standard_request(requests[index]) for index, _ in members))
+            return {index: response for (index, _), response in zip(members, responses)}
+        by_id = {record.get("id"): record for record in records if isinstance(record, dict)}
+        responses = {}
+        for index, member_ids in members:
+            rows = [by_id[record_id] for record_id in member_ids if record_id in by_id]
+            responses[index] = _ok(requests[index].get("id"), {"content": self._records_content(rows)})
+        return responses
 
     async def _process_standard_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process a standard JSON-RPC request."""
         try:
             # Parse request
             jsonrpc_request = JsonRpcRequest.from_dict(request)
-            # PATCH: alias per compatibilità n8n
-            method_aliases = {
-                "tools/list": "list_tools",
-                "prompts/list": "list_prompts",
-                "resources/templates/list": "list_resource_templates",
-                "resources/list": "list_resources",
-                "resources/read": "get_resource",
-                "notifications/initialized": "handle_notification_initialized",
-                "tools/call": "call_tool",
-            }
-            method = jsonrpc_request.method
-            if method in method_aliases:
-                jsonrpc_request.method = method_aliases[method]
-            # Handle different methods
-            if jsonrpc_request.method == "initialize":
-                return await self._handle_initialize(jsonrpc_request)
-            elif jsonrpc_request.method == "list_resources":
-                return await self._handle_list_resources(jsonrpc_request)
-            elif jsonrpc_request.method == "list_tools":
-                return await self._handle_list_tools(jsonrpc_request)
-            elif jsonrpc_request.method == "list_prompts":
-                return await self._handle_list_prompts(jsonrpc_request)
-            elif jsonrpc_request.method == "get_prompt":
-                return await self._handle_get_prompt(jsonrpc_request)
-            elif jsonrpc_request.method == "list_resource_templates":
-                return await self._handle_list_resource_templates(jsonrpc_request)
-            elif jsonrpc_request.method == "get_resource":
-                return await self._handle_get_resource(jsonrpc_request)
-            elif jsonrpc_request.method == "handle_notification_initialized":
-                return await self._handle_notification_initialized(jsonrpc_request)
-            elif jsonrpc_request.method == "call_tool":
-                # Handle tool calls
-                tool_name = jsonrpc_request.params.get("name")
-                tool_args = jsonrpc_request.params.get("arguments", {})
-
-                if tool_name == "odoo_search_read":
-                    # Get parameters
-                    model = tool_args.get("model")
-                    # Extract domain and fields from arguments array first, then kwargs, then tool_args
-                    arguments = tool_args.get("arguments", [])
-                    kwargs = tool_args.get("kwargs", {})
-
-                    # Check if domain and fields are in arguments array
-                    if arguments and len(arguments) >= 2:
-                        domain = parse_domain(arguments[0])
-                        fields = arguments[1]
-                    else:
-                        # Fall back to kwargs or tool_args
-                        domain = parse_domain(kwargs.get("domain", tool_args.get("domain", [])))
-                        fields = kwargs.get("fields", tool_args.get("fields", ["id", "name"]))
-
-                    limit = kwargs.get("limit", tool_args.get("limit", 100))
-                    offset = kwargs.get("offset", tool_args.get("offset", 0))
-
-                    # Create URI for the list resource
-                    uri = f"odoo://{model}/list"
-
-                    # Get resource with search parameters
-                    resource = await self._handle_odoo_record_list(
-                        uri=uri,
-                        model=model,
-                        domain=domain,
-                        fields=fields,
-                        limit=limit,
-                        offset=offset,
-                    )
-                    # Trasforma ogni record in formato compatibile con n8n/langchain
-                    records = resource.content if isinstance(resource.content, (list, dict)) else str(resource.content)
-
-                    # Converti in formato n8n/langchain come negli altri tool
-                    if isinstance(records, dict):
-                        # Converti singolo dict in formato n8n
-                        content = [{"type": "text", "text": json.dumps(records, default=str)}]
-                    elif isinstance(records, list):
-                        # Converti lista di dict in formato n8n
-                        content = []
-                        if records:  # Se la lista non è vuota
-                            for item in records:
-                                if isinstance(item, dict):
-                                    content.append({"type": "text", "text": json.dumps(item, default=str)})
-                                else:
-                                    content.append({"type": "text", "text": str(item)})
-                        else:  # Se la lista è vuota, restituisci un messaggio informativo
-                            content = [{"type": "text", "text": "Nessun record trovato"}]
-                    else:
-                        # Converti altro in formato n8n
-                        content = [{"type": "text", "text": str(records)}]
-
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo_read":
-                    model = tool_args.get("model")
-                    # Extract parameters from args and kwargs
-                    args = tool_args.get("args", [])
-                    kwargs = tool_args.get("kwargs", {})
-                    ids = args[0] if args else tool_args.get("ids", [])
-                    # For read, fields are in args[1], not in kwargs
-                    fields = (
-                        args[1] if len(args) > 1 else (kwargs.get("fields", tool_args.get("fields", ["id", "name"])))
-                    )
-                    records = await self.pool.execute_kw(model=model, method="read", args=[ids, fields], kwargs={})
-                    # Trasforma in formato compatibile come negli altri tool
-                    if isinstance(records, dict):
-                        # Converti singolo dict in formato n8n
-                        content = [{"type": "text", "text": json.dumps(records, default=str)}]
-                    elif isinstance(records, list):
-                        # Converti lista di dict in formato n8n
-                        content = []
-                        if records:  # Se la lista non è vuota
-                            for item in records:
-                                if isinstance(item, dict):
-                                    content.append({"type": "text", "text": json.dumps(item, default=str)})
-                                else:
-                                    content.append({"type": "text", "text": str(item)})
-                        else:  # Se la lista è vuota, restituisci un messaggio informativo
-                            content = [{"type": "text", "text": "Nessun record trovato"}]
-                    else:
-                        # Converti altro in formato n8n
-                        content = [{"type": "text", "text": str(records)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo_write":
-                    model = tool_args.get("model")
-                    # Extract parameters from args and kwargs
-                    args = tool_args.get("args", [])
-                    kwargs = tool_args.get("kwargs", {})
-                    ids = args[0] if args else tool_args.get("ids", [])
-                    # For write, values are in args[1], not in kwargs
-                    values = args[1] if len(args) > 1 else (kwargs if kwargs else tool_args.get("values", {}))
-                    result = await self.pool.execute_kw(model=model, method="write", args=[ids, values], kwargs={})
-                    # result può essere bool o lista, gestiamo entrambi
-                    if isinstance(result, dict):
-                        # Converti singolo dict in formato n8n
-                        content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    elif isinstance(result, list):
-                        # Converti lista di dict in formato n8n
-                        content = []
-                        if result:  # Se la lista non è vuota
-                            for item in result:
-                                if isinstance(item, dict):
-                                    content.append({"type": "text", "text": json.dumps(item, default=str)})
-                                else:
-                                    content.append({"type": "text", "text": str(item)})
-                        else:  # Se la lista è vuota, restituisci un messaggio informativo
-                            content = [{"type": "text", "text": "Nessun record trovato"}]
-                    else:
-                        # Converti altro in formato n8n
-                        content = [{"type": "text", "text": str(result)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                # ORM Tools handlers
-                elif tool_name == "odoo.schema.version":
-                    result = await self.orm_tools.schema_version()
-                    content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo.schema.models":
-                    with_access = tool_args.get("with_access", True)
-                    result = await self.orm_tools.schema_models(with_access)
-                    content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo.schema.fields":
-                    model = tool_args.get("model")
-                    result = await self.orm_tools.schema_fields(model)
-                    content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo.domain.validate":
-                    model = tool_args.get("model")
-                    domain_json = tool_args.get("domain_json")
-                    result = await self.orm_tools.domain_validate(model, domain_json)
-                    content = [{"type": "text", "text": json.dumps(result.dict(), default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo.search_read":
-                    model = tool_args.get("model")
-                    domain_json = tool_args.get("domain_json")
-                    fields = tool_args.get("fields")
-                    limit = tool_args.get("limit", 50)
-                    offset = tool_args.get("offset", 0)
-                    order = tool_args.get("order")
-                    result = await self.orm_tools.search_read(model, domain_json, fields, limit, offset, order)
-                    content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo.name_search":
-                    model = tool_args.get("model")
-                    name = tool_args.get("name")
-                    operator = tool_args.get("operator", "ilike")
-                    limit = tool_args.get("limit", 10)
-                    result = await self.orm_tools.name_search(model, name, operator, limit)
-                    content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo.read":
-                    model = tool_args.get("model")
-                    record_ids = tool_args.get("record_ids")
-                    fields = tool_args.get("fields")
-                    result = await self.orm_tools.read(model, record_ids, fields)
-                    content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo.create":
-                    model = tool_args.get("model")
-                    values = tool_args.get("values")
-                    operation_id = tool_args.get("operation_id")
-                    result = await self.orm_tools.create(model, values, operation_id)
-                    content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo.write":
-                    model = tool_args.get("model")
-                    record_ids = tool_args.get("record_ids")
-                    values = tool_args.get("values")
-                    operation_id = tool_args.get("operation_id")
-                    result = await self.orm_tools.write(model, record_ids, values, operation_id)
-                    content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo.actions.next_steps":
-                    model = tool_args.get("model")
-                    record_id = tool_args.get("record_id")
-                    result = await self.orm_tools.actions_next_steps(model, record_id)
-                    content = [{"type": "text", "text": json.dumps(result.dict(), default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo.actions.call":
-                    model = tool_args.get("model")
-                    record_id = tool_args.get("record_id")
-                    method = tool_args.get("method")
-                    parameters = tool_args.get("parameters")
-                    operation_id = tool_args.get("operation_id")
-                    result = await self.orm_tools.actions_call(model, record_id, method, parameters, operation_id)
-                    content = [{"type": "text", "text": json.dumps(result.dict(), default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo.picklists":
-                    model = tool_args.get("model")
-                    field = tool_args.get("field")
-                    limit = tool_args.get("limit", 100)
-                    result = await self.orm_tools.picklists(model, field, limit)
-                    content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo_unlink":
-                    model = tool_args.get("model")
-                    # Extract parameters from args
-                    args = tool_args.get("args", [])
-                    ids = args[0] if args else tool_args.get("ids", [])
-                    result = await self.pool.execute_kw(model=model, method="unlink", args=[ids], kwargs={})
-                    if isinstance(result, dict):
-                        # Converti singolo dict in formato n8n
-                        content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    elif isinstance(result, list):
-                        # Converti lista di dict in formato n8n
-                        content = []
-                        if result:  # Se la lista non è vuota
-                            for item in result:
-                                if isinstance(item, dict):
-                                    content.append({"type": "text", "text": json.dumps(item, default=str)})
-                                else:
-                                    content.append({"type": "text", "text": str(item)})
-                        else:  # Se la lista è vuota, restituisci un messaggio informativo
-                            content = [{"type": "text", "text": "Nessun record trovato"}]
-                    else:
-                        # Converti altro in formato n8n
-                        content = [{"type": "text", "text": str(result)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo_call_method":
-                    model = tool_args.get("model")
-                    # Extract method from tool_args or kwargs
-                    method = tool_args.get("method")
-                    if not method:
-                        # Try to get method from kwargs
-                        kwargs = tool_args.get("kwargs", {})
-                        method = kwargs.get("method")
-
-                    # Extract parameters from args and kwargs
-                    args = tool_args.get("args", [])
-                    kwargs = tool_args.get("kwargs", {})
-
-                    # For call_method, we need to handle different cases:
-                    if method == "search_read":
-                        # For search_read method: domain and fields can come from args or kwargs
-                        if args and len(args) >= 2:
-                            # Parameters in args: args[0] = domain, args[1] = fields
-                            domain = parse_domain(args[0])
-                            fields = args[1]
-                        else:
-                            # Parameters in kwargs
-                            domain = parse_domain(kwargs.get("domain", []))
-                            fields = kwargs.get("fields", ["id", "name"])
-                        # Additional validation to ensure domain is a valid list
-                        if not isinstance(domain, list):
-                            logger.error(
-                                f"Invalid domain type for search_read: {type(domain)}. " f"Converting to empty list."
-                            )
-                            domain = []
-                        method_args = [domain, fields]
-                        method_kwargs = {}
-                    elif method == "read":
-                        # For read method: args[0] = IDs, args[1] = fields
-                        ids = args[0] if args else []
-                        fields = args[1] if len(args) > 1 else ["id", "name"]
-                        method_args = [ids, fields]
-                        method_kwargs = kwargs if kwargs else {}
-                    elif method == "write":
-                        # For write method: args[0] = IDs, args[1] = values
-                        ids = args[0] if args else []
-                        values = args[1] if len(args) > 1 else {}
-                        method_args = [ids, values]  # IDs and values as positional arguments
-                        method_kwargs = {}
-                    elif method == "unlink":
-                        # For unlink method: args[0] contains IDs
-                        ids = args[0] if args else []
-                        method_args = [ids]  # IDs as first argument
-                        method_kwargs = {}
-                    elif method == "fields_get":
-                        # For fields_get method: no IDs needed, only optional kwargs like 'attributes', 'allfields'
-                        # Remove 'fields' from kwargs if present, as it's not valid for fields_get
-                        method_kwargs = {}
-                        if kwargs:
-                            # Only pass valid kwargs for fields_get
-                            valid_kwargs = ["attributes", "allfields"]
-                            for key, value in kwargs.items():
-                                if key in valid_kwargs:
-                                    method_kwargs[key] = value
-                        method_args = []
-                    elif method == "search":
-                        # For search method: args[0] = domain, optional kwargs like 'offset', 'limit', 'order'
-                        domain = parse_domain(args[0] if args else [])
-                        # Additional validation to ensure domain is a valid list
-                        if not isinstance(domain, list):
-                            logger.error(
-                                f"Invalid domain type for search: {type(domain)}. " f"Converting to empty list."
-                            )
-                            domain = []
-                        method_args = [domain]
-                        method_kwargs = {}
-                        if kwargs:
-                            # Only pass valid kwargs for search
-                            valid_kwargs = ["offset", "limit", "order", "count"]
-                            for key, value in kwargs.items():
-                                if key in valid_kwargs:
-                                    method_kwargs[key] = value
-                    elif method == "search_count":
-                        # For search_count method: args[0] = domain
-                        domain = parse_domain(args[0] if args else [])
-                        # Additional validation to ensure domain is a valid list
-                        if not isinstance(domain, list):
-                            logger.error(
-                                f"Invalid domain type for search_count: {type(domain)}. " f"Converting to empty list."
-                            )
-                            domain = []
-                        method_args = [domain]
-                        method_kwargs = {}
-                    elif method == "default_get":
-                        # For default_get method: args[0] = fields list, optional kwargs
-                        fields = args[0] if args else []
-                        method_args = [fields]
-                        method_kwargs = {}
-                        if kwargs:
-                            # Only pass valid kwargs for default_get
-                            valid_kwargs = ["context"]
-                            for key, value in kwargs.items():
-                                if key in valid_kwargs:
-                                    method_kwargs[key] = value
-                    elif method == "read_group":
-                        # For read_group method: args[0] = domain, args[1] = fields, args[2] = groupby
-                        # Optional kwargs: limit, offset, orderby, lazy
-                        domain = parse_domain(args[0] if args else [])
-                        fields = args[1] if len(args) > 1 else []
-                        groupby = args[2] if len(args) > 2 else []
-                        # Additional validation to ensure domain is a valid list
-                        if not isinstance(domain, list):
-                            logger.error(
-                                f"Invalid domain type for read_group: {type(domain)}. " f"Converting to empty list."
-                            )
-                            domain = []
-                        method_args = [domain, fields, groupby]
-                        method_kwargs = {}
-                        if kwargs:
-                            # Only pass valid kwargs for read_group
-                            valid_kwargs = ["limit", "offset", "orderby", "lazy"]
-                            for key, value in kwargs.items():
-                                if key in valid_kwargs:
-                                    method_kwargs[key] = value
-                    elif method == "create":
-                        # For create method: values can come from args[0] or kwargs.values
-                        if args and len(args) > 0:
-                            values = args[0]
-                        elif kwargs and "values" in kwargs:
-                            values = kwargs["values"]
-                        else:
-                            values = {}
-                        method_args = [values]
-                        method_kwargs = {}
-                    else:
-                        # For other methods, args[0] = IDs, args[1:] = additional method args
-                        ids = args[0] if args else []
-                        additional_args = args[1:] if len(args) > 1 else []
-                        method_args = [ids] + additional_args
-                        method_kwargs = kwargs if kwargs else {}
-
-                    result = await self.pool.execute_kw(
-                        model=model, method=method, args=method_args, kwargs=method_kwargs
-                    )
-                    # Se il risultato è una lista di dict, trasforma
-                    if isinstance(result, dict):
-                        # Converti singolo dict in formato n8n
-                        content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    elif isinstance(result, list):
-                        # Converti lista di dict in formato n8n
-                        content = []
-                        if result:  # Se la lista non è vuota
-                            for item in result:
-                                if isinstance(item, dict):
-                                    content.append({"type": "text", "text": json.dumps(item, default=str)})
-                                else:
-                                    content.append({"type": "text", "text": str(item)})
-                        else:  # Se la lista è vuota, restituisci un messaggio informativo
-                            content = [{"type": "text", "text": "Nessun record trovato"}]
-                    else:
-                        # Converti altro in formato n8n
-                        content = [{"type": "text", "text": str(result)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo_execute_kw":
-                    model = tool_args.get("model")
-                    # Extract method from tool_args or kwargs
-                    method = tool_args.get("method")
-                    if not method:
-                        # Try to get method from kwargs
-                        kwargs_ = tool_args.get("kwargs", {})
-                        method = kwargs_.get("method")
-
-                    # Extract parameters from args and kwargs
-                    args = tool_args.get("args", [])
-                    kwargs_ = tool_args.get("kwargs", {})
-
-                    # For execute_kw, we need to handle different cases:
-                    if method == "search_read":
-                        # For search_read method: domain and fields can come from args or kwargs
-                        if args and len(args) >= 2:
-                            # Parameters in args: args[0] = domain, args[1] = fields
-                            domain = parse_domain(args[0])
-                            fields = args[1]
-                        else:
-                            # Parameters in kwargs
-                            domain = parse_domain(kwargs_.get("domain", []))
-                            fields = kwargs_.get("fields", ["id", "name"])
-                        # Additional validation to ensure domain is a valid list
-                        if not isinstance(domain, list):
-                            logger.error(
-                                f"Invalid domain type for search_read: {type(domain)}. " f"Converting to empty list."
-                            )
-                            domain = []
-                        method_args = [domain, fields]
-                        method_kwargs = {}
-                    elif method == "read":
-                        # For read method: args[0] = IDs, args[1] = fields
-                        ids = args[0] if args else []
-                        fields = args[1] if len(args) > 1 else ["id", "name"]
-                        method_args = [ids, fields]
-                        method_kwargs = kwargs_ if kwargs_ else {}
-                    elif method == "write":
-                        # For write method: args[0] = IDs, args[1] = values
-                        ids = args[0] if args else []
-                        values = args[1] if len(args) > 1 else {}
-                        method_args = [ids, values]  # IDs and values as positional arguments
-                        method_kwargs = {}
-                    elif method == "unlink":
-                        # For unlink method: args[0] contains IDs
-                        ids = args[0] if args else []
-                        method_args = [ids]  # IDs as first argument
-                        method_kwargs = {}
-                    elif method == "fields_get":
-                        # For fields_get method: no IDs needed, only optional kwargs like 'attributes', 'allfields'
-                        # Remove 'fields' from kwargs if present, as it's not valid for fields_get
-                        method_kwargs = {}
-                        if kwargs_:
-                            # Only pass valid kwargs for fields_get
-                            valid_kwargs = ["attributes", "allfields"]
-                            for key, value in kwargs_.items():
-                                if key in valid_kwargs:
-                                    method_kwargs[key] = value
-                        method_args = []
-                    elif method == "search":
-                        # For search method: args[0] = domain, optional kwargs like 'offset', 'limit', 'order'
-                        domain = parse_domain(args[0] if args else [])
-                        # Additional validation to ensure domain is a valid list
-                        if not isinstance(domain, list):
-                            logger.error(
-                                f"Invalid domain type for search: {type(domain)}. " f"Converting to empty list."
-                            )
-                            domain = []
-                        method_args = [domain]
-                        method_kwargs = {}
-                        if kwargs:
-                            # Only pass valid kwargs for search
-                            valid_kwargs = ["offset", "limit", "order", "count"]
-                            for key, value in kwargs.items():
-                                if key in valid_kwargs:
-                                    method_kwargs[key] = value
-                    elif method == "search_count":
-                        # For search_count method: args[0] = domain
-                        domain = parse_domain(args[0] if args else [])
-                        # Additional validation to ensure domain is a valid list
-                        if not isinstance(domain, list):
-                            logger.error(
-                                f"Invalid domain type for search_count: {type(domain)}. " f"Converting to empty list."
-                            )
-                            domain = []
-                        method_args = [domain]
-                        method_kwargs = {}
-                    elif method == "default_get":
-                        # For default_get method: args[0] = fields list, optional kwargs
-                        fields = args[0] if args else []
-                        method_args = [fields]
-                        method_kwargs = {}
-                        if kwargs_:
-                            # Only pass valid kwargs for default_get
-                            valid_kwargs = ["context"]
-                            for key, value in kwargs_.items():
-                                if key in valid_kwargs:
-                                    method_kwargs[key] = value
-                    elif method == "read_group":
-                        # For read_group method: args[0] = domain, args[1] = fields, args[2] = groupby
-                        # Optional kwargs: limit, offset, orderby, lazy
-                        domain = parse_domain(args[0] if args else [])
-                        fields = args[1] if len(args) > 1 else []
-                        groupby = args[2] if len(args) > 2 else []
-                        # Additional validation to ensure domain is a valid list
-                        if not isinstance(domain, list):
-                            logger.error(
-                                f"Invalid domain type for read_group: {type(domain)}. " f"Converting to empty list."
-                            )
-                            domain = []
-                        method_args = [domain, fields, groupby]
-                        method_kwargs = {}
-                        if kwargs:
-                            # Only pass valid kwargs for read_group
-                            valid_kwargs = ["limit", "offset", "orderby", "lazy"]
-                            for key, value in kwargs.items():
-                                if key in valid_kwargs:
-                                    method_kwargs[key] = value
-                    elif method == "create":
-                        # For create method: values can come from args[0] or kwargs.values
-                        if args and len(args) > 0:
-                            values = args[0]
-                        elif kwargs and "values" in kwargs:
-                            values = kwargs["values"]
-                        else:
-                            values = {}
-                        method_args = [values]
-                        method_kwargs = {}
-                    else:
-                        # For other methods, args[0] = IDs, args[1:] = additional method args
-                        ids = args[0] if args else []
-                        additional_args = args[1:] if len(args) > 1 else []
-                        method_args = [ids] + additional_args
-                        method_kwargs = kwargs_ if kwargs_ else {}
-
-                    result = await self.pool.execute_kw(
-                        model=model, method=method, args=method_args, kwargs=method_kwargs
-                    )
-                    if isinstance(result, dict):
-                        # Converti singolo dict in formato n8n
-                        content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    elif isinstance(result, list):
-                        # Converti lista di dict in formato n8n
-                        content = []
-                        if result:  # Se la lista non è vuota
-                            for item in result:
-                                if isinstance(item, dict):
-                                    content.append({"type": "text", "text": json.dumps(item, default=str)})
-                                else:
-                                    content.append({"type": "text", "text": str(item)})
-                        else:  # Se la lista è vuota, restituisci un messaggio informativo
-                            content = [{"type": "text", "text": "Nessun record trovato"}]
-                    else:
-                        # Converti altro in formato n8n
-                        content = [{"type": "text", "text": str(result)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name == "odoo_create":
-                    model = tool_args.get("model")
-                    # Extract parameters from arguments array first, then args, then kwargs, then tool_args
-                    arguments = tool_args.get("arguments", [])
-                    args = tool_args.get("args", [])
-                    kwargs = tool_args.get("kwargs", {})
-
-                    # Check if values are in arguments array
-                    if arguments and len(arguments) > 0:
-                        values = arguments[0]
-                    elif args and len(args) > 0:
-                        values = args[0]
-                    elif kwargs and "values" in kwargs:
-                        values = kwargs["values"]
-                    elif kwargs:
-                        # If kwargs doesn't have a "values" key, use the entire kwargs as values
-                        values = kwargs
-                    else:
-                        values = tool_args.get("values", {})
-
-                    result = await self.pool.execute_kw(model=model, method="create", args=[values], kwargs={})
-                    if isinstance(result, dict):
-                        # Converti singolo dict in formato n8n
-                        content = [{"type": "text", "text": json.dumps(result, default=str)}]
-                    elif isinstance(result, list):
-                        # Converti lista di dict in formato n8n
-                        content = []
-                        if result:  # Se la lista non è vuota
-                            for item in result:
-                                if isinstance(item, dict):
-                                    content.append({"type": "text", "text": json.dumps(item, default=str)})
-                                else:
-                                    content.append({"type": "text", "text": str(item)})
-                        else:  # Se la lista è vuota, restituisci un messaggio informativo
-                            content = [{"type": "text", "text": "Nessun record trovato"}]
-                    else:
-                        # Converti altro in formato n8n
-                        content = [{"type": "text", "text": str(result)}]
-                    return {
-                        "jsonrpc": "2.0",
-                        "result": {"content": content},
-                        "id": jsonrpc_request.id,
-                    }
-                elif tool_name in ["data_export", "data_import", "report_generator"]:
-                    return {
-                        "jsonrpc": "2.0",
-                        "error": {
-                            "code": -32001,
-                            "message": f"Tool '{tool_name}' not implemented yet.",
-                        },
-                        "id": jsonrpc_request.id,
-                    }
-                else:
-                    raise ProtocolError(f"Unknown tool: {tool_name}")
-            else:
+            handler = self._method_handlers.get(jsonrpc_request.method)
+            if handler is None:
                 raise ProtocolError(f"Unknown method: {jsonrpc_request.method}")
+            return await handler(jsonrpc_request)
         except Exception as e:
             logger.error(f"Error processing request: {str(e)}")
-            return {
-                "jsonrpc": "2.0",
-                "error": {"code": -32603, "message": str(e)},
-                "id": request.get("id"),
-            }
+            return _err(request.get("id"), -32603, str(e))
+
+    async def _handle_call_tool(self, jsonrpc_request: JsonRpcRequest) -> Dict[str, Any]:
+        """Handle call_tool request."""
+        # Handle tool calls
+        tool_name = jsonrpc_request.params.get("name")
+        tool_args = jsonrpc_request.params.get("arguments") or _EMPTY
+
+        handler = self._tool_handlers.get(tool_name)
+        if handler is not None:
+            if not isinstance(tool_args, dict):
+                return _ok(jsonrpc_request.id, {"content": await handler(tool_args)})
+            model = tool_args.get("model")
+            if not self._is_read_only_tool_call(tool_name, tool_args):
+                content = await handler(tool_args)
+                # Cached resources and tool results of the model may be stale now
+                self._invalidate_model(model)
+                return _ok(jsonrpc_request.id, {"content": content})
+            key = self._tool_cache_key(tool_name, model, tool_args)
+            content = self._cached_tool_result(key)
+            if content is None:
+                content = await handler(tool_args)
+                self._cache_tool_result(key, content)
+            return _ok(jsonrpc_request.id, {"content": content})
+        elif tool_name in _UNIMPLEMENTED_TOOLS:
+            return _err(jsonrpc_request.id, -32001, f"Tool '{tool_name}' not implemented yet.")
+        else:
+            raise ProtocolError(f"Unknown tool: {tool_name}")
+
+    def _tool_cache_key(
+        self, tool_name: str, model: Optional[str], tool_args: Dict[str, Any]
+    ) -> Optional[Tuple[Any, ...]]:
+        """Build the result cache key of a read-only tool call, or None if it cannot be cached."""
+        if self._tool_cache_ttl <= 0 or tool_name not in _CACHEABLE_TOOLS:
+            return None
+        try:
+            return (self._tool_cache_login, model, tool_name, _freeze(tool_args))
+        except TypeError:
+            return None
+
+    def _cached_tool_result(self, key: Optional[Tuple[Any, ...]]) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached content of a read-only tool call if it has not expired."""
+        if key is None:
+            return None
+        cached = self._tool_cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= self._tool_cache_ttl:
+            del self._tool_cache[key]
+            return None
+        self._tool_cache.move_to_end(key)
+        return cached[1]
+
+    def _cache_tool_result(self, key: Optional[Tuple[Any, ...]], content: List[Dict[str, Any]]) -> None:
+        """Store the content of a read-only tool call, evicting the least recently used entries."""
+        if key is None:
+            return
+        self._tool_cache[key] = (time.monotonic(), content)
+        self._tool_cache.move_to_end(key)
+        while len(self._tool_cache) > self._tool_cache_max_size:
+            self._tool_cache.popitem(last=False)
+
+    def _invalidate_model(self, model: Optional[str]) -> None:
+        """Drop cached resources and tool results after a call that may have modified a model."""
+        # Writes have side effects on other models (e.g. action_confirm creates pickings and invoices),
+        # so no cached tool result survives; the cache is small enough to rebuild
+        self._tool_cache.clear()
+        if model:
+            self.resource_manager.invalidate_model(model)
+
+    @staticmethod
+    def _is_read_only_tool_call(tool_name: str, tool_args: Dict[str, Any]) -> bool:
+        """Return True if a tool call cannot modify Odoo data."""
+        if tool_name in ("odoo_call_method", "odoo_execute_kw"):
+            method = tool_args.get("method") or (tool_args.get("kwargs") or {}).get("method")
+            return method in BaseOdooHandler.READ_METHODS
+        return tool_name in _READ_ONLY_TOOLS
+
+    @staticmethod
+    def _records_content(records: Any) -> List[Dict[str, Any]]:
+        """Convert an Odoo result to n8n/langchain compatible text content, one entry per record."""
+        if isinstance(records, dict):
+            # Converti singolo dict in formato n8n
+            return [{"type": "text", "text": json_dumps(records, default=str)}]
+        if isinstance(records, list):
+            if not records:
+                # Se la lista è vuota, restituisci un messaggio informativo
+                return [{"type": "text", "text": "Nessun record trovato"}]
+            # Converti lista di dict in formato n8n
+            return [
+                {"type": "text", "text": json_dumps(item, default=str) if isinstance(item, dict) else str(item)}
+                for item in records
+            ]
+        # Converti altro in formato n8n
+        return [{"type": "text", "text": str(records)}]
+
+    @staticmethod
+    def _json_content(result: Any) -> List[Dict[str, Any]]:
+        """Wrap a tool result as a single JSON text content entry."""
+        return [{"type": "text", "text": json_dumps(result, default=str)}]
+
+    async def _tool_odoo_search_read(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo_search_read tool."""
+        # Get parameters
+        model = tool_args.get("model")
+        # Extract domain and fields from arguments array first, then kwargs, then tool_args
+        arguments = tool_args.get("arguments", [])
+        kwargs = tool_args.get("kwargs") or _EMPTY
+
+        # Check if domain and fields are in arguments array
+        if arguments and len(arguments) >= 2:
+            domain = parse_domain(arguments[0])
+            fields = arguments[1]
+        else:
+            # Fall back to kwargs or tool_args
+            domain = parse_domain(kwargs.get("domain", tool_args.get("domain", [])))
+            fields = kwargs.get("fields", tool_args.get("fields", ["id", "name"]))
+
+        limit = kwargs.get("limit", tool_args.get("limit", 100))
+        offset = kwargs.get("offset", tool_args.get("offset", 0))
+
+        # Create URI for the list resource
+        uri = f"odoo://{model}/list"
+
+        # Get resource with search parameters
+        resource = await self._handle_odoo_record_list(
+            uri=uri,
+            model=model,
+            domain=domain,
+            fields=fields,
+            limit=limit,
+            offset=offset,
+        )
+        # Trasforma ogni record in formato compatibile con n8n/langchain
+        records = resource.content if isinstance(resource.content, (list, dict)) else str(resource.content)
+        return self._records_content(records)
+
+    @staticmethod
+    def _odoo_read_args(tool_args: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+        """Extract (model, ids, fields) from odoo_read tool arguments."""
+        model = tool_args.get("model")
+        # Extract parameters from args and kwargs
+        args = tool_args.get("args", [])
+        kwargs = tool_args.get("kwargs") or _EMPTY
+        ids = args[0] if args else tool_args.get("ids", [])
+        # For read, fields are in args[1], not in kwargs
+        fields = args[1] if len(args) > 1 else (kwargs.get("fields", tool_args.get("fields", ["id", "name"])))
+        return model, ids, fields
+
+    async def _tool_odoo_read(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo_read tool."""
+        model, ids, fields = self._odoo_read_args(tool_args)
+        records = await self.pool.execute_kw(model=model, method="read", args=[ids, fields], kwargs={})
+        return self._records_content(records)
+
+    async def _tool_odoo_write(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo_write tool."""
+        model = tool_args.get("model")
+        # Extract parameters from args and kwargs
+        args = tool_args.get("args", [])
+        kwargs = tool_args.get("kwargs") or _EMPTY
+        ids = args[0] if args else tool_args.get("ids", [])
+        # For write, values are in args[1], not in kwargs
+        values = args[1] if len(args) > 1 else (kwargs if kwargs else tool_args.get("values", {}))
+        result = await self.pool.execute_kw(model=model, method="write", args=[ids, values], kwargs={})
+        # result può essere bool o lista, gestiamo entrambi
+        return self._records_content(result)
+
+    async def _tool_odoo_unlink(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo_unlink tool."""
+        model = tool_args.get("model")
+        # Extract parameters from args
+        args = tool_args.get("args", [])
+        ids = args[0] if args else tool_args.get("ids", [])
+        result = await self.pool.execute_kw(model=model, method="unlink", args=[ids], kwargs={})
+        return self._records_content(result)
+
+    async def _tool_odoo_create(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo_create tool."""
+        model = tool_args.get("model")
+        # Extract parameters from arguments array first, then args, then kwargs, then tool_args
+        arguments = tool_args.get("arguments", [])
+        args = tool_args.get("args", [])
+        kwargs = tool_args.get("kwargs") or _EMPTY
+
+        # Check if values are in arguments array
+        if arguments and len(arguments) > 0:
+            values = arguments[0]
+        elif args and len(args) > 0:
+            values = args[0]
+        elif kwargs and "values" in kwargs:
+            values = kwargs["values"]
+        elif kwargs:
+            # If kwargs doesn't have a "values" key, use the entire kwargs as values
+            values = kwargs
+        else:
+            values = tool_args.get("values", {})
+
+        result = await self.pool.execute_kw(model=model, method="create", args=[values], kwargs={})
+        return self._records_content(result)
+
+    async def _tool_odoo_call_method(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo_call_method and odoo_execute_kw tools."""
+        model = tool_args.get("model")
+        # Extract parameters from args and kwargs
+        args = tool_args.get("args", [])
+        kwargs = tool_args.get("kwargs") or _EMPTY
+        # Extract method from tool_args or kwargs
+        method = tool_args.get("method") or kwargs.get("method")
+
+        method_args, method_kwargs = self._call_method_args(method, args, kwargs)
+        result = await self.pool.execute_kw(model=model, method=method, args=method_args, kwargs=method_kwargs)
+        # Se il risultato è una lista di dict, trasforma
+        return self._records_content(result)
+
+    @staticmethod
+    def _call_method_args(method: str, args: List[Any], kwargs: Dict[str, Any]) -> Tuple[List[Any], Dict[str, Any]]:
+        """Map generic tool args/kwargs to the positional and keyword arguments expected by an Odoo method."""
+        kwargs = kwargs or {}
+        # For call_method, we need to handle different cases:
+        if method == "search_read":
+            # For search_read method: domain and fields can come from args or kwargs
+            if args and len(args) >= 2:
+                # Parameters in args: args[0] = domain, args[1] = fields
+                domain = parse_domain(args[0])
+                fields = args[1]
+            else:
+                # Parameters in kwargs
+                domain = parse_domain(kwargs.get("domain", []))
+                fields = kwargs.get("fields", ["id", "name"])
+            # Additional validation to ensure domain is a valid list
+            if not isinstance(domain, list):
+                logger.error(f"Invalid domain type for search_read: {type(domain)}. " f"Converting to empty list.")
+                domain = []
+            method_args = [domain, fields]
+            method_kwargs = {}
+        elif method == "read":
+            # For read method: args[0] = IDs, args[1] = fields
+            ids = args[0] if args else []
+            fields = args[1] if len(args) > 1 else ["id", "name"]
+            method_args = [ids, fields]
+            method_kwargs = kwargs if kwargs else {}
+        elif method == "write":
+            # For write method: args[0] = IDs, args[1] = values
+            ids = args[0] if args else []
+            values = args[1] if len(args) > 1 else {}
+            method_args = [ids, values]  # IDs and values as positional arguments
+            method_kwargs = {}
+        elif method == "unlink":
+            # For unlink method: args[0] contains IDs
+            ids = args[0] if args else []
+            method_args = [ids]  # IDs as first argument
+            method_kwargs = {}
+        elif method == "fields_get":
+            # For fields_get method: no IDs needed, only optional kwargs like 'attributes', 'allfields'
+            # Remove 'fields' from kwargs if present, as it's not valid for fields_get
+            # Only pass valid kwargs for fields_get
+            method_kwargs = {key: value for key, value in kwargs.items() if key in _FIELDS_GET_KWARGS}
+            method_args = []
+        elif method == "search":
+            # For search method: args[0] = domain, optional kwargs like 'offset', 'limit', 'order'
+            domain = parse_domain(args[0] if args else [])
+            # Additional validation to ensure domain is a valid list
+            if not isinstance(domain, list):
+                logger.error(f"Invalid domain type for search: {type(domain)}. " f"Converting to empty list.")
+                domain = []
+            method_args = [domain]
+            # Only pass valid kwargs for search
+            method_kwargs = {key: value for key, value in kwargs.items() if key in _SEARCH_KWARGS}
+        elif method == "search_count":
+            # For search_count method: args[0] = domain
+            domain = parse_domain(args[0] if args else [])
+            # Additional validation to ensure domain is a valid list
+            if not isinstance(domain, list):
+                logger.error(f"Invalid domain type for search_count: {type(domain)}. " f"Converting to empty list.")
+                domain = []
+            method_args = [domain]
+            method_kwargs = {}
+        elif method == "default_get":
+            # For default_get method: args[0] = fields list, optional kwargs
+            fields = args[0] if args else []
+            method_args = [fields]
+            # Only pass valid kwargs for default_get
+            method_kwargs = {key: value for key, value in kwargs.items() if key in _DEFAULT_GET_KWARGS}
+        elif method == "read_group":
+            # For read_group method: args[0] = domain, args[1] = fields, args[2] = groupby
+            # Optional kwargs: limit, offset, orderby, lazy
+            domain = parse_domain(args[0] if args else [])
+            fields = args[1] if len(args) > 1 else []
+            groupby = args[2] if len(args) > 2 else []
+            # Additional validation to ensure domain is a valid list
+            if not isinstance(domain, list):
+                logger.error(f"Invalid domain type for read_group: {type(domain)}. " f"Converting to empty list.")
+                domain = []
+            method_args = [domain, fields, groupby]
+            # Only pass valid kwargs for read_group
+            method_kwargs = {key: value for key, value in kwargs.items() if key in _READ_GROUP_KWARGS}
+        elif method == "create":
+            # For create method: values can come from args[0] or kwargs.values
+            if args and len(args) > 0:
+                values = args[0]
+            elif kwargs and "values" in kwargs:
+                values = kwargs["values"]
+            else:
+                values = {}
+            method_args = [values]
+            method_kwargs = {}
+        else:
+            # For other methods, args[0] = IDs, args[1:] = additional method args
+            ids = args[0] if args else []
+            additional_args = args[1:] if len(args) > 1 else []
+            method_args = [ids] + additional_args
+            method_kwargs = kwargs if kwargs else {}
+        return method_args, method_kwargs
+
+    # ORM Tools handlers
+    async def _tool_schema_version(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.schema.version tool."""
+        return self._json_content(await self.orm_tools.schema_version())
+
+    async def _tool_schema_models(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.schema.models tool."""
+        with_access = tool_args.get("with_access", True)
+        return self._json_content(await self.orm_tools.schema_models(with_access))
+
+    async def _tool_schema_fields(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.schema.fields tool."""
+        model = tool_args.get("model")
+        return self._json_content(await self.orm_tools.schema_fields(model))
+
+    async def _tool_domain_validate(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.domain.validate tool."""
+        model = tool_args.get("model")
+        domain_json = tool_args.get("domain_json")
+        result = await self.orm_tools.domain_validate(model, domain_json)
+        return self._json_content(result.dict())
+
+    async def _tool_search_read(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.search_read tool."""
+        model = tool_args.get("model")
+        domain_json = tool_args.get("domain_json")
+        fields = tool_args.get("fields")
+        limit = tool_args.get("limit", 50)
+        offset = tool_args.get("offset", 0)
+        order = tool_args.get("order")
+        return self._json_content(await self.orm_tools.search_read(model, domain_json, fields, limit, offset, order))
+
+    async def _tool_name_search(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.name_search tool."""
+        model = tool_args.get("model")
+        name = tool_args.get("name")
+        operator = tool_args.get("operator", "ilike")
+        limit = tool_args.get("limit", 10)
+        return self._json_content(await self.orm_tools.name_search(model, name, operator, limit))
+
+    async def _tool_read(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.read tool."""
+        model = tool_args.get("model")
+        record_ids = tool_args.get("record_ids")
+        fields = tool_args.get("fields")
+        return self._json_content(await self.orm_tools.read(model, record_ids, fields))
+
+    async def _tool_create(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.create tool."""
+        model = tool_args.get("model")
+        values = tool_args.get("values")
+        operation_id = tool_args.get("operation_id")
+        return self._json_content(await self.orm_tools.create(model, values, operation_id))
+
+    async def _tool_write(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.write tool."""
+        model = tool_args.get("model")
+        record_ids = tool_args.get("record_ids")
+        values = tool_args.get("values")
+        operation_id = tool_args.get("operation_id")
+        return self._json_content(await self.orm_tools.write(model, record_ids, values, operation_id))
+
+    async def _tool_actions_next_steps(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.actions.next_steps tool."""
+        model = tool_args.get("model")
+        record_id = tool_args.get("record_id")
+        result = await self.orm_tools.actions_next_steps(model, record_id)
+        return self._json_content(result.dict())
+
+    async def _tool_actions_call(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.actions.call tool."""
+        model = tool_args.get("model")
+        record_id = tool_args.get("record_id")
+        method = tool_args.get("method")
+        parameters = tool_args.get("parameters")
+        operation_id = tool_args.get("operation_id")
+        result = await self.orm_tools.actions_call(model, record_id, method, parameters, operation_id)
+        return self._json_content(result.dict())
+
+    async def _tool_picklists(self, tool_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run the odoo.picklists tool."""
+        model = tool_args.get("model")
+        field = tool_args.get("field")
+        limit = tool_args.get("limit", 100)
+        return self._json_content(await self.orm_tools.picklists(model, field, limit))
+
+    async def _handle_ping(self, request: JsonRpcRequest) -> Dict[str, Any]:
+        """Handle ping request (MCP keepalive); the result is always empty."""
+        return _ok(request.id, {})
 
     async def _handle_notification_initialized(self, request: JsonRpcRequest) -> Dict[str, Any]:
         """Handle notification initialized request."""
         try:
             logger.info("Received notification initialized request")
-            return {"jsonrpc": "2.0", "result": {"status": "ok"}, "id": request.id}
+            return _ok(request.id, {"status": "ok"})
         except Exception as e:
             logger.error(f"Error handling notification initialized: {e}")
-            return {
-                "jsonrpc": "2.0",
-                "error": {"code": -32603, "message": str(e)},
-                "id": request.id,
-            }
+            return _err(request.id, -32603, str(e))
 
     async def _handle_initialize(self, request: JsonRpcRequest) -> Dict[str, Any]:
         """Handle initialize request."""
@@ -2377,105 +2587,80 @@ class OdooMCPServer(Server):
 
             # Get the client's requested protocol version
             client_version = request.params.get("protocolVersion", PROTOCOL_VERSION)
-            logger.debug(f"Client requested protocol version: {client_version}")
+            logger.debug("Client requested protocol version: %s", client_version)
 
             # Use client's version if it's a supported legacy version
             response_version = client_version if client_version in LEGACY_PROTOCOL_VERSIONS else PROTOCOL_VERSION
-            logger.debug(f"Using protocol version in response: {response_version}")
+            logger.debug("Using protocol version in response: %s", response_version)
 
-            # Create response directly
-            response = {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {
+            # The result only depends on the negotiated version and the registered capabilities
+            result = self._cached_listing(
+                f"initialize:{response_version}",
+                lambda: {
                     "protocolVersion": response_version,
                     "serverInfo": {"name": SERVER_NAME, "version": SERVER_VERSION},
                     "capabilities": server_info.capabilities,
                 },
-            }
+            )
+            response = _ok(request.id, result)
 
-            logger.debug(f"Initializing client with protocol version: {response_version}")
+            logger.debug("Initializing client with protocol version: %s", response_version)
             return response
 
         except Exception as e:
             logger.error(f"Error handling initialize request: {e}")
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "error": {"code": -32603, "message": str(e)},
-            }
+            return _err(request.id, -32603, str(e))
 
     async def _handle_list_resources(self, request: JsonRpcRequest) -> Dict[str, Any]:
         """Handle list_resources request."""
         try:
-            resources = await self.list_resources()
-            # Convert to MCP client format with text or blob
-            resources_list = []
-            for resource in resources:
-                if isinstance(resource.content, (dict, list)):
-                    # For dictionaries and lists, always use text with JSON
-                    content = {"text": json.dumps(resource.content), "blob": None}
-                elif isinstance(resource.content, bytes):
-                    # For binary content, encode as base64
-                    content = {"text": None, "blob": base64.b64encode(resource.content).decode()}
-                else:
-                    # For other types, convert to string
-                    content = {"text": str(resource.content), "blob": None}
-
-                # Extract model name from URI for the name field
-                uri_parts = resource.uri.replace("odoo://", "").split("/")
-                model_name = uri_parts[0] if uri_parts else "unknown"
-
-                resources_list.append(
-                    {
-                        "uri": resource.uri,
-                        "type": resource.type,
-                        "content": resource.content,
-                        "mimeType": resource.mime_type,
-                        "name": model_name,
-                        **content,
-                    }
-                )
-
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {"id": "list", "method": "listResources", "resources": resources_list},
-            }
+            return _ok(request.id, self._cached_listing("resources", self._build_resources_result))
         except Exception as e:
             logger.error(f"Error handling list_resources request: {e}")
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "error": {"code": -32603, "message": str(e)},
-            }
+            return _err(request.id, -32603, str(e))
+
+    def _build_tools_result(self) -> Dict[str, Any]:
+        """Build the list_tools result payload."""
+        return {
+            "tools": [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.parameters,
+                    "inputSchema": tool.inputSchema or {"type": "object", "properties": {}, "required": []},
+                }
+                for tool in self.capabilities_manager.tools.values()
+            ]
+        }
+
+    def _build_resources_result(self) -> Dict[str, Any]:
+        """Build the list_resources result payload."""
+        # Template placeholders carry no content, so the MCP text/blob pair is constant
+        resources_list = []
+        for template in self._resource_templates():
+            uri = template["uriTemplate"]
+            # Extract model name from URI for the name field
+            model_name = uri.replace("odoo://", "").split("/")[0] or "unknown"
+            resources_list.append(
+                {
+                    "uri": uri,
+                    "type": template["type"],
+                    "content": None,
+                    "mimeType": "application/json",
+                    "name": model_name,
+                    "text": str(None),
+                    "blob": None,
+                }
+            )
+        return {"id": "list", "method": "listResources", "resources": resources_list}
 
     async def _handle_list_tools(self, request: JsonRpcRequest) -> Dict[str, Any]:
         """Handle list_tools request."""
         try:
-            tools = await self.list_tools()
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "result": {
-                    "tools": [
-                        {
-                            "name": tool.name,
-                            "description": tool.description,
-                            "parameters": tool.parameters,
-                            "inputSchema": tool.inputSchema or {"type": "object", "properties": {}, "required": []},
-                        }
-                        for tool in tools
-                    ]
-                },
-            }
+            return _ok(request.id, self._cached_listing("tools", self._build_tools_result))
         except Exception as e:
             logger.error(f"Error handling list_tools request: {e}")
-            return {
-                "jsonrpc": "2.0",
-                "id": request.id,
-                "error": {"code": -32603, "message": f"Internal error: {str(e)}"},
-            }
+            return _err(request.id, -32603, f"Internal error: {str(e)}")
 
     async def _handle_get_prompt(self, request: JsonRpcRequest) -> Dict[str, Any]:
         """Handle get_prompt request."""
@@ -2529,56 +2714,66 @@ class OdooMCPServer(Server):
             logger.error(f"Error stopping server: {e}")
             raise
 
+    @staticmethod
+    def _response_dict(response: Any) -> Any:
+        """Convert a process_request result to a JSON-RPC response; dicts, batches and None pass through."""
+        if response is None or isinstance(response, (dict, list)):
+            return response
+        # Build JSON-RPC response dict with only 'result' OR 'error'
+        response_dict = {
+            "jsonrpc": getattr(response, "jsonrpc", "2.0"),
+            "id": getattr(response, "id", None),
+        }
+        error = getattr(response, "error", None)
+        if error is not None:
+            response_dict["error"] = error
+        else:
+            response_dict["result"] = getattr(response, "result", None)
+        return response_dict
+
     async def _handle_request(self, request: Union[web.Request, Dict[str, Any]]) -> Union[web.Response, Dict[str, Any]]:
         """Handle incoming requests."""
+        # A web.Request implies aiohttp.web was imported by the HTTP transport
+        web = sys.modules.get("aiohttp.web")
+        is_http = web is not None and isinstance(request, web.Request)
         try:
-            if isinstance(request, web.Request):
+            if is_http:
                 # Handle HTTP request
-                data = await request.json()
+                data = json_loads(await request.read())
                 logger.debug("Received HTTP request data")
                 response = await self.process_request(data)
-                logger.debug(f"Got response from process_request: {response}")
-                logger.debug(f"Response type: {type(response)}")
-                logger.debug(f"Response attributes: {dir(response)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Got response from process_request: %s", response)
+                    logger.debug("Response type: %s", type(response))
+                    logger.debug("Response attributes: %s", dir(response))
                 try:
-                    # Build JSON-RPC response dict with only 'result' OR 'error'
-                    response_dict = {
-                        "jsonrpc": getattr(response, "jsonrpc", "2.0"),
-                        "id": getattr(response, "id", None),
-                    }
-                    error = getattr(response, "error", None)
-                    if error is not None:
-                        response_dict["error"] = error
-                    else:
-                        response_dict["result"] = getattr(response, "result", None)
-                    logger.debug(f"Converted response dict: {response_dict}")
-                    return web.json_response(response_dict)
+                    response_dict = self._response_dict(response)
+                    logger.debug("Converted response dict: %s", response_dict)
+                    if response_dict is None:
+                        # Notifications only: MCP streamable HTTP acknowledges them with 202 and no body
+                        return web.Response(status=202)
+                    return web.Response(
+                        body=dumps_response_bytes(response_dict), content_type="application/json", charset="utf-8"
+                    )
                 except Exception as e:
                     logger.error(f"Error converting response to dict: {e}")
                     logger.exception("Full traceback for conversion error:")
                     return web.json_response(
                         {"error": f"Error converting response: {str(e)}", "status": "error"},
                         status=500,
+                        dumps=json_dumps,
                     )
             else:
                 # Handle stdio request
                 logger.debug("Received stdio request")
                 response = await self.process_request(request)
-                logger.debug(f"Got response from process_request: {response}")
-                logger.debug(f"Response type: {type(response)}")
-                logger.debug(f"Response attributes: {dir(response)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Got response from process_request: %s", response)
+                    logger.debug("Response type: %s", type(response))
+                    logger.debug("Response attributes: %s", dir(response))
                 try:
-                    # Build JSON-RPC response dict with only 'result' OR 'error'
-                    response_dict = {
-                        "jsonrpc": getattr(response, "jsonrpc", "2.0"),
-                        "id": getattr(response, "id", None),
-                    }
-                    error = getattr(response, "error", None)
-                    if error is not None:
-                        response_dict["error"] = error
-                    else:
-                        response_dict["result"] = getattr(response, "result", None)
-                    logger.debug(f"Converted response dict: {response_dict}")
+                    response_dict = self._response_dict(response)
+                    logger.debug("Converted response dict: %s", response_dict)
                     return response_dict
                 except Exception as e:
                     logger.error(f"Error converting response to dict: {e}")
@@ -2587,24 +2782,71 @@ class OdooMCPServer(Server):
         except Exception as e:
             logger.error(f"Error handling request: {e}")
             logger.exception("Full traceback for request handling error:")
-            if isinstance(request, web.Request):
-                return web.json_response({"error": str(e), "status": "error"}, status=500)
+            if is_http:
+                return web.json_response({"error": str(e), "status": "error"}, status=500, dumps=json_dumps)
             else:
                 return {"error": str(e), "status": "error"}
 
 
-def run_async(coro):
+# Long-lived event loop used to run coroutines from synchronous code
+_BRIDGE_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BRIDGE_THREAD: Optional[threading.Thread] = None
+_BRIDGE_LOCK = threading.Lock()
+
+
+def _get_bridge_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared bridge event loop, starting its daemon thread on first use."""
+    global _BRIDGE_LOOP, _BRIDGE_THREAD
+    if _BRIDGE_LOOP is None:
+        with _BRIDGE_LOCK:
+            if _BRIDGE_LOOP is None:
+                loop = _new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="odoo-mcp-bridge-loop", daemon=True)
+                thread.start()
+                _BRIDGE_THREAD = thread
+                _BRIDGE_LOOP = loop
+                atexit.register(_stop_bridge_loop)
+    return _BRIDGE_LOOP
+
+
+def _stop_bridge_loop() -> None:
+    """Stop and close the bridge event loop, if it was started; a later run_async() starts a new one."""
+    global _BRIDGE_LOOP, _BRIDGE_THREAD
+    with _BRIDGE_LOCK:
+        loop, thread = _BRIDGE_LOOP, _BRIDGE_THREAD
+        _BRIDGE_LOOP = _BRIDGE_THREAD = None
+    if loop is None:
+        return
+    atexit.unregister(_stop_bridge_loop)
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import nest_asyncio
+        asyncio.run_coroutine_threadsafe(loop.shutdown_asyncgens(), loop).result(timeout=5)
+    except Exception as e:
+        logger.debug("Error shutting down bridge loop async generators: %s", e)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    if not thread.is_alive():
+        loop.close()
 
-            nest_asyncio.apply()
-            return loop.run_until_complete(coro)
-        else:
-            return loop.run_until_complete(coro)
+
+def run_async(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Coroutines are submitted to a single long-lived event loop running in a
+    background thread, so clients and handlers created by one call can be
+    reused by the next instead of being bound to a throwaway loop. Calling it
+    from inside a running event loop blocks that loop until the result is ready.
+    """
+    try:
+        running_loop = asyncio.get_running_loop()
     except RuntimeError:
-        return asyncio.run(coro)
+        running_loop = None
+
+    bridge_loop = _get_bridge_loop()
+    if running_loop is bridge_loop:
+        coro.close()
+        raise RuntimeError("run_async() cannot be called from the bridge event loop thread")
+    return asyncio.run_coroutine_threadsafe(coro, bridge_loop).result()
 
 
 async def main(config_path: str = "odoo_mcp/config/config.dev.yaml"):
@@ -2619,10 +2861,11 @@ async def main(config_path: str = "odoo_mcp/config/config.dev.yaml"):
         logger.info("Starting server initialization...")
 
         # Load configuration
-        logger.info(f"Loading configuration from {config_path}")
+        logger.info(
+            f"Loading configuration from {config_path} (YAML loader: {YAML_LOADER_NAME}, event loop: {EVENT_LOOP_NAME})"
+        )
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
+            config = load_odoo_config(config_path)
             logger.info("Configuration loaded successfully")
             logger.debug(f"Configuration content: {config}")
         except Exception as e:
@@ -2696,8 +2939,8 @@ def main_cli():
     args = parser.parse_args()
 
     try:
-        # Run the async main function
-        asyncio.run(main(args.config))
+        # Run the async main function (on uvloop when installed)
+        _run_event_loop(main(args.config))
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
@@ -4,11 +4,14 @@ This module provides centralized resource management for the MCP server.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Set, Callable
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Pattern, Set, Callable, Tuple
 from urllib.parse import urlparse
 from dataclasses import dataclass
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from odoo_mcp.error_handling.exceptions import ProtocolError
 from odoo_mcp.performance.caching import get_cache_manager, CACHE_TYPE
@@ -52,17 +55,27 @@ class ResourceManager:
     Provides centralized access to resources and handles resource updates.
     """
 
-    def __init__(self, cache_ttl: int = 300):
+    def __init__(self, cache_ttl: int = 300, cache_max_size: int = 4096):
         """
         Initialize the resource manager.
 
         Args:
             cache_ttl: Cache time-to-live in seconds
+            cache_max_size: Maximum number of cached resources
         """
         self._cache_ttl = cache_ttl
+        self._cache_max_size = cache_max_size
         self._resource_handlers: Dict[str, Callable] = {}
+        # All patterns compiled into one alternation, rebuilt lazily after registrations
+        self._handler_regex: Optional[Pattern[str]] = None
+        self._handler_by_group: Dict[str, Callable] = {}
         self._subscribers: Dict[str, Set[Callable]] = {}
-        self._resource_cache: Dict[str, Resource] = {}
+        # Cached resources in LRU order: uri -> (monotonic fetch time, resource)
+        self._resource_cache: "OrderedDict[str, Tuple[float, Resource]]" = OrderedDict()
+        # Bumped on invalidation so fetches started before it do not cache stale data
+        self._cache_generation = 0
+        # In-flight handler calls shared by concurrent requests for the same URI
+        self._inflight: Dict[str, asyncio.Future] = {}
         self._cache_manager = get_cache_manager()
 
     def register_resource_handler(self, uri_pattern: str, handler: Callable) -> None:
@@ -74,6 +87,7 @@ class ResourceManager:
             handler: The handler function
         """
         self._resource_handlers[uri_pattern] = handler
+        self._handler_regex = None
         logger.info(f"Registered resource handler for pattern: {uri_pattern}")
 
     def subscribe_to_resource(self, uri: str, callback: Callable) -> None:
@@ -117,25 +131,57 @@ class ResourceManager:
             ProtocolError: If the resource is not found or cannot be accessed
         """
         # Check cache first
-        if uri in self._resource_cache:
-            cached = self._resource_cache[uri]
-            if cached.last_modified and datetime.now() - cached.last_modified < timedelta(seconds=self._cache_ttl):
-                return cached.to_dict()
+        cached = self._resource_cache.get(uri)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self._cache_ttl:
+                self._resource_cache.move_to_end(uri)
+                return cached[1].to_dict()
+            del self._resource_cache[uri]
 
         # Find appropriate handler
         handler = self._find_handler(uri)
         if not handler:
             raise ProtocolError(f"No handler found for resource: {uri}")
 
+        # Concurrent misses for the same URI wait for one handler call
+        inflight = self._inflight.get(uri)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_resource(uri, handler))
+            self._inflight[uri] = inflight
+            inflight.add_done_callback(lambda done: self._drop_inflight(uri, done))
+        resource = await asyncio.shield(inflight)
+        return resource.to_dict()
+
+    def _drop_inflight(self, uri: str, fetch: asyncio.Future) -> None:
+        """Forget a finished fetch unless an invalidation already replaced it."""
+        if self._inflight.get(uri) is fetch:
+            del self._inflight[uri]
+
+    async def _fetch_resource(self, uri: str, handler: Callable) -> Resource:
+        """
+        Fetch a resource from its handler and cache it.
+
+        Args:
+            uri: The resource URI
+            handler: The handler function
+
+        Returns:
+            Resource: The fetched resource
+
+        Raises:
+            ProtocolError: If the handler fails or returns an invalid resource
+        """
+        generation = self._cache_generation
         try:
             # Get resource from handler
             resource = await handler(uri)
             if not isinstance(resource, Resource):
                 raise ProtocolError(f"Invalid resource returned by handler: {uri}")
 
-            # Cache the resource
-            self._resource_cache[uri] = resource
-            return resource.to_dict()
+            # Cache the resource, unless it was invalidated while the handler ran
+            if generation == self._cache_generation:
+                self._cache_resource(uri, resource)
+            return resource
 
         except Exception as e:
             raise ProtocolError(f"Error getting resource {uri}: {str(e)}")
@@ -162,7 +208,7 @@ class ResourceManager:
                 raise ProtocolError(f"Invalid resource returned by handler: {uri}")
 
             # Update cache
-            self._resource_cache[uri] = resource
+            self._cache_resource(uri, resource)
 
             # Notify subscribers
             await self._notify_subscribers(uri, resource)
@@ -180,38 +226,34 @@ class ResourceManager:
         Returns:
             Optional[Callable]: The handler function if found
         """
+        if self._handler_regex is None:
+            self._compile_handlers()
         parsed = urlparse(uri)
-        for pattern, handler in self._resource_handlers.items():
-            if self._match_pattern(pattern, parsed):
-                return handler
-        return None
+        match = self._handler_regex.fullmatch(f"{parsed.scheme}://{parsed.netloc}{parsed.path}")
+        if match is None:
+            return None
+        return self._handler_by_group[match.lastgroup]
 
-    def _match_pattern(self, pattern: str, parsed: urlparse) -> bool:
+    def _compile_handlers(self) -> None:
         """
-        Match a URI pattern against a parsed URI.
+        Compile every registered pattern into a single regular expression.
 
-        Args:
-            pattern: The URI pattern to match
-            parsed: The parsed URI
-
-        Returns:
-            bool: True if the pattern matches
+        Each pattern becomes one named alternative, in registration order, so
+        one match both finds the handler and keeps first-registered-wins
+        precedence. A ``{param}`` segment matches any single path segment.
         """
-        # Split the full URI into parts
-        pattern_parts = pattern.split("/")
-        uri_parts = f"{parsed.scheme}://{parsed.netloc}{parsed.path}".split("/")
-
-        if len(pattern_parts) != len(uri_parts):
-            return False
-
-        for pattern_part, uri_part in zip(pattern_parts, uri_parts):
-            if pattern_part.startswith("{") and pattern_part.endswith("}"):
-                # This is a parameter, any value is valid
-                continue
-            if pattern_part != uri_part:
-                return False
-
-        return True
+        alternatives = []
+        self._handler_by_group = {}
+        for index, (pattern, handler) in enumerate(self._resource_handlers.items()):
+            segments = [
+                "[^/]*" if part.startswith("{") and part.endswith("}") else re.escape(part)
+                for part in pattern.split("/")
+            ]
+            group = f"h{index}"
+            alternatives.append(f"(?P<{group}>{'/'.join(segments)})")
+            self._handler_by_group[group] = handler
+        # An empty alternation would match the empty string, so use a never-matching pattern instead
+        self._handler_regex = re.compile("|".join(alternatives) if alternatives else "(?!)")
 
     async def _notify_subscribers(self, uri: str, resource: Resource) -> None:
         """
@@ -228,7 +270,37 @@ class ResourceManager:
                 except Exception as e:
                     logger.error(f"Error notifying subscriber for {uri}: {e}")
 
+    def _cache_resource(self, uri: str, resource: Resource) -> None:
+        """
+        Store a resource in the cache, evicting the least recently used entries.
+
+        Args:
+            uri: The resource URI
+            resource: The resource to cache
+        """
+        self._resource_cache[uri] = (time.monotonic(), resource)
+        self._resource_cache.move_to_end(uri)
+        while len(self._resource_cache) > self._cache_max_size:
+            self._resource_cache.popitem(last=False)
+
+    def invalidate_model(self, model: str) -> None:
+        """
+        Drop every cached resource of a model (records, lists and binary fields).
+
+        Args:
+            model: The Odoo model name
+        """
+        self._cache_generation += 1
+        prefix = f"odoo://{model}/"
+        for uri in [uri for uri in self._resource_cache if uri.startswith(prefix)]:
+            del self._resource_cache[uri]
+        # Reads started before the write must not be joined by later ones
+        for uri in [uri for uri in self._inflight if uri.startswith(prefix)]:
+            del self._inflight[uri]
+
     def clear_cache(self) -> None:
         """Clear the resource cache."""
+        self._cache_generation += 1
         self._resource_cache.clear()
+        self._inflight.clear()
         logger.info("Resource cache cleared")
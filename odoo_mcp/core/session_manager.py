@@ -5,6 +5,7 @@ This module provides session management functionality for Odoo API connections.
 
 import logging
 import asyncio
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
@@ -78,9 +79,10 @@ class SessionManager:
         self.pool = pool
         self.session_timeout = timedelta(minutes=config.get("session_timeout_minutes", 120))
         self.max_sessions = config.get("max_sessions", 100)
+        self.max_total_sessions = config.get("max_total_sessions", 10000)
 
-        # Session storage
-        self._sessions: Dict[str, Dict[str, Any]] = {}
+        # Session storage, least recently used first
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._user_sessions: Dict[str, List[str]] = {}
 
         # Initialize cleanup task
@@ -155,12 +157,17 @@ class SessionManager:
 
             # Store session
             self._sessions[session_id] = session
+            self._sessions.move_to_end(session_id)
 
             # Update user sessions
             if username not in self._user_sessions:
                 self._user_sessions[username] = []
             self._user_sessions[username].append(session_id)
 
+            # Enforce the global cap by logging out the least recently used sessions
+            while len(self._sessions) > self.max_total_sessions:
+                await self.logout(next(iter(self._sessions)))
+
             return session
 
         except Exception as e:
@@ -187,6 +194,7 @@ class SessionManager:
 
             # Update session data
             self._sessions[session_id] = session
+            self._sessions.move_to_end(session_id)
             return session
 
         except Exception as e:
@@ -3,9 +3,10 @@ import socket
 import asyncio
 import logging
 import re
+import threading
 from typing import Dict, Any, Optional, List, Union
 
-from odoo_mcp.core.base_handler import BaseOdooHandler, safe_cache_decorator
+from odoo_mcp.core.base_handler import BaseOdooHandler
 from odoo_mcp.error_handling.exceptions import (
     AuthError,
     NetworkError,
@@ -47,6 +48,11 @@ class XMLRPCHandler(BaseOdooHandler):
         
         # Create ServerProxy instances
         self._create_proxies()
+
+        # ServerProxy is not thread-safe: executor threads use each shared proxy one call at a time.
+        # The pool hands a handler to one caller at a time, so this keeps one keep-alive connection per handler
+        self._common_lock = threading.Lock()
+        self._models_lock = threading.Lock()
         
         # Note: Global authentication will be performed on first use
         # to avoid blocking initialization
@@ -67,10 +73,42 @@ class XMLRPCHandler(BaseOdooHandler):
         except Exception as e:
             raise OdooMCPError(f"Unexpected error during XMLRPC proxy creation: {e}", original_exception=e)
 
+    def _call_models_sync(self, method: str, *args: Any) -> Any:
+        """
+        Call an object endpoint method on the handler's persistent proxy, one call at a time.
+
+        The proxy keeps its HTTP(S) connection alive between calls, so repeated
+        execute_kw calls skip TCP/TLS setup.
+        """
+        with self._models_lock:
+            try:
+                return getattr(self.models, method)(*args)
+            except Fault:
+                raise
+            except Exception:
+                # Drop the broken connection; the proxy reconnects on the next call
+                self.models("close")()
+                raise
+
+    def _execute_kw_sync(
+        self, model: str, method: str, args: List, kwargs: Dict, uid: Optional[int], password: Optional[str]
+    ) -> Any:
+        """Run object.execute_kw on the handler's persistent proxy."""
+        return self._call_models_sync("execute_kw", self.database, uid, password, model, method, args, kwargs)
+
+    def _call_common_sync(self, method: str, *args: Any) -> Any:
+        """Call a common endpoint method, serialized on the shared proxy."""
+        with self._common_lock:
+            return getattr(self.common, method)(*args)
+
     async def _perform_authentication(self, username: str, password: str, database: str) -> Union[int, bool, None]:
         """Perform authentication using XML-RPC."""
         try:
-            return self.common.authenticate(database, username, password, {})
+            # The login is a blocking HTTP round trip; keep it off the event loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._call_common_sync, "authenticate", database, username, password, {}
+            )
         except Exception as e:
             logger.error(f"XML-RPC authentication failed: {e}")
             raise AuthError(f"Authentication failed: {e}")
@@ -78,15 +116,13 @@ class XMLRPCHandler(BaseOdooHandler):
     async def call(self, service: str, method: str, args: list) -> Any:
         """Make a direct call to a service method using XML-RPC."""
         try:
+            loop = asyncio.get_running_loop()
             if service == "common":
-                proxy = self.common
+                return await loop.run_in_executor(None, self._call_common_sync, method, *args)
             elif service == "object":
-                proxy = self.models
+                return await loop.run_in_executor(None, self._call_models_sync, method, *args)
             else:
                 raise OdooMCPError(f"Unknown service: {service}")
-            
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, getattr(proxy, method), *args)
         except Exception as e:
             logger.error(f"XML-RPC call failed for {service}.{method}: {e}")
             raise OdooMCPError(f"Call failed: {e}")
@@ -103,34 +139,45 @@ class XMLRPCHandler(BaseOdooHandler):
 
     READ_METHODS = {"read", "search", "search_read", "search_count", "fields_get", "default_get"}
 
-    @safe_cache_decorator
-    async def execute_kw(self, model: str, method: str, args: List = None, kwargs: Dict = None) -> Any:
+    async def execute_kw(
+        self,
+        model: str,
+        method: str,
+        args: List = None,
+        kwargs: Dict = None,
+        uid: Optional[int] = None,
+        password: Optional[str] = None,
+    ) -> Any:
         """
         Execute a method on a model with keyword arguments.
 
+        Accepts the same signature as JSONRPCHandler.execute_kw, so the
+        connection pool can call either handler without type checks.
+
         Args:
             model: Model name
             method: Method name
             args: Positional arguments
             kwargs: Keyword arguments
+            uid: Optional user ID (defaults to the global UID)
+            password: Optional password or API key (defaults to the global password)
 
         Returns:
             Any: Method result
         """
         try:
             # Run the synchronous XML-RPC call in a thread pool
-            loop = asyncio.get_event_loop()
-            proxy = ServerProxy(f"{self.odoo_url}/xmlrpc/2/object")
-            try:
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: proxy.execute_kw(
-                        self.database, self.global_uid, self.global_password, model, method, args or [], kwargs or {}
-                    ),
-                )
-                return result
-            finally:
-                proxy.close()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                self._execute_kw_sync,
+                model,
+                method,
+                args or [],
+                kwargs or {},
+                uid if uid is not None else self.global_uid,
+                password if password is not None else self.global_password,
+            )
         except Fault as e:
             logger.error(f"XML-RPC Fault: {str(e)}")
             # Check if this is a method not found error
@@ -141,7 +141,7 @@ class CacheManager:
 
                 # Check cache
                 if key in cache_instance:
-                    logger.debug(f"Cache hit for {func.__name__}")
+                    logger.debug("Cache hit for %s", func.__name__)
                     return cache_instance[key]
 
                 # Execute function
@@ -149,7 +149,7 @@ class CacheManager:
 
                 # Cache result
                 cache_instance[key] = result
-                logger.debug(f"Cached result for {func.__name__}")
+                logger.debug("Cached result for %s", func.__name__)
 
                 return result
 
@@ -0,0 +1,59 @@
+"""
+Event loop selection for Odoo MCP Server.
+This module uses uvloop (or winloop on Windows) when it is installed and falls back to the default asyncio loop.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Coroutine, TypeVar
+
+_loop_impl = None
+# EVENT_LOOP=asyncio forces the default loop even when uvloop is installed
+if os.environ.get("EVENT_LOOP", "auto").lower() != "asyncio":
+    try:
+        import uvloop as _loop_impl
+    except ImportError:  # pragma: no cover - depends on the environment
+        try:
+            import winloop as _loop_impl
+        except ImportError:
+            _loop_impl = None
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Name of the active event loop implementation, for startup diagnostics
+EVENT_LOOP_NAME = _loop_impl.__name__ if _loop_impl is not None else "asyncio"
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create a new event loop, preferring uvloop/winloop when available.
+
+    Returns:
+        asyncio.AbstractEventLoop: The new event loop
+    """
+    if _loop_impl is not None:
+        return _loop_impl.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a new event loop, like ``asyncio.run``.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    logger.debug("Running event loop: %s", EVENT_LOOP_NAME)
+    if hasattr(asyncio, "Runner"):
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            return runner.run(coro)
+    # Python < 3.11 has no loop_factory; install the policy instead
+    if _loop_impl is not None:
+        asyncio.set_event_loop_policy(_loop_impl.EventLoopPolicy())
+    return asyncio.run(coro)
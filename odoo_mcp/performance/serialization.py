@@ -0,0 +1,171 @@
+"""
+JSON serialization helpers for Odoo MCP Server.
+This module uses orjson when it is installed and falls back to the standard json module.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import xmlrpc.client
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Name of the active JSON backend, for startup diagnostics
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+# Pre-serialized read-only payloads keyed by id(): (payload, encoded_bytes, etag)
+_STATIC_PAYLOADS: "OrderedDict[int, Tuple[Any, bytes, str]]" = OrderedDict()
+_STATIC_PAYLOADS_MAX_SIZE = 64
+
+
+def _default(obj: Any) -> Any:
+    """
+    Encode the non-JSON values Odoo RPC results can carry.
+
+    Args:
+        obj: The value the JSON backend could not serialize
+
+    Returns:
+        Any: A JSON-serializable replacement
+
+    Raises:
+        TypeError: If the value has no known JSON form
+    """
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, xmlrpc.client.DateTime):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        bytes: The JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson is stricter than json (e.g. subclasses, huge ints); let json decide
+            pass
+    return json.dumps(obj, default=_default).encode("utf-8")
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Suitable as the ``dumps`` argument of ``aiohttp.web.json_response``.
+
+    Args:
+        obj: The object to serialize
+        default: Called for objects that cannot otherwise be serialized (e.g. ``str``);
+            dates, decimals and XML-RPC DateTime values are handled by default
+
+    Returns:
+        str: The JSON document
+    """
+    default = default or _default
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, default=default)
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse a JSON document, accepting UTF-8 bytes directly.
+
+    Both backends raise ``json.JSONDecodeError`` (orjson's error subclasses it)
+    on malformed input; the json fallback raises ``UnicodeDecodeError`` for
+    bytes that are not valid UTF-8.
+
+    Args:
+        data: The JSON document
+
+    Returns:
+        Any: The parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def register_static_payload(payload: Any) -> Any:
+    """
+    Serialize a shared, read-only payload once so responses carrying it skip re-encoding.
+
+    The payload must not be mutated afterwards. Payloads that cannot be
+    serialized are returned unchanged and simply not registered.
+
+    Args:
+        payload: The payload to pre-serialize
+
+    Returns:
+        Any: The payload itself
+    """
+    try:
+        encoded = dumps_bytes(payload)
+    except (TypeError, ValueError):
+        return payload
+    etag = '"' + hashlib.blake2b(encoded, digest_size=8).hexdigest() + '"'
+    _STATIC_PAYLOADS[id(payload)] = (payload, encoded, etag)
+    _STATIC_PAYLOADS.move_to_end(id(payload))
+    while len(_STATIC_PAYLOADS) > _STATIC_PAYLOADS_MAX_SIZE:
+        _STATIC_PAYLOADS.popitem(last=False)
+    return payload
+
+
+def static_payload_etag(payload: Any) -> Optional[str]:
+    """
+    Return the HTTP entity tag of a registered static payload.
+
+    Args:
+        payload: The payload, usually the ``result`` of a JSON-RPC response
+
+    Returns:
+        Optional[str]: The quoted ETag, or None if the payload is not registered
+    """
+    entry = _STATIC_PAYLOADS.get(id(payload)) if payload is not None else None
+    if entry is not None and entry[0] is payload:
+        return entry[2]
+    return None
+
+
+def dumps_response_bytes(response: Dict[str, Any]) -> bytes:
+    """
+    Serialize a JSON-RPC response, splicing in pre-serialized results.
+
+    Args:
+        response: The JSON-RPC response dict
+
+    Returns:
+        bytes: The JSON document
+    """
+    if isinstance(response, dict) and len(response) == 3 and response.get("jsonrpc") == "2.0":
+        result = response.get("result")
+        entry = _STATIC_PAYLOADS.get(id(result)) if result is not None else None
+        if entry is not None and entry[0] is result and "id" in response:
+            return b'{"jsonrpc":"2.0","id":' + dumps_bytes(response["id"]) + b',"result":' + entry[1] + b"}"
+    return dumps_bytes(response)
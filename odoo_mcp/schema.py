@@ -147,7 +147,7 @@ class SchemaIntrospector:
         Returns:
             List[str]: List of accessible model names
         """
-        cache_key = f"models:{user_id}"
+        cache_key = f"models:{user_id}:{with_access}"
         user_cache = self._get_user_cache(user_id)
         
         # Check cache first
@@ -245,7 +245,7 @@ def validate_request_data(raw_data: Dict[str, Any]) -> ValidatedRequestDict:
         final_params: Any = raw_params  # Default to raw dict if no specific model
 
         if params_model:
-            logger.debug(f"Validating params for method '{method_name}' using {params_model.__name__}")
+            logger.debug("Validating params for method '%s' using %s", method_name, params_model.__name__)
             # Validate the raw params dict using the specific model
             final_params = params_model.model_validate(raw_params)
         else:
@@ -269,7 +269,7 @@ def validate_request_data(raw_data: Dict[str, Any]) -> ValidatedRequestDict:
             "params": final_params,
         }
 
-        logger.debug(f"Input validation successful for method '{method_name}'.")
+        logger.debug("Input validation successful for method '%s'.", method_name)
         if method_name == "call_odoo" and hasattr(final_params, "model_dump"):
             _d = final_params.model_dump(exclude_none=True)
             _corr_keys = (
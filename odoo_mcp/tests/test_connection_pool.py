@@ -112,17 +112,45 @@ async def test_acquire_release_within_limit(default_config):
 
 async def test_acquire_timeout(default_config):
     """Test timeout when acquiring more connections than pool size."""
-    pool = ConnectionPool(default_config, MockHandler)
+    config = {**default_config, 'connection_timeout': 0.05}
+    pool = ConnectionPool(config, lambda protocol, cfg: MockHandler(cfg))
     # Hold all connections open via context managers
     async with pool.get_connection():
         async with pool.get_connection():
             assert len(pool.connections) == default_config['max_connections']
-            # Try acquiring one more, should time out (no wait loop in current pool, immediate raise)
+            # Try acquiring one more, should time out after waiting connection_timeout
             with pytest.raises(PoolTimeoutError):
                 async with pool.get_connection():
                     pass
     await pool.close()
 
+async def test_acquire_waits_for_released_connection(default_config):
+    """Test that a caller blocked on a full pool gets the next released connection."""
+    pool = ConnectionPool(default_config, lambda protocol, cfg: MockHandler(cfg))
+    release = asyncio.Event()
+
+    async def hold():
+        async with pool.get_connection() as conn:
+            await release.wait()
+            return conn
+
+    holders = [asyncio.create_task(hold()) for _ in range(default_config['max_connections'])]
+    await asyncio.sleep(0)
+
+    async def acquire():
+        async with pool.get_connection() as conn:
+            return conn
+
+    waiter = asyncio.create_task(acquire())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    release.set()
+    held = await asyncio.gather(*holders)
+    assert await asyncio.wait_for(waiter, 1) in held
+    assert len(pool.connections) == default_config['max_connections']
+    await pool.close()
+
 async def test_connection_creation_retry(default_config):
     """Test the retry mechanism when handler initialization fails."""
     MockFailingHandler.reset_attempts()
@@ -166,3 +194,89 @@ async def test_pool_close(default_config):
     assert pool._cleanup_task is None or pool._cleanup_task.done()
 
 # TODO: Add tests for health check logic (requires more sophisticated mocking or integration)
+
+async def test_execute_kw_coalesces_identical_reads(default_config):
+    """Concurrent identical read calls share a single round trip."""
+    pool = ConnectionPool(default_config, MockHandler)
+
+    async def slow_read(*args):
+        await asyncio.sleep(0.01)
+        return [{"id": 1}]
+
+    pool._execute_kw = AsyncMock(side_effect=slow_read)
+
+    first, second = await asyncio.gather(
+        pool.execute_kw("res.partner", "search_read", [[]], {"fields": ["name"]}),
+        pool.execute_kw("res.partner", "search_read", [[]], {"fields": ["name"]}),
+    )
+
+    assert pool._execute_kw.await_count == 1
+    assert first == second == [{"id": 1}]
+    assert first is not second
+    assert not pool._inflight
+
+
+async def test_execute_kw_inflight_key_hides_password(default_config):
+    """In-flight reads are keyed without the plaintext password, and only shared by the same credentials."""
+    pool = ConnectionPool(default_config, MockHandler)
+    keys = []
+
+    async def slow_read(*args):
+        keys.extend(pool._inflight)
+        await asyncio.sleep(0.01)
+        return [{"id": 1}]
+
+    pool._execute_kw = AsyncMock(side_effect=slow_read)
+
+    await asyncio.gather(
+        pool.execute_kw("res.partner", "read", [[1]], {}, uid=2, password="s3cret"),
+        pool.execute_kw("res.partner", "read", [[1]], {}, uid=2, password="other"),
+    )
+
+    assert pool._execute_kw.await_count == 2
+    assert keys and all("s3cret" not in repr(key) for key in keys)
+
+
+async def test_execute_kw_reads_after_a_write_do_not_join_earlier_reads(default_config):
+    """A read issued after a write gets its own round trip instead of pre-write data."""
+    pool = ConnectionPool(default_config, MockHandler)
+    state = {"name": "before"}
+
+    async def execute(model, method, args, kwargs, uid, password):
+        if method == "write":
+            state["name"] = "after"
+            return True
+        snapshot = dict(state)
+        await asyncio.sleep(0.02)
+        return [snapshot]
+
+    pool._execute_kw = AsyncMock(side_effect=execute)
+
+    early = asyncio.ensure_future(pool.execute_kw("res.partner", "read", [[1]], {}))
+    await asyncio.sleep(0.005)
+    await pool.execute_kw("res.partner", "write", [[1], {"name": "after"}], {})
+    late = await pool.execute_kw("res.partner", "read", [[1]], {})
+
+    assert (await early)[0]["name"] == "before"
+    assert late[0]["name"] == "after"
+
+
+async def test_execute_kw_first_caller_cannot_mutate_joined_result(default_config):
+    """The first caller gets a copy too, so mutating it does not leak into the joiners' results."""
+    pool = ConnectionPool(default_config, MockHandler)
+
+    async def slow_read(*args):
+        await asyncio.sleep(0.01)
+        return [{"id": 1}]
+
+    pool._execute_kw = AsyncMock(side_effect=slow_read)
+
+    async def first_caller():
+        result = await pool.execute_kw("res.partner", "read", [[1]], {})
+        result[0]["id"] = 99
+        return result
+
+    first, second = await asyncio.gather(first_caller(), pool.execute_kw("res.partner", "read", [[1]], {}))
+
+    assert first[0]["id"] == 99
+    assert second == [{"id": 1}]
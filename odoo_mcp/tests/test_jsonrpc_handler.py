@@ -8,7 +8,7 @@ from unittest.mock import patch, MagicMock # Import MagicMock if needed later
 from typing import Dict, Any, Optional, Tuple, Union # Import necessary types
 
 # Import the class to test and related exceptions
-from odoo_mcp.core.jsonrpc_handler import JSONRPCHandler
+from odoo_mcp.core.jsonrpc_handler import JSONRPCHandler, _env_config_overrides
 from odoo_mcp.error_handling.exceptions import NetworkError, ProtocolError, ConfigurationError, AuthError
 
 # Mark all tests in this module as asyncio
@@ -47,6 +47,14 @@ async def test_handler_initialization_http(jsonrpc_config):
     assert handler.async_client.timeout.read == 10.0
     await handler.close() # Close the client
 
+async def test_handler_keeps_whole_pool_alive(jsonrpc_config):
+    """Test that every pooled connection to Odoo is kept alive between calls."""
+    with patch('odoo_mcp.core.jsonrpc_handler.httpx.AsyncClient') as mock_client:
+        JSONRPCHandler({**jsonrpc_config, 'username': 'admin', 'api_key': 'secret', 'http_pool_size': 8})
+    limits = mock_client.call_args.kwargs['limits']
+    assert limits.max_connections == 8
+    assert limits.max_keepalive_connections == 8
+
 async def test_handler_initialization_https_defaults(jsonrpc_config_https):
     """Test successful initialization with HTTPS URL and default TLS."""
     # Patch SSLContext to avoid actual file system/network access during init
@@ -125,6 +133,42 @@ async def test_call_direct_success(jsonrpc_config):
 
     await handler.close()
 
+async def test_ensure_authenticated_shares_concurrent_login(jsonrpc_config):
+    """Test that concurrent first calls perform a single login."""
+    jsonrpc_config.update({'username': 'admin', 'api_key': 'secret'})
+    handler = JSONRPCHandler(jsonrpc_config)
+    logins = 0
+
+    async def fake_call(service, method, args):
+        nonlocal logins
+        logins += 1
+        await asyncio.sleep(0.01)
+        return 7
+
+    with patch.object(handler, 'call', side_effect=fake_call):
+        uids = await asyncio.gather(*(handler.ensure_authenticated() for _ in range(5)))
+
+    assert uids == [7] * 5
+    assert logins == 1
+    await handler.close()
+
+async def test_handler_applies_environment_overrides(jsonrpc_config, monkeypatch):
+    """Test that ODOO_* environment variables override the config."""
+    jsonrpc_config.update({'username': 'admin', 'api_key': 'secret'})
+    monkeypatch.setenv('ODOO_DB', 'env_db')
+    monkeypatch.setenv('ODOO_USER', 'env_user')
+    _env_config_overrides.cache_clear()
+    try:
+        handler = JSONRPCHandler(jsonrpc_config)
+        assert handler.database == 'env_db'
+        assert handler.username == 'env_user'
+        assert handler.password == 'secret'
+        await handler.close()
+    finally:
+        monkeypatch.delenv('ODOO_DB')
+        monkeypatch.delenv('ODOO_USER')
+        _env_config_overrides.cache_clear()
+
 # TODO: Add more tests:
 # - test_call_direct_http_error (4xx, 5xx)
 # - test_call_direct_jsonrpc_error
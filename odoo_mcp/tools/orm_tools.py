@@ -53,7 +53,9 @@ class ORMTools:
         self.schema_introspector = SchemaIntrospector(connection_pool, config)
         self.domain_validator = DomainValidator(self.schema_introspector)
         self.actions_registry = ActionsRegistry(config)
-        self.action_discoverer = ActionDiscoverer(connection_pool, self.actions_registry)
+        self.action_discoverer = ActionDiscoverer(
+            connection_pool, self.actions_registry, config.get("models_cache_ttl", 300)
+        )
         self.picklist_provider = PicklistProvider(connection_pool)
         
         # Initialize security components
@@ -62,27 +64,41 @@ class ORMTools:
         self.rate_limiter = RateLimiter(self.security_config)
         self.audit_logger = AuditLogger(self.security_config)
 
+        # Global UID resolved from the pool; the pool's handlers all share one protocol and login
+        self._global_uid: Optional[int] = None
+        self._uid_attr: Optional[str] = None
+
     async def _get_global_uid(self) -> int:
         """
         Get the global UID from the connection pool.
         
+        The UID attribute is resolved once per handler type and the UID itself
+        is cached once authenticated, so later calls skip the pool checkout.
+        
         Returns:
             int: Global UID for authentication
         """
+        if self._global_uid is not None:
+            return self._global_uid
         try:
             # Get a connection from the pool to access the global UID
             async with self.pool.get_connection() as connection:
-                if hasattr(connection, 'global_uid'):
-                    # XMLRPC handler
-                    return connection.global_uid
-                elif hasattr(connection, 'uid'):
-                    # JSONRPC handler
-                    return connection.uid
-                else:
-                    raise Exception("No global UID found in connection")
+                if self._uid_attr is None:
+                    if hasattr(connection, 'global_uid'):
+                        # XMLRPC handler
+                        self._uid_attr = 'global_uid'
+                    elif hasattr(connection, 'uid'):
+                        # JSONRPC handler
+                        self._uid_attr = 'uid'
+                    else:
+                        raise Exception("No global UID found in connection")
+                uid = getattr(connection, self._uid_attr)
         except Exception as e:
             logger.error(f"Error getting global UID: {e}")
             raise
+        if uid:
+            self._global_uid = uid
+        return uid
 
     async def schema_version(self) -> Dict[str, str]:
         """
@@ -91,7 +107,7 @@ class ORMTools:
         Returns:
             Dict with version information
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Get global UID from connection pool
@@ -99,7 +115,7 @@ class ORMTools:
             version_info = await self.schema_introspector.get_schema_version(global_uid)
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="schema_version",
                 user_id=global_uid,
@@ -117,7 +133,7 @@ class ORMTools:
                 user_id=None,
                 model="ir.model",
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
 
@@ -131,7 +147,7 @@ class ORMTools:
         Returns:
             Dict with list of accessible models
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Get global UID from connection pool
@@ -139,7 +155,7 @@ class ORMTools:
             models = await self.schema_introspector.list_models(global_uid, with_access=with_access)
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="schema_models",
                 user_id=global_uid,
@@ -157,7 +173,7 @@ class ORMTools:
                 user_id=None,
                 model="ir.model",
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
 
@@ -171,7 +187,7 @@ class ORMTools:
         Returns:
             Dict with field information
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Get global UID from connection pool
@@ -179,9 +195,8 @@ class ORMTools:
             fields = await self.schema_introspector.list_fields(global_uid, model)
             
             # Convert to list format for response
-            fields_list = []
-            for field_name, field_info in fields.items():
-                fields_list.append({
+            fields_list = [
+                {
                     "name": field_info.name,
                     "ttype": field_info.ttype,
                     "required": field_info.required,
@@ -192,10 +207,12 @@ class ORMTools:
                     "store": field_info.store,
                     "compute": field_info.compute,
                     "writeable": field_info.writeable
-                })
+                }
+                for field_info in fields.values()
+            ]
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="schema_fields",
                 user_id=global_uid,
@@ -213,7 +230,7 @@ class ORMTools:
                 user_id=None,
                 model=model,
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
 
@@ -232,7 +249,7 @@ class ORMTools:
         Returns:
             DomainValidationResponse: Validation result
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Get global UID from connection pool
@@ -249,7 +266,7 @@ class ORMTools:
             result = await self.domain_validator.validate_domain(model, domain_json, global_uid)
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="domain_validate",
                 user_id=global_uid,
@@ -270,7 +287,7 @@ class ORMTools:
                 model=model,
                 domain=domain_json,
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
 
@@ -299,7 +316,7 @@ class ORMTools:
         Returns:
             Dict with search results
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Check rate limit
@@ -348,7 +365,7 @@ class ORMTools:
                 result = masked_result
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="search_read",
                 user_id=user_id,
@@ -372,7 +389,7 @@ class ORMTools:
                 model=model,
                 domain=domain_json,
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
 
@@ -397,7 +414,7 @@ class ORMTools:
         Returns:
             Dict with search results
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Check rate limit
@@ -416,7 +433,7 @@ class ORMTools:
             )
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="name_search",
                 user_id=user_id,
@@ -437,7 +454,7 @@ class ORMTools:
                 user_id=user_id,
                 model=model,
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
 
@@ -460,7 +477,7 @@ class ORMTools:
         Returns:
             Dict with read results
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Check rate limit
@@ -492,7 +509,7 @@ class ORMTools:
                 result = masked_result
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="read",
                 user_id=user_id,
@@ -515,7 +532,7 @@ class ORMTools:
                 model=model,
                 record_ids=record_ids,
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
 
@@ -538,7 +555,7 @@ class ORMTools:
         Returns:
             Dict with creation result
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Check rate limit
@@ -547,10 +564,11 @@ class ORMTools:
             
             # Validate required fields
             fields_info = await self.schema_introspector.list_fields(user_id, model)
-            missing_fields = []
-            for field_name, field_info in fields_info.items():
-                if field_info.required and field_name not in values:
-                    missing_fields.append(field_name)
+            missing_fields = [
+                field_name
+                for field_name, field_info in fields_info.items()
+                if field_info.required and field_name not in values
+            ]
             
             if missing_fields:
                 raise Exception(f"Missing required fields: {', '.join(missing_fields)}")
@@ -563,7 +581,7 @@ class ORMTools:
             )
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="create",
                 user_id=user_id,
@@ -586,7 +604,7 @@ class ORMTools:
                 model=model,
                 values=values,
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
 
@@ -611,7 +629,7 @@ class ORMTools:
         Returns:
             Dict with write result
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Check rate limit
@@ -630,7 +648,7 @@ class ORMTools:
             )
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="write",
                 user_id=user_id,
@@ -655,7 +673,7 @@ class ORMTools:
                 record_ids=record_ids,
                 values=values,
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
 
@@ -676,7 +694,7 @@ class ORMTools:
         Returns:
             NextStepsResponse: Next steps information
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Check rate limit
@@ -686,7 +704,7 @@ class ORMTools:
             result = await self.action_discoverer.get_next_steps(model, record_id, user_id)
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="actions_next_steps",
                 user_id=user_id,
@@ -706,7 +724,7 @@ class ORMTools:
                 model=model,
                 record_ids=[record_id],
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
 
@@ -733,7 +751,7 @@ class ORMTools:
         Returns:
             ActionCallResponse: Action call result
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Check rate limit
@@ -745,7 +763,7 @@ class ORMTools:
             )
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="actions_call",
                 user_id=user_id,
@@ -768,7 +786,7 @@ class ORMTools:
                 record_ids=[record_id],
                 values={"method": method, "parameters": parameters},
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
 
@@ -791,7 +809,7 @@ class ORMTools:
         Returns:
             Dict with picklist values
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Check rate limit
@@ -804,7 +822,7 @@ class ORMTools:
             result = await self.picklist_provider.get_picklist_values(model, field, user_id, limit)
             
             # Audit log
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
             self.audit_logger.log_operation(
                 operation="picklists",
                 user_id=user_id,
@@ -825,6 +843,6 @@ class ORMTools:
                 user_id=user_id,
                 model=model,
                 error=str(e),
-                latency_ms=(time.time() - start_time) * 1000
+                latency_ms=(time.perf_counter() - start_time) * 1000
             )
             raise
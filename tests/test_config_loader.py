@@ -0,0 +1,175 @@
+import os
+
+import pytest
+
+from odoo_mcp.core import config_loader
+from odoo_mcp.core.config_loader import clear_config_cache, load_odoo_config
+
+
+@pytest.fixture(autouse=True)
+def _clean_config_cache():
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+def test_load_odoo_config_reuses_parsed_file(tmp_path, monkeypatch):
+    path = tmp_path / "config.yaml"
+    path.write_text("odoo_url: http://odoo.local\ndatabase: test_db\n")
+
+    first = load_odoo_config(str(path))
+    monkeypatch.setattr(config_loader, "_parse_config_file", lambda _: pytest.fail("config parsed twice"))
+    second = load_odoo_config(str(path))
+
+    assert first == second == {"odoo_url": "http://odoo.local", "database": "test_db"}
+
+
+def test_load_odoo_config_returns_private_copy(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("http:\n  port: 8080\nallowed_models:\n  - res.partner\n")
+
+    config = load_odoo_config(str(path))
+    config["http"]["port"] = 9999
+    config["allowed_models"].append("res.users")
+
+    assert load_odoo_config(str(path)) == {"http": {"port": 8080}, "allowed_models": ["res.partner"]}
+
+
+def test_load_odoo_config_reloads_modified_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("database: first\n")
+    assert load_odoo_config(str(path))["database"] == "first"
+
+    path.write_text("database: second_db\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_odoo_config(str(path))["database"] == "second_db"
+
+
+def test_load_odoo_config_uses_json_sidecar(tmp_path, monkeypatch):
+    path = tmp_path / "config.yaml"
+    path.write_text("database: test_db\nhttp:\n  port: 8080\n")
+
+    load_odoo_config(str(path))
+    assert (tmp_path / "config.yaml.cache.json").exists()
+
+    clear_config_cache()
+    monkeypatch.setattr(config_loader, "_parse_config_file", lambda _: pytest.fail("YAML parsed despite sidecar"))
+    assert load_odoo_config(str(path)) == {"database": "test_db", "http": {"port": 8080}}
+
+
+def test_load_odoo_config_falls_back_to_user_cache_sidecar(tmp_path, monkeypatch):
+    config_dir = tmp_path / "etc"
+    config_dir.mkdir()
+    path = config_dir / "config.yaml"
+    path.write_text("database: test_db\n")
+    # A directory in the way makes the local sidecar unwritable
+    (config_dir / "config.yaml.cache.json").mkdir()
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    load_odoo_config(str(path))
+    assert len(list((tmp_path / "cache" / "odoo_mcp").glob("*.cache.json"))) == 1
+
+    clear_config_cache()
+    monkeypatch.setattr(config_loader, "_parse_config_file", lambda _: pytest.fail("YAML parsed despite sidecar"))
+    assert load_odoo_config(str(path)) == {"database": "test_db"}
+
+
+def test_load_odoo_config_sidecar_can_be_disabled(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("yaml_cache: false\n")
+
+    load_odoo_config(str(path))
+
+    assert not (tmp_path / "config.yaml.cache.json").exists()
+
+
+def test_load_odoo_config_disabling_sidecar_removes_existing_one(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("database: first\n")
+    load_odoo_config(str(path))
+    sidecar = tmp_path / "config.yaml.cache.json"
+    assert sidecar.exists()
+
+    clear_config_cache()
+    path.write_text("database: second\nyaml_cache: false\n")
+
+    assert load_odoo_config(str(path))["database"] == "second"
+    assert not sidecar.exists()
+
+
+def test_load_odoo_config_ignores_sidecar_of_another_file_version(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("database: first_db\n")
+    load_odoo_config(str(path))
+    sidecar_stat = (tmp_path / "config.yaml.cache.json").stat()
+
+    clear_config_cache()
+    # A restore can leave the file older than its sidecar even though the contents changed
+    path.write_text("database: restored\n")
+    os.utime(path, ns=(sidecar_stat.st_atime_ns, sidecar_stat.st_mtime_ns - 1_000_000_000))
+
+    assert load_odoo_config(str(path))["database"] == "restored"
+
+
+def test_load_odoo_config_reads_json_files(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text('{"protocol": "jsonrpc", "http": {"port": 8080}}')
+
+    assert load_odoo_config(str(path)) == {"protocol": "jsonrpc", "http": {"port": 8080}}
+    assert not (tmp_path / "config.json.cache.json").exists()
+
+
+def test_load_odoo_config_keeps_touched_but_unchanged_file(tmp_path, monkeypatch):
+    path = tmp_path / "config.yaml"
+    path.write_text("database: test_db\n")
+    load_odoo_config(str(path))
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    monkeypatch.setattr(config_loader, "_parse_config_file", lambda _: pytest.fail("unchanged config parsed again"))
+
+    assert load_odoo_config(str(path)) == {"database": "test_db"}
+
+
+def test_load_odoo_config_reads_the_yaml_file_once_per_parse(tmp_path, monkeypatch):
+    path = tmp_path / "config.yaml"
+    path.write_text("database: test_db\n")
+    opened = []
+
+    def counting_open(file, *args, **kwargs):
+        opened.append(os.fspath(file))
+        return open(file, *args, **kwargs)
+
+    monkeypatch.setattr(config_loader, "open", counting_open, raising=False)
+    load_odoo_config(str(path))
+
+    assert opened.count(str(path)) == 1
+
+
+def test_load_odoo_config_sidecar_hit_skips_hashing_but_sees_same_size_edits(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("database: first\n")
+    load_odoo_config(str(path))
+    clear_config_cache()
+
+    assert load_odoo_config(str(path))["database"] == "first"
+    assert config_loader._CONFIG_CACHE[str(path)][2] is None
+
+    path.write_text("database: other\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_odoo_config(str(path))["database"] == "other"
+
+
+def test_load_odoo_config_ignores_sidecar_with_unknown_layout(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("database: test_db\n")
+    sidecar = tmp_path / "config.yaml.cache.json"
+    sidecar.write_text('{"database": "stale_db"}')
+    stat = path.stat()
+    os.utime(sidecar, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_odoo_config(str(path)) == {"database": "test_db"}
@@ -1,10 +1,13 @@
+import asyncio
 import json
+import threading
 from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
 
-from odoo_mcp.core.mcp_server import OdooMCPServer
+from odoo_mcp.core.capabilities_manager import ResourceTemplate, ResourceType, Tool
+from odoo_mcp.core.mcp_server import JsonRpcRequest, OdooMCPServer, StreamableHTTPProtocol, _stop_bridge_loop, run_async
 from odoo_mcp.error_handling.exceptions import ProtocolError
 
 
@@ -84,6 +87,61 @@ async def test_get_resource_odoo_instance_info(server):
     assert "password" not in result["content"]
 
 
+@pytest.mark.asyncio
+async def test_get_resource_parses_record_and_binary_uris(server):
+    server.pool.execute_kw = AsyncMock(return_value=[{"id": 7, "name": "Azure", "image_1920": "aGk="}])
+
+    record = await server.get_resource("odoo://res.partner/7")
+    binary = await server.get_resource("odoo://res.partner/binary/image_1920/7")
+
+    assert record["content"]["name"] == "Azure"
+    assert binary["content"] == "aGk="
+    server.pool.execute_kw.assert_any_await(model="res.partner", method="read", args=[[7]], kwargs={})
+    server.pool.execute_kw.assert_any_await(model="res.partner", method="read", args=[[7], ["image_1920"]], kwargs={})
+    with pytest.raises(Exception, match="Invalid record ID"):
+        await server.get_resource("odoo://res.partner/abc")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_record_reads_share_one_round_trip(server):
+    server.pool.execute_kw = AsyncMock(return_value=[{"id": 1, "name": "A"}, {"id": 2, "name": "B"}])
+
+    first, second, again = await asyncio.gather(
+        server._handle_odoo_record("odoo://res.partner/1"),
+        server._handle_odoo_record("odoo://res.partner/2"),
+        server._handle_odoo_record("odoo://res.partner/1"),
+    )
+
+    server.pool.execute_kw.assert_awaited_once_with(model="res.partner", method="read", args=[[1, 2]], kwargs={})
+    assert (first.content["name"], second.content["name"], again.content["name"]) == ("A", "B", "A")
+
+
+@pytest.mark.asyncio
+async def test_record_reads_fail_instead_of_hanging_when_the_flush_breaks(server):
+    # A non-list result breaks the flush itself, outside its error handling
+    server.pool.execute_kw = AsyncMock(return_value=None)
+
+    reads = asyncio.gather(
+        server._read_record("res.partner", 1), server._read_record("res.partner", 2), return_exceptions=True
+    )
+    results = await asyncio.wait_for(reads, timeout=1)
+
+    assert all(isinstance(result, TypeError) for result in results)
+    assert not server._record_read_tasks
+
+
+@pytest.mark.asyncio
+async def test_read_resource_can_skip_text_copy_of_structured_content(server):
+    uri = "odoo://instance/info"
+    default = await server._handle_get_resource(JsonRpcRequest(id=1, method="resources/read", params={"uri": uri}))
+    params = {"uri": uri, "_meta": {"include_text": False}}
+    lean = await server._handle_get_resource(JsonRpcRequest(id=2, method="resources/read", params=params))
+
+    assert json.loads(default["result"]["contents"][0]["text"]) == default["result"]["contents"][0]["content"]
+    assert lean["result"]["contents"][0]["text"] is None
+    assert lean["result"]["contents"][0]["content"] == default["result"]["contents"][0]["content"]
+
+
 @pytest.mark.asyncio
 async def test_list_prompts_includes_registered_prompt_set(server):
     prompts = await server.list_prompts()
@@ -189,3 +247,341 @@ async def test_process_request_call_tool_search_read_returns_json_content(server
     parsed = json.loads(content[0]["text"])
     assert parsed[0]["id"] == 1
     assert parsed[0]["name"] == "Test Record"
+
+
+@pytest.mark.asyncio
+async def test_read_only_tool_results_are_cached_until_a_write(server):
+    server.pool.execute_kw = AsyncMock(return_value=[{"id": 1, "name": "A"}])
+
+    def call(name, arguments, request_id):
+        params = {"name": name, "arguments": arguments}
+        return server.process_request({"jsonrpc": "2.0", "method": "tools/call", "params": params, "id": request_id})
+
+    read = {"model": "res.partner", "ids": [1], "fields": ["name"]}
+    first = await call("odoo_read", read, 1)
+    second = await call("odoo_read", read, 2)
+    assert second["result"] == first["result"]
+    assert server.pool.execute_kw.await_count == 1
+
+    other = {"model": "sale.order", "ids": [1], "fields": ["state"]}
+    await call("odoo_read", other, 3)
+    await call("odoo_write", {"model": "res.partner", "ids": [1], "values": {"name": "B"}}, 4)
+    await call("odoo_read", read, 5)
+    await call("odoo_read", other, 6)
+    assert server.pool.execute_kw.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_audited_orm_tools_are_never_served_from_cache(server):
+    server.orm_tools.read = AsyncMock(return_value={"records": [{"id": 1}]})
+    params = {"name": "odoo.read", "arguments": {"model": "res.partner", "record_ids": [1], "fields": ["name"]}}
+
+    for request_id in (1, 2):
+        await server.process_request({"jsonrpc": "2.0", "method": "tools/call", "params": params, "id": request_id})
+
+    assert server.orm_tools.read.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_kw_tool_passes_search_kwargs(server):
+    server.pool.execute_kw = AsyncMock(return_value=[7, 8])
+    request = {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {
+            "name": "odoo_execute_kw",
+            "arguments": {
+                "model": "res.partner",
+                "method": "search",
+                "args": [[["is_company", "=", True]]],
+                "kwargs": {"limit": 2, "bogus": 1},
+            },
+        },
+        "id": 3,
+    }
+
+    response = await server.process_request(request)
+
+    assert [item["text"] for item in response["result"]["content"]] == ["7", "8"]
+    server.pool.execute_kw.assert_awaited_once_with(
+        model="res.partner", method="search", args=[[["is_company", "=", True]]], kwargs={"limit": 2}
+    )
+
+
+@pytest.mark.asyncio
+async def test_configure_executor_runs_blocking_calls_on_server_threads(server):
+    server.config["executor_max_workers"] = 2
+    server._configure_executor()
+
+    name = await asyncio.get_running_loop().run_in_executor(None, lambda: threading.current_thread().name)
+
+    assert name.startswith("odoo-mcp")
+
+
+@pytest.mark.asyncio
+async def test_ping_returns_empty_result(server):
+    response = await server.process_request({"jsonrpc": "2.0", "method": "ping", "id": 5})
+
+    assert response == {"jsonrpc": "2.0", "id": 5, "result": {}}
+
+
+@pytest.mark.asyncio
+async def test_process_request_skips_notifications_and_rejects_non_objects(server, monkeypatch):
+    dispatch = AsyncMock()
+    monkeypatch.setattr(server, "_process_standard_request", dispatch)
+
+    assert await server.process_request({"jsonrpc": "2.0", "method": "notifications/initialized"}) is None
+    assert (await server.process_request("not a request"))["error"]["code"] == -32600
+    dispatch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_notifications_are_handled_alike_alone_and_in_a_batch(server, monkeypatch):
+    dispatch = AsyncMock(return_value={"jsonrpc": "2.0", "id": None, "result": {}})
+    monkeypatch.setattr(server, "_process_standard_request", dispatch)
+    notification = {"jsonrpc": "2.0", "method": "ping"}
+
+    assert await server.process_request(notification) is None
+    assert await server.process_request([notification]) is None
+    assert dispatch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_process_request_handles_batches(server):
+    batch = [
+        {"jsonrpc": "2.0", "method": "tools/list", "params": {}, "id": 1},
+        {"jsonrpc": "2.0", "method": "notifications/initialized", "params": {}},
+        {"jsonrpc": "2.0", "method": "unknown/method", "params": {}, "id": 2},
+        "not a request",
+    ]
+
+    responses = await server.process_request(batch)
+
+    assert [response["id"] for response in responses] == [1, 2, None]
+    assert "tools" in responses[0]["result"]
+    assert "error" in responses[1]
+    assert responses[2]["error"]["code"] == -32600
+    assert await server.process_request([batch[1]]) is None
+    assert (await server.process_request([]))["error"]["code"] == -32600
+
+
+@pytest.mark.asyncio
+async def test_batch_reads_of_same_model_share_one_round_trip(server):
+    def read_call(request_id, ids, model="res.partner"):
+        arguments = {"model": model, "ids": ids, "fields": ["name"]}
+        params = {"name": "odoo_read", "arguments": arguments}
+        return {"jsonrpc": "2.0", "method": "tools/call", "params": params, "id": request_id}
+
+    server.pool.execute_kw = AsyncMock(return_value=[{"id": 1, "name": "A"}, {"id": 2, "name": "B"}])
+    batch = [read_call(1, [2]), read_call(2, [1, 2]), read_call(3, [5], model="res.users")]
+
+    responses = await server.process_request(batch)
+
+    assert server.pool.execute_kw.await_count == 2
+    server.pool.execute_kw.assert_any_await(model="res.partner", method="read", args=[[2, 1], ["name"]], kwargs={})
+    assert [response["id"] for response in responses] == [1, 2, 3]
+    assert [json.loads(item["text"]) for item in responses[0]["result"]["content"]] == [{"id": 2, "name": "B"}]
+    assert len(responses[1]["result"]["content"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_list_resource_templates_payload_refreshes_after_registration(server):
+    request = JsonRpcRequest(id=1, method="list_resource_templates", params={})
+    first = await server._handle_list_resource_templates(request)
+    again = await server._handle_list_resource_templates(request)
+    assert again["result"] is first["result"]
+
+    server.capabilities_manager.register_resource(
+        ResourceTemplate(
+            name="sale.order",
+            type=ResourceType.MODEL,
+            description="Sales orders",
+            operations=["read"],
+            parameters={"uri_template": "odoo://sale.order/{id}"},
+        )
+    )
+    refreshed = await server._handle_list_resource_templates(request)
+
+    uris = {template["uriTemplate"] for template in refreshed["result"]["resourceTemplates"]}
+    assert "odoo://sale.order/{id}" in uris
+
+
+@pytest.mark.asyncio
+async def test_list_tools_payload_refreshes_after_registration(server):
+    request = JsonRpcRequest(id=1, method="tools/list", params={})
+    first = await server._handle_list_tools(request)
+    again = await server._handle_list_tools(request)
+    assert again["result"] is first["result"]
+
+    server.capabilities_manager.register_tool(
+        Tool(name="odoo_ping", description="Ping the Odoo server", operations=["ping"], parameters={})
+    )
+    refreshed = await server._handle_list_tools(request)
+
+    assert "odoo_ping" in {tool["name"] for tool in refreshed["result"]["tools"]}
+
+
+@pytest.mark.asyncio
+async def test_list_resources_reuses_model_listing_within_ttl(server):
+    server.pool.execute_kw = AsyncMock(return_value=[{"model": "res.partner", "name": "Contact"}])
+    template = ResourceTemplate(
+        name="list",
+        type=ResourceType.LIST,
+        description="Model lists",
+        operations=["read"],
+        parameters={"uri_template": "odoo://{model}/list"},
+    )
+
+    first = await server.list_resources(template)
+    second = await server.list_resources(template)
+
+    assert [resource.uri for resource in first] == [resource.uri for resource in second] == ["odoo://res.partner/list"]
+    server.pool.execute_kw.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_http_protocol_awaits_server_request_handler(server):
+    protocol = StreamableHTTPProtocol(server._handle_request, {})
+    request = AsyncMock()
+    request.read.return_value = b'{"jsonrpc": "2.0", "method": "ping", "id": 5}'
+
+    response = await protocol._handle_request(request)
+
+    assert response.status == 200
+    assert json.loads(response.body) == {"jsonrpc": "2.0", "id": 5, "result": {}}
+    request.read.return_value = b'[{"jsonrpc": "2.0", "method": "notifications/initialized"}]'
+    assert (await protocol._handle_request(request)).status == 202
+
+
+@pytest.mark.asyncio
+async def test_sse_publish_is_bounded_per_session():
+    protocol = StreamableHTTPProtocol(AsyncMock(), {"sse_queue_maxsize": 1})
+    assert protocol.register_sse_session("client") == "client"
+
+    assert protocol.publish("client", {"id": 1}) is True
+    assert protocol.publish("client", {"id": 2}) is False
+    assert protocol.publish("unknown", {"id": 3}) is False
+    assert json.loads(protocol._sse_queues["client"].get_nowait()) == {"id": 1}
+
+    protocol.unregister_sse_session("client")
+    assert protocol.publish("client", {"id": 4}) is False
+
+
+@pytest.mark.asyncio
+async def test_sse_session_survives_client_disconnect():
+    from aiohttp.test_utils import TestClient, TestServer
+
+    protocol = StreamableHTTPProtocol(AsyncMock(), {"sse_heartbeat_seconds": 0.05})
+    protocol.running = True
+    client = TestClient(TestServer(protocol.app))
+    await client.start_server()
+    try:
+        first = await client.get("/sse")
+        session_id = first.headers["Mcp-Session-Id"]
+        first.close()
+        # Give the handler a few heartbeats to notice the disconnect and exit
+        await asyncio.sleep(0.3)
+
+        assert protocol.publish(session_id, {"id": 1}) is True
+        second = await client.get("/sse", headers={"Mcp-Session-Id": session_id})
+        assert second.status == 200
+        event, data = (await second.content.readuntil(b"\n\n")).split(b"\n", 1)
+        assert event == b"event: message"
+        assert json.loads(data[len(b"data: ") :]) == {"id": 1}
+        second.close()
+    finally:
+        protocol.running = False
+        await client.close()
+
+
+def test_sse_sessions_without_a_reader_expire():
+    protocol = StreamableHTTPProtocol(AsyncMock(), {"sse_session_ttl": 60})
+    protocol.register_sse_session("stale")
+    protocol._sse_last_seen["stale"] -= 61
+
+    protocol.register_sse_session("fresh")
+
+    assert set(protocol._sse_queues) == {"fresh"}
+    assert protocol.publish("stale", {"id": 1}) is False
+
+
+class _RecordingWriter:
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        pass
+
+    async def wait_closed(self):
+        pass
+
+
+async def _raw_http_post(server, payload, headers=b""):
+    body = json.dumps(payload).encode()
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"POST / HTTP/1.1\r\nContent-Length: %d\r\n%s\r\n%s" % (len(body), headers, body))
+    reader.feed_eof()
+    writer = _RecordingWriter()
+    await server._handle_http_connection(reader, writer)
+    return writer.data
+
+
+@pytest.mark.asyncio
+async def test_raw_http_not_modified_has_no_content_headers(server):
+    request = {"jsonrpc": "2.0", "method": "tools/list", "id": 1}
+    head = (await _raw_http_post(server, request)).split(b"\r\n\r\n", 1)[0]
+    etag = next(line for line in head.split(b"\r\n") if line.startswith(b"ETag: "))[6:]
+
+    response = await _raw_http_post(server, request, b"If-None-Match: %s\r\n" % etag)
+
+    assert response == b"HTTP/1.1 304 Not Modified\r\nETag: %s\r\n\r\n" % etag
+
+
+@pytest.mark.asyncio
+async def test_raw_http_notification_is_accepted_without_body(server):
+    response = await _raw_http_post(server, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    assert response == b"HTTP/1.1 202 Accepted\r\nContent-Length: 0\r\n\r\n"
+
+
+def test_run_async_reuses_bridge_loop():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    assert run_async(current_loop()) is run_async(current_loop())
+
+
+def test_run_async_restarts_after_bridge_loop_stop():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = run_async(current_loop())
+    _stop_bridge_loop()
+
+    assert first.is_closed()
+    assert run_async(current_loop()) is not first
+
+
+@pytest.mark.asyncio
+async def test_refreshing_capabilities_forgets_models_known_to_action_discovery(server, monkeypatch):
+    discoverer = server.orm_tools.action_discoverer
+    lookup = AsyncMock(return_value=[{"name": "Sales Order"}])
+    monkeypatch.setattr(server.pool, "execute_kw", lookup)
+
+    await discoverer._discover_heuristic_actions("sale.order", {"state": "draft"})
+    await discoverer._discover_heuristic_actions("sale.order", {"state": "draft"})
+    assert lookup.await_count == 1
+
+    server.refresh_capabilities()
+    await discoverer._discover_heuristic_actions("sale.order", {"state": "draft"})
+    assert lookup.await_count == 2
+
+    discoverer._known_models["sale.order"] -= discoverer._models_cache_ttl
+    await discoverer._discover_heuristic_actions("sale.order", {"state": "draft"})
+    assert lookup.await_count == 3
@@ -5,6 +5,7 @@ Tests the unified handler system, factory pattern, and core components.
 
 import asyncio
 import json
+import time
 import pytest
 import httpx
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -198,6 +199,30 @@ class TestXMLRPCHandler:
             assert result == 123
             mock_common.authenticate.assert_called_once_with("db", "user", "pass", {})
     
+    @pytest.mark.asyncio
+    async def test_concurrent_authentications_do_not_share_the_proxy(self, test_config):
+        """Test that concurrent logins use the common proxy one at a time."""
+        with patch('odoo_mcp.core.xmlrpc_handler.ServerProxy') as mock_proxy:
+            active = []
+
+            def authenticate(*args):
+                active.append(1)
+                overlapping = len(active) > 1
+                time.sleep(0.01)
+                active.pop()
+                return -1 if overlapping else 123
+
+            mock_common = MagicMock()
+            mock_common.authenticate.side_effect = authenticate
+            mock_proxy.side_effect = [mock_common, MagicMock()]
+
+            handler = XMLRPCHandler(test_config)
+
+            results = await asyncio.gather(
+                *(handler._perform_authentication("user", "pass", "db") for _ in range(4))
+            )
+            assert results == [123] * 4
+
     @pytest.mark.asyncio
     async def test_authentication_failure(self, test_config):
         """Test authentication failure."""
@@ -223,7 +248,7 @@ class TestXMLRPCHandler:
             
             handler = XMLRPCHandler(test_config)
             
-            with patch('asyncio.get_event_loop') as mock_loop:
+            with patch('asyncio.get_running_loop') as mock_loop:
                 mock_loop.return_value.run_in_executor = AsyncMock(return_value="18.0")
                 
                 result = await handler.call("common", "version", [])
@@ -240,7 +265,7 @@ class TestXMLRPCHandler:
             
             handler = XMLRPCHandler(test_config)
             
-            with patch('asyncio.get_event_loop') as mock_loop:
+            with patch('asyncio.get_running_loop') as mock_loop:
                 mock_loop.return_value.run_in_executor = AsyncMock(
                     return_value=[{"id": 1, "name": "Test"}]
                 )
@@ -437,6 +462,7 @@ class TestConnectionPool:
     async def test_max_connections_limit(self, test_config):
         """Test maximum connections limit."""
         test_config["max_connections"] = 2
+        test_config["connection_timeout"] = 0.05
         with patch('odoo_mcp.core.xmlrpc_handler.ServerProxy'):
             pool = ConnectionPool(test_config, HandlerFactory.create_handler)
             async with pool.get_connection():
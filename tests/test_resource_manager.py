@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from odoo_mcp.core.resource_manager import Resource, ResourceManager
+
+
+def _handler(name):
+    async def handler(uri):
+        return name
+
+    return handler
+
+
+def test_find_handler_keeps_registration_precedence():
+    manager = ResourceManager()
+    record, record_list, binary = _handler("record"), _handler("list"), _handler("binary")
+    manager.register_resource_handler("odoo://{model}/list", record_list)
+    manager.register_resource_handler("odoo://{model}/{id}", record)
+    manager.register_resource_handler("odoo://{model}/binary/{field}/{id}", binary)
+
+    assert manager._find_handler("odoo://res.partner/list") is record_list
+    assert manager._find_handler("odoo://res.partner/7?fields=name") is record
+    assert manager._find_handler("odoo://ir.attachment/binary/datas/3") is binary
+    assert manager._find_handler("odoo://res.partner/7/extra") is None
+    assert manager._find_handler("http://res.partner/7") is None
+
+
+def test_find_handler_sees_later_registrations():
+    manager = ResourceManager()
+    assert manager._find_handler("odoo://instance/info") is None
+
+    info = _handler("info")
+    manager.register_resource_handler("odoo://instance/info", info)
+
+    assert manager._find_handler("odoo://instance/info") is info
+
+
+@pytest.mark.asyncio
+async def test_get_resource_shares_concurrent_handler_call():
+    manager = ResourceManager()
+    calls = 0
+
+    async def handler(uri):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return Resource(uri=uri, type="record", content={"id": 1}, mime_type="application/json")
+
+    manager.register_resource_handler("odoo://{model}/{id}", handler)
+    results = await asyncio.gather(*(manager.get_resource("odoo://res.partner/1") for _ in range(3)))
+
+    assert calls == 1
+    assert [result["content"] for result in results] == [{"id": 1}] * 3
+
+
+@pytest.mark.asyncio
+async def test_get_resource_serves_cache_until_model_is_invalidated():
+    manager = ResourceManager(cache_ttl=300)
+    calls = 0
+
+    async def handler(uri):
+        nonlocal calls
+        calls += 1
+        return Resource(uri=uri, type="record", content={"calls": calls}, mime_type="application/json")
+
+    manager.register_resource_handler("odoo://{model}/{id}", handler)
+    assert (await manager.get_resource("odoo://res.partner/1"))["content"] == {"calls": 1}
+    assert (await manager.get_resource("odoo://res.partner/1"))["content"] == {"calls": 1}
+
+    manager.invalidate_model("res.partner.bank")
+    assert (await manager.get_resource("odoo://res.partner/1"))["content"] == {"calls": 1}
+
+    manager.invalidate_model("res.partner")
+    assert (await manager.get_resource("odoo://res.partner/1"))["content"] == {"calls": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_resource_after_invalidation_does_not_join_earlier_fetch():
+    manager = ResourceManager(cache_ttl=300)
+    calls = 0
+
+    async def handler(uri):
+        nonlocal calls
+        calls += 1
+        seen = calls
+        await asyncio.sleep(0.01)
+        return Resource(uri=uri, type="record", content={"calls": seen}, mime_type="application/json")
+
+    manager.register_resource_handler("odoo://{model}/{id}", handler)
+    early = asyncio.ensure_future(manager.get_resource("odoo://res.partner/1"))
+    await asyncio.sleep(0)
+    manager.invalidate_model("res.partner")
+    late = await manager.get_resource("odoo://res.partner/1")
+
+    assert (await early)["content"] == {"calls": 1}
+    assert late["content"] == {"calls": 2}
+    assert not manager._inflight
+    assert (await manager.get_resource("odoo://res.partner/1"))["content"] == {"calls": 2}
+
+
+@pytest.mark.asyncio
+async def test_resource_cache_expires_and_evicts():
+    manager = ResourceManager(cache_ttl=0, cache_max_size=1)
+
+    async def handler(uri):
+        return Resource(uri=uri, type="record", content=None, mime_type="application/json")
+
+    manager.register_resource_handler("odoo://{model}/{id}", handler)
+    await manager.get_resource("odoo://res.partner/1")
+    await manager.get_resource("odoo://res.partner/2")
+
+    assert list(manager._resource_cache) == ["odoo://res.partner/2"]
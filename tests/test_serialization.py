@@ -0,0 +1,75 @@
+import datetime
+import json
+import xmlrpc.client
+from decimal import Decimal
+
+from odoo_mcp.performance import serialization
+from odoo_mcp.performance.serialization import dumps, dumps_bytes
+
+
+def test_dumps_matches_stdlib_json():
+    payload = {"tools": [{"name": "odoo_search_read", "inputSchema": {"type": "object"}}], "id": 1}
+
+    assert json.loads(dumps(payload)) == payload
+    assert json.loads(dumps_bytes(payload)) == payload
+
+
+def test_dumps_falls_back_without_orjson(monkeypatch):
+    monkeypatch.setattr(serialization, "orjson", None)
+
+    assert dumps_bytes({"a": [1, 2]}) == b'{"a": [1, 2]}'
+    assert dumps({1: "x"}) == '{"1": "x"}'
+
+
+def test_dumps_response_bytes_splices_static_result():
+    result = serialization.register_static_payload({"protocolVersion": "2025-03-26", "capabilities": {}})
+
+    body = serialization.dumps_response_bytes({"jsonrpc": "2.0", "id": 7, "result": result})
+
+    assert json.loads(body) == {"jsonrpc": "2.0", "id": 7, "result": result}
+    unregistered = {"jsonrpc": "2.0", "id": 8, "result": dict(result)}
+    assert json.loads(serialization.dumps_response_bytes(unregistered)) == unregistered
+
+
+def test_static_payload_etag_tracks_encoded_content():
+    first = serialization.register_static_payload({"tools": [{"name": "a"}]})
+    same = serialization.register_static_payload({"tools": [{"name": "a"}]})
+    other = serialization.register_static_payload({"tools": [{"name": "b"}]})
+
+    assert serialization.static_payload_etag(first) == serialization.static_payload_etag(same)
+    assert serialization.static_payload_etag(first) != serialization.static_payload_etag(other)
+    assert serialization.static_payload_etag({"tools": []}) is None
+
+
+def test_loads_accepts_bytes_with_either_backend(monkeypatch):
+    document = '{"params": {"domain": [["name", "=", "Café"]]}}'
+    expected = {"params": {"domain": [["name", "=", "Café"]]}}
+
+    assert serialization.loads(document.encode("utf-8")) == expected
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert serialization.loads(document.encode("utf-8")) == expected
+    assert serialization.loads(document) == expected
+
+
+def test_dumps_applies_default_with_either_backend(monkeypatch):
+    class Stamp:
+        def __str__(self):
+            return "20240101T00:00:00"
+
+    assert json.loads(dumps({"date": Stamp()}, default=str)) == {"date": "20240101T00:00:00"}
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert json.loads(dumps({"date": Stamp()}, default=str)) == {"date": "20240101T00:00:00"}
+
+
+def test_dumps_encodes_odoo_rpc_values_with_either_backend(monkeypatch):
+    payload = {
+        "amount": Decimal("12.5"),
+        "date": datetime.date(2024, 1, 31),
+        "stamp": xmlrpc.client.DateTime("20240131T10:00:00"),
+    }
+    expected = {"amount": 12.5, "date": "2024-01-31", "stamp": "20240131T10:00:00"}
+
+    assert json.loads(dumps_bytes(payload)) == expected
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert json.loads(dumps_bytes(payload)) == expected
+    assert json.loads(dumps(payload)) == expected